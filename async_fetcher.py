@@ -0,0 +1,75 @@
+import asyncio
+import logging
+
+from resilience import RETRY_STATUSES, TransientError, parse_retry_after
+
+
+class AsyncFetcher:
+    """asyncio HTTP backend with pooled keep-alive connections per host"""
+
+    def __init__(self, headers=None, limit=100, limit_per_host=8, timeout=15,
+                 keepalive_timeout=30):
+        self.headers = dict(headers or {})
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout
+        self._session = None
+        self._loop = None
+        self.logger = logging.getLogger(__name__)
+
+    async def _get_session(self):
+        """Create the aiohttp session lazily, bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("The asyncio fetch backend requires aiohttp: pip install aiohttp") from e
+
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            # aiohttp decodes gzip/deflate itself, and brotli when the Brotli package is installed
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                auto_decompress=True
+            )
+            self._loop = loop
+        return self._session
+
+    async def fetch(self, url, headers=None):
+        """Return the decoded response body for url, raising on HTTP errors"""
+        status, body, _ = await self.fetch_response(url, headers)
+        return body
+
+    async def fetch_response(self, url, headers=None):
+        """Return (status, body, headers); 304 Not Modified is returned rather than raised
+
+        Throttling, server errors, timeouts and dropped connections raise
+        TransientError so the caller's retry layer can back off.
+        """
+        import aiohttp
+        session = await self._get_session()
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status in RETRY_STATUSES:
+                    raise TransientError(f"HTTP {response.status} for {url}", response.status,
+                                         parse_retry_after(response.headers.get('Retry-After')))
+                if response.status != 304:
+                    response.raise_for_status()
+                return response.status, await response.read(), response.headers
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise TransientError(f"{type(e).__name__}: {e}") from e
+
+    async def close(self):
+        """Close pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
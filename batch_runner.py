@@ -0,0 +1,176 @@
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+
+from job_scraper import JobScraper
+from job_record import JobBatch
+from response_cache import ResponseCache
+from result_sinks import open_sink
+from run_checkpoint import RunCheckpoint
+from seen_store import SeenStore
+
+
+# Company entry keys that describe the run rather than the JobScraper
+RUN_KEYS = ('name', 'url', 'custom_selectors', 'max_jobs', 'resume')
+
+logger = logging.getLogger(__name__)
+
+# Scrapers kept alive in this worker process, keyed by their options
+_scrapers = {}
+
+
+def load_config(path):
+    """Read a batch config: {"defaults": {...}, "companies": [{"url": ...}, ...], "output": ...}
+
+    A bare list is taken as the companies. Each company may set any JobScraper
+    option plus name, custom_selectors (a dict or a registered selector set
+    name), max_jobs and resume; anything it leaves out comes from defaults.
+    cache, seen_store and checkpoint are given as database paths.
+    """
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    if isinstance(config, list):
+        config = {'companies': config}
+    for company in config.get('companies', []):
+        if not company.get('url'):
+            raise ValueError(f"Company entry without a url in {path}: {company}")
+    return config
+
+
+def close_scrapers():
+    """Close every scraper (and its browsers) this worker opened"""
+    for scraper in _scrapers.values():
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.error(f"Closing scraper failed: {e}")
+        for store in (scraper.cache, scraper.seen_store, scraper.checkpoint):
+            if store is not None:
+                store.close()
+    _scrapers.clear()
+
+
+def get_scraper(options):
+    """This worker's scraper for an option set, created on first use and reused after"""
+    # repr rather than JSON, since run_batch callers may pass objects (a shared cache, a metrics instance)
+    key = repr(sorted(options.items()))
+    scraper = _scrapers.get(key)
+    if scraper is None:
+        options = dict(options)
+        # Stores are given as paths in the config and opened once per worker
+        if isinstance(options.get('cache'), str):
+            options['cache'] = ResponseCache(options['cache'])
+        if isinstance(options.get('seen_store'), str):
+            options['seen_store'] = SeenStore(options['seen_store'])
+        if isinstance(options.get('checkpoint'), str):
+            options['checkpoint'] = RunCheckpoint(options['checkpoint'])
+        # Results travel back to the parent, so the worker doesn't need to keep them
+        options.setdefault('keep_jobs', False)
+        if not _scrapers:
+            # Pool workers skip atexit, but run multiprocessing finalizers
+            Finalize(None, close_scrapers, exitpriority=10)
+        scraper = _scrapers[key] = JobScraper(**options)
+    return scraper
+
+
+def scrape_company(company, defaults):
+    """Scrape one company in a worker; returns its jobs with timing and any error"""
+    settings = {**defaults, **company}
+    options = {key: value for key, value in settings.items() if key not in RUN_KEYS}
+    start = time.perf_counter()
+    result = {'name': settings.get('name') or settings['url'], 'url': settings['url'], 'jobs': [],
+              'error': None, 'pid': os.getpid()}
+    try:
+        scraper = get_scraper(options)
+        result['jobs'] = list(scraper.scrape_jobs(settings['url'], settings.get('custom_selectors'),
+                                                  settings.get('max_jobs', 50),
+                                                  resume=settings.get('resume', False)))
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['elapsed'] = time.perf_counter() - start
+    return result
+
+
+def run_batch(companies, processes=None, output=None, **defaults):
+    """Scrape companies across a process pool and merge their jobs
+
+    Each worker keeps one JobScraper per distinct option set, so browsers and
+    connections are reused between the companies it handles. Jobs are written
+    to output (any open_sink path) as each company finishes. Returns
+    (JobBatch of all jobs, per-company summaries).
+    """
+    processes = max(1, min(processes or os.cpu_count() or 1, len(companies) or 1))
+    sink = open_sink(output) if output else None
+    jobs = JobBatch()
+    summaries = []
+    start = time.perf_counter()
+
+    def collect(result):
+        if result['error']:
+            logger.error(f"{result['name']} failed after {result['elapsed']:.1f}s: {result['error']}")
+        else:
+            logger.info(f"{result['name']}: {len(result['jobs'])} jobs in {result['elapsed']:.1f}s")
+        jobs.extend(result['jobs'])
+        if sink:
+            sink.write_many(result['jobs'])
+        summaries.append({'name': result['name'], 'url': result['url'], 'jobs': len(result['jobs']),
+                          'elapsed': result['elapsed'], 'error': result['error'], 'pid': result['pid']})
+
+    try:
+        if processes == 1:
+            # Inline run, handy for debugging selectors
+            try:
+                for company in companies:
+                    collect(scrape_company(company, defaults))
+            finally:
+                close_scrapers()
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [executor.submit(scrape_company, company, defaults) for company in companies]
+                for future in as_completed(futures):
+                    collect(future.result())
+    finally:
+        if sink:
+            sink.close()
+
+    log_summary(summaries, time.perf_counter() - start, processes)
+    return jobs, summaries
+
+
+def log_summary(summaries, wall, processes):
+    """Per-company table plus how busy the pool was, for sizing it to the machine"""
+    logger.info(f"{'company':<50} {'jobs':>6} {'seconds':>8}  error")
+    for summary in sorted(summaries, key=lambda s: s['elapsed'], reverse=True):
+        logger.info(f"{summary['name'][:50]:<50} {summary['jobs']:>6} {summary['elapsed']:>8.1f}  "
+                    f"{summary['error'] or ''}")
+
+    busy = sum(summary['elapsed'] for summary in summaries)
+    failed = sum(1 for summary in summaries if summary['error'])
+    total_jobs = sum(summary['jobs'] for summary in summaries)
+    # Low utilisation means fewer processes would do; near 100% means more cores would help
+    utilisation = busy / (wall * processes) if wall > 0 else 0
+    logger.info(f"{len(summaries)} companies ({failed} failed), {total_jobs} jobs in {wall:.1f}s "
+                f"with {processes} processes; pool {utilisation:.0%} busy, "
+                f"{busy / max(1, len(summaries)):.1f}s per company")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape many companies' career pages in parallel")
+    parser.add_argument('config', help="JSON file listing companies (see load_config)")
+    parser.add_argument('--processes', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--output', default=None, help="merged output file (.xlsx, .csv, .jsonl, .parquet, .sqlite)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = load_config(args.config)
+    run_batch(config['companies'], processes=args.processes or config.get('processes'),
+              output=args.output or config.get('output', 'all_companies_jobs.xlsx'),
+              **config.get('defaults', {}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import logging
+import re
+import timeit
+
+from job_scraper import JobScraper, WHITESPACE_RE
+from benchmark_parsers import FIXTURE_DIR, load_corpus
+
+
+def build_cases(scraper, soup, url):
+    """Micro-benchmarks for the hot paths of extract_job_data on one parsed page"""
+    selectors = scraper.get_default_selectors()
+    plan = scraper.get_selector_plan(selectors)
+    page_text = soup.get_text()
+    job_data = scraper.parse_job_data(soup, url)
+
+    def legacy_fields():
+        # The per-selector path: one soup.select() per selector
+        scraper.extract_text(soup, selectors['company_name'])
+        scraper.extract_text(soup, selectors['job_title'])
+        scraper.extract_work_location(soup, selectors['work_location'])
+        scraper.extract_text(soup, selectors['job_location'])
+        scraper.extract_experience(soup, selectors['experience'])
+        scraper.extract_long_text(soup, selectors['job_description'])
+        scraper.extract_long_text(soup, selectors['responsibilities'])
+        scraper.extract_long_text(soup, selectors['qualifications'])
+
+    return {
+        'whitespace re.sub (raw pattern)': lambda: re.sub(r'\s+', ' ', page_text),
+        'whitespace sub (compiled)': lambda: WHITESPACE_RE.sub(' ', page_text),
+        'get_default_selectors': scraper.get_default_selectors,
+        'selector plan lookup': lambda: scraper.get_selector_plan(selectors),
+        'fields via per-selector select()': legacy_fields,
+        'fields via compiled plan': lambda: plan.run(soup, scraper),
+        'clean_job_data': lambda: scraper.clean_job_data(dict(job_data)),
+        'parse_job_data': lambda: scraper.parse_job_data(soup, url)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks of extraction hot paths on saved pages")
+    parser.add_argument('--dir', default=FIXTURE_DIR, help="directory of saved .html pages")
+    parser.add_argument('--number', type=int, default=50, help="calls per timing")
+    parser.add_argument('--parser', default='html.parser', help="parser backend to benchmark")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    corpus = load_corpus(args.dir)
+    scraper = JobScraper(parser=args.parser)
+    try:
+        for name, content in corpus.items():
+            soup = scraper.parse_html(content)
+            print(f"\n{name} ({len(content) / 1024:.1f} KB)")
+            for label, func in build_cases(scraper, soup, f"https://example.com/{name}").items():
+                # Best of three runs keeps noise from other processes out
+                best = min(timeit.repeat(func, number=args.number, repeat=3)) / args.number
+                print(f"  {label:<36} {best * 1e6:>10.1f} us")
+    finally:
+        scraper.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import glob
+import logging
+import os
+import time
+
+from job_scraper import JobScraper
+from html_parsers import PARSER_BACKENDS, resolve_backend
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+
+
+def load_corpus(directory=FIXTURE_DIR, large_factor=200):
+    """Read the saved pages, plus a large page built by padding the static detail page"""
+    corpus = {}
+    for path in sorted(glob.glob(os.path.join(directory, '*.html'))):
+        with open(path, 'rb') as f:
+            corpus[os.path.splitext(os.path.basename(path))[0]] = f.read()
+
+    if 'detail_static' in corpus and large_factor:
+        # Big career pages are mostly navigation, footers and related-job widgets
+        widget = b'<div class="related-jobs"><a href="/jobs/1">Related job</a><p>Filler text</p></div>'
+        padding = widget * large_factor
+        corpus['detail_large'] = corpus['detail_static'].replace(b'<footer>', padding + b'<footer>')
+    return corpus
+
+
+def benchmark_backend(backend, corpus, repeat=20):
+    """Mean parse and parse+extract milliseconds per page for one backend"""
+    scraper = JobScraper(parser=backend)
+    results = {}
+    try:
+        for name, content in corpus.items():
+            url = f"https://example.com/{name}"
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                scraper.parse_html(content)
+            parse_ms = (time.perf_counter() - start) / repeat * 1000
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                scraper.parse_job_data(scraper.parse_html(content), url)
+            total_ms = (time.perf_counter() - start) / repeat * 1000
+
+            results[name] = (parse_ms, total_ms)
+    finally:
+        scraper.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare HTML parser backends on the fixture corpus")
+    parser.add_argument('--dir', default=FIXTURE_DIR, help="directory of saved .html pages")
+    parser.add_argument('--repeat', type=int, default=20, help="iterations per page")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    corpus = load_corpus(args.dir)
+    if not corpus:
+        print(f"No .html files found in {args.dir}")
+        return
+
+    print(f"{'backend':<12} {'page':<16} {'KB':>7} {'parse ms':>10} {'parse+extract ms':>18}")
+    print("-" * 67)
+    for backend in PARSER_BACKENDS:
+        if resolve_backend(backend) != backend:
+            print(f"{backend:<12} (not installed, skipped)")
+            continue
+        results = benchmark_backend(backend, corpus, args.repeat)
+        for name, (parse_ms, total_ms) in results.items():
+            size_kb = len(corpus[name]) / 1024
+            print(f"{backend:<12} {name:<16} {size_kb:>7.1f} {parse_ms:>10.2f} {total_ms:>18.2f}")
+        mean_total = sum(total for _, total in results.values()) / len(results)
+        print(f"{backend:<12} {'mean':<16} {'':>7} {'':>10} {mean_total:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Dependencies that should only load on the code paths that need them
+HEAVY_MODULES = ('selenium', 'pandas', 'webdriver_manager', 'bs4', 'openpyxl', 'pyarrow', 'aiohttp')
+
+IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import job_scraper
+imported = time.perf_counter()
+scraper = job_scraper.JobScraper()
+built = time.perf_counter()
+scraper.close()
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(imported - start, built - imported, ','.join(loaded))
+"""
+
+DRIVER_SNIPPET = """
+import time
+start = time.perf_counter()
+from chromedriver_cache import chromedriver_path
+chromedriver_path()
+resolved = time.perf_counter()
+import job_scraper
+scraper = job_scraper.JobScraper(use_selenium=True)
+driver = scraper.create_driver()
+started = time.perf_counter()
+driver.quit()
+print(resolved - start, started - resolved)
+"""
+
+
+def run_python(code, *flags):
+    """Run code in a fresh interpreter from the repo directory; returns (stdout, stderr)"""
+    result = subprocess.run([sys.executable, *flags, '-c', code], cwd=HERE, capture_output=True,
+                            text=True, check=True)
+    return result.stdout, result.stderr
+
+
+def import_times(runs=5):
+    """Median seconds to import job_scraper and build a JobScraper, and heavy modules left loaded"""
+    imports, builds = [], []
+    loaded = ''
+    for _ in range(runs):
+        out, _ = run_python(IMPORT_SNIPPET.format(heavy=HEAVY_MODULES))
+        imported, built, loaded = out.split(' ')
+        imports.append(float(imported))
+        builds.append(float(built))
+    return statistics.median(imports), statistics.median(builds), [name for name in loaded.strip().split(',') if name]
+
+
+def slowest_imports(limit=15):
+    """Top modules by cumulative import time from python -X importtime"""
+    _, err = run_python('import job_scraper', '-X', 'importtime')
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        rows.append((int(cumulative_us), int(self_us), name))
+    rows.sort(reverse=True)
+    return rows[:limit]
+
+
+def driver_startup():
+    """(seconds to resolve chromedriver, seconds to start Chrome) in a fresh process"""
+    out, _ = run_python(DRIVER_SNIPPET)
+    resolved, started = out.split()
+    return float(resolved), float(started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time and startup cost of the scraper")
+    parser.add_argument('--runs', type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument('--selenium', action='store_true',
+                        help="also time chromedriver resolution and browser start (twice: cold, then cached)")
+    args = parser.parse_args()
+
+    imported, built, loaded = import_times(args.runs)
+    print(f"import job_scraper: {imported * 1000:.1f} ms (median of {args.runs})")
+    print(f"JobScraper():       {built * 1000:.1f} ms")
+    print(f"Heavy modules loaded by a requests-mode scraper: {', '.join(loaded) or 'none'}")
+
+    print("\nSlowest imports (cumulative ms):")
+    for cumulative_us, self_us, name in slowest_imports():
+        print(f"  {cumulative_us / 1000:>8.1f}  {name}")
+
+    if args.selenium:
+        for label in ('first run', 'second run'):
+            resolved, started = driver_startup()
+            print(f"\nSelenium {label}: chromedriver resolved in {resolved * 1000:.0f} ms, "
+                  f"Chrome started in {started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from job_scraper import JobScraper
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Timings only mean something on the machine that recorded them, so the baseline isn't committed:
+# run once with --save-baseline on a known-good tree, then compare later runs against it
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'benchmark_baseline.json')
+
+# One stand-in career site per kind of page the scraper meets in the wild
+SITE_KINDS = ('static', 'paginated', 'jsonld', 'large', 'js')
+
+TITLES = ('Software Engineer', 'Senior Data Scientist', 'Product Manager', 'DevOps Engineer',
+          'QA Analyst', 'Site Reliability Engineer', 'UX Designer', 'Technical Writer')
+CITIES = ('Bangalore, India', 'Noida, India', 'Chennai, India', 'London, UK', 'Austin, USA')
+ARRANGEMENTS = ('Remote', 'Hybrid', 'On-site')
+
+DESCRIPTION = ("{company} is hiring a {title} to join a product team shipping to millions of customers. "
+               "You will work with engineering, design and data to take ideas from research to production.")
+DUTIES = ("Design, build and operate services.", "Review code and mentor colleagues.",
+          "Work with stakeholders to plan the roadmap.")
+REQUIREMENTS = ("{years}+ years of experience in a similar role.", "Strong written and verbal communication.",
+                "Comfort with Python, SQL and cloud infrastructure.")
+
+# Renders job cards or a job detail from inline data, so requests mode sees an empty shell
+RENDER_SCRIPT = """<script>
+var data = {data};
+document.getElementById('app').innerHTML = data.html;
+</script>"""
+
+logger = logging.getLogger(__name__)
+
+
+def job_fields(site, job_id):
+    title = TITLES[job_id % len(TITLES)]
+    return {
+        'company': f"{site.title()} Corp",
+        'title': title,
+        'location': CITIES[job_id % len(CITIES)],
+        'arrangement': ARRANGEMENTS[job_id % len(ARRANGEMENTS)],
+        'years': 2 + job_id % 6
+    }
+
+
+def detail_body(site, job_id):
+    fields = job_fields(site, job_id)
+    duties = ''.join(f"<li>{duty}</li>" for duty in DUTIES)
+    requirements = ''.join(f"<li>{requirement.format(**fields)}</li>" for requirement in REQUIREMENTS)
+    return (
+        f'<div class="job-header"><h1 class="job-title">{fields["title"]}</h1>'
+        f'<div class="company-name">{fields["company"]}</div>'
+        f'<div class="job-location">{fields["location"]}</div>'
+        f'<div class="work-type">{fields["arrangement"]}</div>'
+        f'<div class="experience-level">{fields["years"]}+ years of experience</div></div>'
+        f'<section class="job-description"><p>{DESCRIPTION.format(**fields)}</p></section>'
+        f'<section class="job-responsibilities"><h2>Responsibilities</h2><ul>{duties}</ul></section>'
+        f'<section class="job-requirements"><h2>Requirements</h2><ul>{requirements}</ul></section>'
+        f'<a class="apply-button" href="/{site}/jobs/{job_id}/apply">Apply now</a>'
+    )
+
+
+def json_ld(site, job_id):
+    fields = job_fields(site, job_id)
+    city, country = fields['location'].split(', ')
+    posting = {
+        '@context': 'https://schema.org/',
+        '@type': 'JobPosting',
+        'title': fields['title'],
+        'description': DESCRIPTION.format(**fields),
+        'hiringOrganization': {'@type': 'Organization', 'name': fields['company']},
+        'jobLocation': {'@type': 'Place', 'address': {'@type': 'PostalAddress', 'addressLocality': city,
+                                                      'addressCountry': country}},
+        'experienceRequirements': {'@type': 'OccupationalExperienceRequirements',
+                                   'monthsOfExperience': fields['years'] * 12}
+    }
+    if fields['arrangement'] == 'Remote':
+        posting['jobLocationType'] = 'TELECOMMUTE'
+    return json.dumps(posting)
+
+
+def page(title, body, head=''):
+    return (f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{title}</title>{head}</head>'
+            f'<body><header class="site-header"><nav><a href="/">Home</a> <a href="/about">About us</a></nav>'
+            f'</header><main>{body}</main><footer><a href="/privacy">Privacy</a></footer></body></html>'
+            ).encode('utf-8')
+
+
+def detail_page(site, kind, job_id, large_factor):
+    fields = job_fields(site, job_id)
+    title = f"{fields['title']} - {fields['company']}"
+    body = detail_body(site, job_id)
+    if kind == 'jsonld':
+        return page(title, body, f'<script type="application/ld+json">{json_ld(site, job_id)}</script>')
+    if kind == 'large':
+        # Big career pages are mostly navigation, footers and related-job widgets
+        widget = f'<div class="related-jobs"><a href="/{site}/jobs/{job_id}">Related job</a><p>Filler text</p></div>'
+        return page(title, body + widget * large_factor)
+    if kind == 'js':
+        return page(title, '<div id="app"></div>' + RENDER_SCRIPT.format(data=json.dumps({'html': body})))
+    return page(title, body)
+
+
+def listing_page(site, kind, job_ids, next_url=None):
+    cards = ''.join(
+        f'<div class="job-card"><h3 class="job-title"><a href="/{site}/jobs/{job_id}">'
+        f'{job_fields(site, job_id)["title"]}</a></h3>'
+        f'<span class="job-location">{job_fields(site, job_id)["location"]}</span></div>'
+        for job_id in job_ids
+    )
+    head = ''
+    if next_url:
+        head = f'<link rel="next" href="{next_url}">'
+        cards += f'<a class="pagination-next" href="{next_url}">Next</a>'
+    body = '<h1>Open positions</h1><div class="job-list">{}</div>'
+    if kind == 'js':
+        return page(f"Careers | {site.title()} Corp", '<div id="app"></div>' +
+                    RENDER_SCRIPT.format(data=json.dumps({'html': body.format(cards)})), head)
+    return page(f"Careers | {site.title()} Corp", body.format(cards), head)
+
+
+def generate_corpus(jobs_per_page=20, pages=3, large_factor=200):
+    """{path: body} for one site per SITE_KINDS entry, each at /<kind>/careers"""
+    corpus = {}
+    for site in SITE_KINDS:
+        # Each site is named after its kind
+        kind = site
+        page_count = pages if kind == 'paginated' else 1
+        for number in range(1, page_count + 1):
+            job_ids = range((number - 1) * jobs_per_page, number * jobs_per_page)
+            path = f"/{site}/careers" if number == 1 else f"/{site}/careers?page={number}"
+            next_url = f"/{site}/careers?page={number + 1}" if number < page_count else None
+            corpus[path] = listing_page(site, kind, job_ids, next_url)
+            for job_id in job_ids:
+                corpus[f"/{site}/jobs/{job_id}"] = detail_page(site, kind, job_id, large_factor)
+    return corpus
+
+
+class CareerSiteServer:
+    """Serves a generated corpus on localhost with injected latency and transient errors
+
+    Each request waits latency plus up to jitter seconds, then fails with a
+    503 with probability error_rate.
+    """
+
+    def __init__(self, corpus, latency=0.0, jitter=0.0, error_rate=0.0, seed=0):
+        self.corpus = corpus
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _decide(self):
+        """(delay, fail) for one request, drawn under the lock so runs are reproducible per seed"""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            fail = self._random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+            return delay, fail
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                delay, fail = server._decide()
+                if delay:
+                    time.sleep(delay)
+                body = server.corpus.get(self.path)
+                if fail:
+                    self.send_response(503)
+                    self.send_header('Retry-After', '0')
+                    body = b''
+                elif body is None:
+                    self.send_response(404)
+                    body = b''
+                else:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def measure(calls, trace_memory=False):
+    """Run zero-argument callables that return an item count (or a list); time each and the whole"""
+    latencies = []
+    items = errors = 0
+    if trace_memory:
+        tracemalloc.start()
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for call in calls:
+        call_start = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            logger.error(f"Benchmark call failed: {e}")
+            result = None
+        latencies.append(time.perf_counter() - call_start)
+        count = len(result) if isinstance(result, (list, tuple)) else (1 if result else 0)
+        items += count
+        errors += not count
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    result = {
+        'calls': len(latencies),
+        'items': items,
+        'errors': errors,
+        'seconds': round(elapsed, 4),
+        'items_per_sec': round(items / elapsed, 2) if elapsed > 0 else 0.0,
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'cpu_seconds': round(cpu, 4),
+        'peak_rss_mb': peak_rss_mb()
+    }
+    if trace_memory:
+        result['peak_traced_mb'] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+        tracemalloc.stop()
+    return result
+
+
+def run_suite(jobs_per_page=20, pages=3, latency=0.0, jitter=0.0, error_rate=0.0, workers=4,
+              use_selenium=False, parser='html.parser', detail_pages=40, trace_memory=False):
+    """Benchmark find_job_links, extract_job_data and scrape_jobs against a local corpus"""
+    corpus = generate_corpus(jobs_per_page, pages)
+    # Without a browser the JS-rendered site is an empty shell; only measure it with Selenium
+    kinds = [kind for kind in SITE_KINDS if use_selenium or kind != 'js']
+    results = {}
+
+    with CareerSiteServer(corpus, latency, jitter, error_rate) as server:
+        def new_scraper():
+            return JobScraper(use_selenium=use_selenium, max_workers=workers, requests_per_second=0,
+                              use_board_apis=False, parser=parser, keep_jobs=False)
+
+        for kind in kinds:
+            career_url = f"{server.base_url}/{kind}/careers"
+            detail_urls = [f"{server.base_url}{path}" for path in corpus
+                           if path.startswith(f"/{kind}/jobs/")][:detail_pages]
+
+            scraper = new_scraper()
+            try:
+                results[f"find_job_links/{kind}"] = measure(
+                    [lambda: scraper.find_job_links(career_url)], trace_memory)
+                results[f"extract_job_data/{kind}"] = measure(
+                    [lambda url=url: scraper.extract_job_data(url) for url in detail_urls], trace_memory)
+            finally:
+                scraper.close()
+
+            # A fresh scraper so scrape_jobs pays its own connection and browser setup
+            scraper = new_scraper()
+            try:
+                results[f"scrape_jobs/{kind}"] = measure(
+                    [lambda: scraper.scrape_jobs(career_url, max_jobs=jobs_per_page * pages)], trace_memory)
+            finally:
+                scraper.close()
+
+        results['server'] = {'requests': server.requests, 'injected_errors': server.errors}
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Regressions against a baseline: fewer items, lower throughput, or slower p99 and CPU beyond tolerance"""
+    regressions = []
+    for name, before in baseline.items():
+        after = results.get(name)
+        if after is None or 'items_per_sec' not in before:
+            continue
+        if after['items'] < before['items']:
+            regressions.append(f"{name}: {after['items']} items, baseline {before['items']}")
+        if after['items_per_sec'] < before['items_per_sec'] * (1 - tolerance):
+            regressions.append(f"{name}: {after['items_per_sec']} items/s, baseline {before['items_per_sec']}")
+        for key in ('p99_ms', 'cpu_seconds'):
+            # Ignore sub-millisecond noise on very fast scenarios
+            if after[key] > before[key] * (1 + tolerance) and after[key] - before[key] > 0.001:
+                regressions.append(f"{name}: {key} {after[key]}, baseline {before[key]}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper against a local stand-in career site")
+    parser.add_argument('--jobs-per-page', type=int, default=20)
+    parser.add_argument('--pages', type=int, default=3, help="listing pages on the paginated site")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="added to every response")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="random extra latency per response")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of responses that are 503")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--parser', default='html.parser')
+    parser.add_argument('--selenium', action='store_true', help="render pages (and the JS site) with Chrome")
+    parser.add_argument('--memory', action='store_true', help="also trace Python allocations (slower)")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="machine-local results to compare against")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store this run as the baseline (required once per machine before comparing)")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed relative slowdown")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    config = {key: value for key, value in vars(args).items()
+              if key not in ('baseline', 'save_baseline', 'tolerance', 'memory')}
+    results = run_suite(args.jobs_per_page, args.pages, args.latency_ms / 1000, args.jitter_ms / 1000,
+                        args.error_rate, args.workers, args.selenium, args.parser, trace_memory=args.memory)
+
+    print(f"{'scenario':<28} {'items':>6} {'items/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'cpu s':>7} {'errors':>6}")
+    for name, result in results.items():
+        if 'items_per_sec' in result:
+            print(f"{name:<28} {result['items']:>6} {result['items_per_sec']:>9.1f} {result['p50_ms']:>9.1f} "
+                  f"{result['p99_ms']:>9.1f} {result['cpu_seconds']:>7.2f} {result['errors']:>6}")
+    print(f"Server: {results['server']['requests']} requests, {results['server']['injected_errors']} injected errors")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'config': config, 'results': results}, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; nothing was compared. Record one on this machine first with "
+              f"--save-baseline and the same settings")
+        sys.exit(2)
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('config') != config:
+        print(f"Warning: baseline was recorded with different settings: {baseline.get('config')}")
+    regressions = compare(results, baseline['results'], args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
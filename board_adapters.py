@@ -0,0 +1,368 @@
+import html
+import json
+import logging
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse, parse_qs
+
+from html_parsers import parse_fragment
+from job_record import JobRecord
+
+
+# Headings that introduce the sections extract_job_data reports separately
+RESPONSIBILITY_HEADINGS = ('responsibilit', 'what you will do', "what you'll do", 'duties',
+                           'the role', 'your role', 'your impact')
+QUALIFICATION_HEADINGS = ('qualification', 'requirement', 'skills', 'what you bring',
+                          'what we need', 'about you', 'you have', 'who you are')
+
+
+class BoardAdapter:
+    """Base class for job boards that expose structured listing endpoints"""
+
+    name = None
+    URL_PATTERN = None
+    MARKUP_PATTERN = None
+
+    def __init__(self, scraper, career_url, key, soup=None):
+        self.scraper = scraper
+        self.career_url = career_url
+        self.key = key
+        self.soup = soup
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def match(cls, career_url, page_html=None):
+        """Return the board key for this platform, or None if it doesn't apply"""
+        if cls.URL_PATTERN:
+            match = cls.URL_PATTERN.search(career_url)
+            if match:
+                return match.groups()
+        if page_html and cls.MARKUP_PATTERN:
+            match = cls.MARKUP_PATTERN.search(page_html)
+            if match:
+                return match.groups()
+        return None
+
+    def fetch_jobs(self, max_jobs=50):
+        """Return up to max_jobs job dicts in the extract_job_data schema"""
+        raise NotImplementedError
+
+    def get_json(self, url, method='GET', payload=None):
+        """Fetch and decode a JSON endpoint through the scraper's session and cache"""
+        if method == 'POST':
+            response = self.scraper.http_request('POST', url, json=payload)
+            response.raise_for_status()
+            return response.json()
+        return json.loads(self.scraper.fetch_bytes(url))
+
+    def get_text(self, url):
+        """Fetch a text/XML endpoint through the scraper's session and cache"""
+        return self.scraper.fetch_bytes(url)
+
+    def map_details(self, func, items):
+        """Run per-posting detail calls concurrently, keeping order"""
+        workers = self.scraper.max_workers
+        if workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(func, items))
+        return [func(item) for item in items]
+
+    def build_job(self, title, apply_link, company_name=None, job_location=None,
+                  work_location=None, description_html=None, responsibilities=None,
+                  qualifications=None, experience=None):
+        """Map posting fields onto a JobRecord, deriving the rest from the description"""
+        description_soup = parse_fragment(description_html, self.scraper.bs4_features)
+        sections = split_sections(description_soup)
+
+        if not work_location:
+            context = f"{job_location or ''} {title or ''} {description_html or ''}"
+            work_location = self.scraper.extract_work_location(
+                parse_fragment(context, self.scraper.bs4_features), [])
+        if not experience:
+            experience = self.scraper.extract_experience(description_soup, [])
+
+        description = description_soup.get_text(separator='\n', strip=True)
+        job_data = JobRecord({
+            'company_name': company_name or company_from_url(self.career_url),
+            'job_title': title or "Not specified",
+            'work_location': work_location or "Not specified",
+            'job_location': job_location or "Not specified",
+            'experience': experience or "Not specified",
+            'job_description': description or "Not specified",
+            'responsibilities': responsibilities or sections.get('responsibilities') or "Not specified",
+            'qualifications': qualifications or sections.get('qualifications') or "Not specified",
+            'apply_link': apply_link or self.career_url
+        })
+        return self.scraper.clean_job_data(job_data)
+
+
+class GreenhouseAdapter(BoardAdapter):
+    """boards.greenhouse.io boards via the public Job Board API"""
+
+    name = 'greenhouse'
+    URL_PATTERN = re.compile(r'(?:job-)?boards(?:\.eu)?\.greenhouse\.io/(?:embed/job_board\?for=)?([\w-]+)', re.I)
+    MARKUP_PATTERN = re.compile(r'greenhouse\.io/embed/job_board(?:/js)?\?for=([\w-]+)', re.I)
+    API_URL = 'https://boards-api.greenhouse.io/v1/boards/{token}'
+
+    def fetch_jobs(self, max_jobs=50):
+        token = self.key[0]
+        api_url = self.API_URL.format(token=token)
+
+        company_name = None
+        try:
+            company_name = self.get_json(api_url).get('name')
+        except Exception as e:
+            self.logger.debug(f"Greenhouse board info unavailable for {token}: {e}")
+
+        data = self.get_json(f"{api_url}/jobs?content=true")
+        jobs = []
+        for posting in data.get('jobs', [])[:max_jobs]:
+            location = (posting.get('location') or {}).get('name')
+            jobs.append(self.build_job(
+                title=posting.get('title'),
+                apply_link=posting.get('absolute_url'),
+                company_name=company_name,
+                job_location=location,
+                # content is HTML-escaped in the API response
+                description_html=html.unescape(posting.get('content') or '')
+            ))
+        return jobs
+
+
+class LeverAdapter(BoardAdapter):
+    """jobs.lever.co boards via the public Postings API"""
+
+    name = 'lever'
+    URL_PATTERN = re.compile(r'jobs\.(eu\.)?lever\.co/([\w.-]+)', re.I)
+    MARKUP_PATTERN = re.compile(r'jobs\.(eu\.)?lever\.co/([\w.-]+)', re.I)
+    API_URL = 'https://api.{region}lever.co/v0/postings/{site}?mode=json&skip={skip}&limit={limit}'
+    PAGE_SIZE = 100
+    WORKPLACE_TYPES = {'remote': 'Remote', 'hybrid': 'Hybrid', 'onsite': 'On-site', 'on-site': 'On-site'}
+
+    def fetch_jobs(self, max_jobs=50):
+        region, site = self.key
+        company_name = site.replace('-', ' ').title()
+
+        postings = []
+        skip = 0
+        while len(postings) < max_jobs:
+            url = self.API_URL.format(region=region or '', site=site, skip=skip, limit=self.PAGE_SIZE)
+            page = self.get_json(url)
+            if not page:
+                break
+            postings.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                break
+            skip += self.PAGE_SIZE
+
+        jobs = []
+        for posting in postings[:max_jobs]:
+            categories = posting.get('categories') or {}
+            lists = {}
+            for section in posting.get('lists') or []:
+                heading = (section.get('text') or '').lower()
+                content = parse_fragment(section.get('content'), self.scraper.bs4_features)
+                content = content.get_text(separator='\n', strip=True)
+                if any(word in heading for word in RESPONSIBILITY_HEADINGS):
+                    lists.setdefault('responsibilities', content)
+                elif any(word in heading for word in QUALIFICATION_HEADINGS):
+                    lists.setdefault('qualifications', content)
+
+            jobs.append(self.build_job(
+                title=posting.get('text'),
+                apply_link=posting.get('hostedUrl') or posting.get('applyUrl'),
+                company_name=company_name,
+                job_location=categories.get('location'),
+                work_location=self.WORKPLACE_TYPES.get((posting.get('workplaceType') or '').lower()),
+                description_html=posting.get('description') or posting.get('descriptionPlain'),
+                responsibilities=lists.get('responsibilities'),
+                qualifications=lists.get('qualifications')
+            ))
+        return jobs
+
+
+class WorkdayAdapter(BoardAdapter):
+    """myworkdayjobs.com sites via the CXS JSON endpoints the site itself calls"""
+
+    name = 'workday'
+    URL_PATTERN = re.compile(r'https?://([\w-]+)\.(wd\d+)\.myworkdayjobs\.com/(?:[a-z]{2}-[A-Z]{2}/)?([\w-]+)', re.I)
+    PAGE_SIZE = 20
+
+    def fetch_jobs(self, max_jobs=50):
+        tenant, pod, site = self.key
+        base = f"https://{tenant}.{pod}.myworkdayjobs.com"
+        api_url = f"{base}/wday/cxs/{tenant}/{site}"
+
+        summaries = []
+        offset = 0
+        while len(summaries) < max_jobs:
+            page = self.get_json(f"{api_url}/jobs", method='POST', payload={
+                'appliedFacets': {}, 'limit': self.PAGE_SIZE, 'offset': offset, 'searchText': ''
+            })
+            postings = page.get('jobPostings') or []
+            summaries.extend(postings)
+            offset += self.PAGE_SIZE
+            if not postings or offset >= page.get('total', 0):
+                break
+
+        def fetch_detail(summary):
+            path = summary.get('externalPath', '')
+            try:
+                detail = self.get_json(f"{api_url}{path}")
+            except Exception as e:
+                self.logger.error(f"Workday detail failed for {path}: {e}")
+                detail = {}
+            info = detail.get('jobPostingInfo') or {}
+            organization = detail.get('hiringOrganization') or {}
+            return self.build_job(
+                title=info.get('title') or summary.get('title'),
+                apply_link=info.get('externalUrl') or f"{base}/{site}{path}",
+                company_name=organization.get('name'),
+                job_location=info.get('location') or summary.get('locationsText'),
+                work_location=info.get('remoteType'),
+                description_html=info.get('jobDescription')
+            )
+
+        return self.map_details(fetch_detail, summaries[:max_jobs])
+
+
+class SuccessFactorsAdapter(BoardAdapter):
+    """SAP SuccessFactors career sites (the /go/<category>/<id>/ boards) via RSS or server-rendered listings"""
+
+    name = 'successfactors'
+    URL_PATTERN = re.compile(r'https?://([^/]+)/(go/[^/]+/\d+)/?', re.I)
+    MARKUP_PATTERN = re.compile(r'(rmkcdn\.successfactors\.com|jobs2web\.com|/services/rss/job/)', re.I)
+    PAGE_SIZE = 25
+
+    def fetch_jobs(self, max_jobs=50):
+        feed_url = self.find_feed_url()
+        if feed_url:
+            jobs = self.fetch_from_feed(feed_url, max_jobs)
+            if jobs:
+                return jobs
+        return self.fetch_from_listing(max_jobs)
+
+    def find_feed_url(self):
+        """Use the RSS alternate link the listing page advertises, if any"""
+        if self.soup is None:
+            return None
+        link = self.soup.select_one('link[type="application/rss+xml"][href]')
+        if link:
+            return urljoin(self.career_url, link['href'])
+        return None
+
+    def fetch_from_feed(self, feed_url, max_jobs):
+        """One request returns every posting with its description"""
+        root = ET.fromstring(self.get_text(feed_url))
+        company_name = company_from_url(self.career_url)
+
+        jobs = []
+        for item in root.iter('item'):
+            title, location = split_title_location(item.findtext('title') or '')
+            jobs.append(self.build_job(
+                title=title,
+                apply_link=(item.findtext('link') or '').strip(),
+                company_name=company_name,
+                job_location=location,
+                description_html=item.findtext('description')
+            ))
+            if len(jobs) >= max_jobs:
+                break
+        return jobs
+
+    def fetch_from_listing(self, max_jobs):
+        """Page through the server-rendered listing with startrow, no browser needed"""
+        rows = []
+        startrow = int(parse_qs(urlparse(self.career_url).query).get('startrow', ['0'])[0])
+        base_url = self.career_url.split('?')[0]
+        while len(rows) < max_jobs:
+            soup = self.scraper._get_with_requests(f"{base_url}?startrow={startrow}")
+            page_rows = soup.select('tr.data-row') if soup else []
+            if not page_rows:
+                break
+            for row in page_rows:
+                link = row.select_one('a.jobTitle-link[href]')
+                location = row.select_one('.jobLocation')
+                if link:
+                    rows.append((link.get_text(strip=True), urljoin(self.career_url, link['href']),
+                                 location.get_text(strip=True) if location else None))
+            if len(page_rows) < self.PAGE_SIZE:
+                break
+            startrow += len(page_rows)
+
+        company_name = company_from_url(self.career_url)
+
+        def fetch_detail(row):
+            title, apply_link, location = row
+            detail = self.scraper._get_with_requests(apply_link)
+            description = detail.select_one('[itemprop="description"], .jobdescription') if detail else None
+            return self.build_job(
+                title=title,
+                apply_link=apply_link,
+                company_name=company_name,
+                job_location=location,
+                description_html=str(description) if description else None
+            )
+
+        return self.map_details(fetch_detail, rows[:max_jobs])
+
+
+BOARD_ADAPTERS = [GreenhouseAdapter, LeverAdapter, WorkdayAdapter, SuccessFactorsAdapter]
+
+
+def detect_board(scraper, career_url, soup=None):
+    """Return an adapter for the board behind career_url, checking the URL first and then the page markup"""
+    for adapter_class in BOARD_ADAPTERS:
+        key = adapter_class.match(career_url)
+        if key:
+            return adapter_class(scraper, career_url, key, soup)
+
+    if soup is not None:
+        page_html = str(soup)
+        for adapter_class in BOARD_ADAPTERS:
+            key = adapter_class.match('', page_html)
+            if key:
+                return adapter_class(scraper, career_url, key, soup)
+    return None
+
+
+def split_sections(soup):
+    """Split a description into responsibilities/qualifications by its headings"""
+    sections = {}
+    for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b']):
+        heading_text = heading.get_text(strip=True).lower()
+        if not heading_text or len(heading_text) > 80:
+            continue
+        if any(word in heading_text for word in RESPONSIBILITY_HEADINGS):
+            field = 'responsibilities'
+        elif any(word in heading_text for word in QUALIFICATION_HEADINGS):
+            field = 'qualifications'
+        else:
+            continue
+        if field in sections:
+            continue
+
+        # Bold headings sit inside a <p>; start from the block that holds them
+        block = heading.parent if heading.name in ('strong', 'b') and heading.parent.name == 'p' else heading
+        content = block.find_next_sibling(['ul', 'ol', 'p', 'div'])
+        if content:
+            text = content.get_text(separator='\n', strip=True)
+            if text:
+                sections[field] = text
+    return sections
+
+
+def split_title_location(text):
+    """SuccessFactors feed titles look like 'Title (City, ST, CC, 560001)'"""
+    match = re.match(r'^(.*?)\s*\(([^()]*,[^()]*)\)\s*$', text.strip())
+    if match:
+        return match.group(1), match.group(2)
+    return text.strip(), None
+
+
+def company_from_url(url):
+    """Best-effort company name from a career site host"""
+    host = urlparse(url).netloc.lower().split(':')[0]
+    parts = [part for part in host.split('.') if part not in ('www', 'careers', 'jobs', 'career')]
+    return parts[0].title() if parts else host
@@ -0,0 +1,102 @@
+import logging
+
+
+# Runs a selector plan inside the page: for every field and selector, the
+# text of the first few matches, plus the <title> and any schema.org
+# JobPosting markup. Text is collected like BeautifulSoup's
+# get_text(strip=True): stripped text nodes, minus <script>/<style>.
+EXTRACT_SCRIPT = """
+var plan = arguments[0], perSelector = arguments[1], maxChars = arguments[2];
+function textOf(root) {
+    var walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {
+        acceptNode: function (node) {
+            var tag = node.parentNode && node.parentNode.nodeName;
+            return tag === 'SCRIPT' || tag === 'STYLE' ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT;
+        }
+    });
+    var parts = [], length = 0, node, text;
+    while ((node = walker.nextNode())) {
+        text = node.nodeValue.trim();
+        if (text) {
+            parts.push(text);
+            length += text.length + 1;
+            if (maxChars && length > maxChars) break;
+        }
+    }
+    return parts.join(' ');
+}
+var fields = {};
+Object.keys(plan).forEach(function (field) {
+    fields[field] = plan[field].map(function (selector) {
+        var elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            return [];
+        }
+        var texts = [];
+        for (var i = 0; i < elements.length && texts.length < perSelector; i++) {
+            texts.push(textOf(elements[i]));
+        }
+        return texts;
+    });
+});
+var title = document.querySelector('title');
+var jsonLd = [], microdata = [];
+document.querySelectorAll('script[type="application/ld+json"]').forEach(function (script) {
+    if (script.textContent.indexOf('JobPosting') !== -1) jsonLd.push(script.textContent);
+});
+document.querySelectorAll('[itemscope][itemtype*="JobPosting"]').forEach(function (scope) {
+    microdata.push(scope.outerHTML);
+});
+return {fields: fields, title: title ? title.textContent : null, json_ld: jsonLd, microdata: microdata};
+"""
+
+# Whole-page text for the work-location/experience keyword fallbacks
+PAGE_TEXT_SCRIPT = EXTRACT_SCRIPT.split('var fields = {};')[0] + "return textOf(document.documentElement);"
+
+logger = logging.getLogger(__name__)
+
+
+class InPageResult:
+    """What EXTRACT_SCRIPT returned for one page, with the page text fetched only if needed"""
+
+    def __init__(self, driver, result):
+        self.driver = driver
+        self.fields = result.get('fields') or {}
+        self.title = result.get('title')
+        self.json_ld = result.get('json_ld') or []
+        self.microdata = result.get('microdata') or []
+        self._page_text = None
+
+    def candidates(self, field):
+        """Candidate texts per selector, in plan order"""
+        return self.fields.get(field, [])
+
+    def title_text(self):
+        return self.title.strip() if self.title is not None else None
+
+    def page_text(self):
+        if self._page_text is None:
+            self._page_text = self.driver.execute_script(PAGE_TEXT_SCRIPT, None, None, 0) or ''
+        return self._page_text
+
+    def structured_markup(self):
+        """The page's JobPosting JSON-LD and microdata as a small HTML document, or None"""
+        if not self.json_ld and not self.microdata:
+            return None
+        scripts = ''.join(f'<script type="application/ld+json">{text}</script>' for text in self.json_ld)
+        return f"<html><head>{scripts}</head><body>{''.join(self.microdata)}</body></html>"
+
+
+def extract_in_page(driver, plan, per_selector=10, max_chars=20000):
+    """Run plan's selectors in driver's current page with a single execute_script call
+
+    per_selector caps the matches returned for each selector and max_chars
+    the text taken from each match, so only field-sized strings cross the
+    WebDriver connection instead of the whole page_source.
+    """
+    result = driver.execute_script(EXTRACT_SCRIPT, plan.selectors, per_selector, max_chars)
+    if not isinstance(result, dict):
+        raise ValueError(f"In-page extraction returned {type(result).__name__}")
+    return InPageResult(driver, result)
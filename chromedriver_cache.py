@@ -0,0 +1,71 @@
+import json
+import logging
+import os
+import threading
+import time
+
+
+# Re-resolve occasionally so Chrome updates eventually get a matching driver
+MAX_AGE = 7 * 24 * 3600
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_resolved = None
+
+
+def cache_file():
+    """Where the resolved chromedriver path is kept between runs"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'job_scraper', 'chromedriver.json')
+
+
+def _read_cached(path, max_age):
+    try:
+        with open(path, encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    driver = entry.get('path')
+    if (driver and os.access(driver, os.X_OK)
+            and time.time() - entry.get('resolved_at', 0) < max_age):
+        return driver
+    return None
+
+
+def _write_cached(path, driver):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'path': driver, 'resolved_at': time.time()}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not cache the chromedriver path: {e}")
+
+
+def chromedriver_path(refresh=False, max_age=MAX_AGE):
+    """Path to a chromedriver binary, resolved by webdriver-manager at most once per max_age
+
+    CHROMEDRIVER_PATH overrides everything. Otherwise the path is memoised
+    for the process and kept in cache_file() across runs, so only the first
+    run (or refresh=True, e.g. after a driver/browser version mismatch) pays
+    webdriver-manager's version check and download.
+    """
+    global _resolved
+    override = os.environ.get('CHROMEDRIVER_PATH')
+    if override:
+        return override
+
+    with _lock:
+        if _resolved and not refresh:
+            return _resolved
+        path = cache_file()
+        driver = None if refresh else _read_cached(path, max_age)
+        if driver is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver = ChromeDriverManager().install()
+            _write_cached(path, driver)
+            logger.info(f"Resolved chromedriver at {driver}")
+        _resolved = driver
+        return driver
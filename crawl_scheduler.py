@@ -0,0 +1,382 @@
+import argparse
+import json
+import logging
+import queue
+import random
+import signal
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from job_scraper import JobScraper
+from resilience import host_of
+from result_sinks import open_sink
+from seen_store import SeenStore
+
+
+# Cadence adapts multiplicatively: faster after a change, slower while a site stays quiet
+CHANGE_FACTOR = 0.5
+QUIET_FACTOR = 1.5
+
+DEFAULT_INTERVAL = 6 * 3600
+DEFAULT_MIN_INTERVAL = 30 * 60
+DEFAULT_MAX_INTERVAL = 7 * 86400
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlFailed(Exception):
+    """A crawl that returned without error but read no listing, e.g. because the site was down"""
+
+
+def next_interval(interval, changed, min_interval, max_interval):
+    """Refresh interval after a crawl that did or didn't find added, changed or removed postings"""
+    interval *= CHANGE_FACTOR if changed else QUIET_FACTOR
+    return min(max_interval, max(min_interval, interval))
+
+
+class CrawlRegistry:
+    """Persistent list of career URLs with their refresh cadence, priority and crawl history"""
+
+    def __init__(self, path='crawl_registry.sqlite'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sites (
+                career_url TEXT PRIMARY KEY,
+                name TEXT,
+                custom_selectors TEXT,
+                max_jobs INTEGER NOT NULL DEFAULT 50,
+                priority INTEGER NOT NULL DEFAULT 0,
+                interval REAL NOT NULL,
+                min_interval REAL NOT NULL,
+                max_interval REAL NOT NULL,
+                next_due REAL NOT NULL,
+                last_run REAL,
+                last_change REAL,
+                runs INTEGER NOT NULL DEFAULT 0,
+                changes INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                last_jobs INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS sites_due ON sites (next_due);
+        """)
+        self._conn.commit()
+
+    def add(self, career_url, name=None, interval=DEFAULT_INTERVAL, priority=0, custom_selectors=None,
+            max_jobs=50, min_interval=DEFAULT_MIN_INTERVAL, max_interval=DEFAULT_MAX_INTERVAL):
+        """Register a site, due immediately; re-adding updates its settings but keeps the learned cadence"""
+        selectors = json.dumps(custom_selectors) if custom_selectors is not None else None
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO sites (career_url, name, custom_selectors, max_jobs, priority, interval,
+                                   min_interval, max_interval, next_due)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (career_url) DO UPDATE SET
+                    name = excluded.name, custom_selectors = excluded.custom_selectors,
+                    max_jobs = excluded.max_jobs, priority = excluded.priority,
+                    min_interval = excluded.min_interval, max_interval = excluded.max_interval,
+                    interval = MIN(excluded.max_interval, MAX(excluded.min_interval, sites.interval))
+            """, (career_url, name, selectors, max_jobs, priority, interval, min_interval, max_interval,
+                  time.time()))
+            self._conn.commit()
+
+    def remove(self, career_url):
+        with self._lock:
+            self._conn.execute("DELETE FROM sites WHERE career_url = ?", (career_url,))
+            self._conn.commit()
+
+    def sites(self):
+        """Every registered site as a dict, soonest due first"""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM sites ORDER BY next_due").fetchall()
+        return [self._site(row) for row in rows]
+
+    def due(self, now=None, limit=100):
+        """Sites whose next crawl is due, highest priority first, then the most overdue"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM sites WHERE next_due <= ? ORDER BY priority DESC, next_due LIMIT ?",
+                (now if now is not None else time.time(), limit)
+            ).fetchall()
+        return [self._site(row) for row in rows]
+
+    def next_due(self):
+        """Earliest next_due across all sites, or None if there are none"""
+        with self._lock:
+            return self._conn.execute("SELECT MIN(next_due) FROM sites").fetchone()[0]
+
+    def record_success(self, career_url, changed, jobs):
+        """Adapt the site's interval to whether its postings changed and schedule the next crawl"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT interval, min_interval, max_interval FROM sites WHERE career_url = ?",
+                                     (career_url,)).fetchone()
+            if row is None:
+                return
+            interval = next_interval(row['interval'], changed, row['min_interval'], row['max_interval'])
+            # Jitter keeps sites added together from staying in lockstep
+            next_due = now + interval * random.uniform(0.9, 1.1)
+            self._conn.execute("""
+                UPDATE sites SET interval = ?, next_due = ?, last_run = ?, runs = runs + 1,
+                    changes = changes + ?, last_change = CASE WHEN ? THEN ? ELSE last_change END,
+                    failures = 0, last_error = NULL, last_jobs = ?
+                WHERE career_url = ?
+            """, (interval, next_due, now, int(changed), int(changed), now, jobs, career_url))
+            self._conn.commit()
+
+    def record_failure(self, career_url, error):
+        """Back off exponentially from min_interval without touching the learned interval"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT failures, min_interval, max_interval FROM sites WHERE career_url = ?",
+                                     (career_url,)).fetchone()
+            if row is None:
+                return
+            delay = min(row['max_interval'], row['min_interval'] * 2 ** row['failures'])
+            self._conn.execute("""
+                UPDATE sites SET next_due = ?, last_run = ?, runs = runs + 1, failures = failures + 1,
+                    last_error = ?
+                WHERE career_url = ?
+            """, (now + delay, now, error[:500], career_url))
+            self._conn.commit()
+
+    @staticmethod
+    def _site(row):
+        site = dict(row)
+        if site['custom_selectors']:
+            site['custom_selectors'] = json.loads(site['custom_selectors'])
+        return site
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+
+class CrawlScheduler:
+    """Long-running crawler that refreshes registered sites when they fall due
+
+    At most max_concurrency sites are crawled at once, never two on the same
+    host. Each slot keeps a warm JobScraper (HTTP connections, browser pool)
+    across cycles, recycled after recycle_after crawls. seen_store lets
+    crawls skip postings whose listing entry is unchanged and tells the
+    registry whether anything was added, changed or removed. The registry,
+    seen_store and sinks are owned by the caller.
+    """
+
+    def __init__(self, registry, seen_store, sinks=None, max_concurrency=4, poll_interval=5.0,
+                 recycle_after=200, **scraper_options):
+        self.registry = registry
+        self.seen_store = seen_store
+        self.sinks = list(sinks or [])
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.poll_interval = poll_interval
+        self.recycle_after = recycle_after
+        self.scraper_options = scraper_options
+        self.stats = {'crawls': 0, 'changed': 0, 'failed': 0}
+        self._scrapers = queue.LifoQueue()
+        self._running = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='crawl')
+
+    def new_scraper(self):
+        options = dict(self.scraper_options)
+        # Results go to the sinks; a daemon can't keep every job in memory
+        options.setdefault('keep_jobs', False)
+        return JobScraper(seen_store=self.seen_store, sinks=self.sinks, **options)
+
+    def checkout(self):
+        """(scraper, crawls so far): a warm one if idle, else new (at most one per slot exists)"""
+        try:
+            return self._scrapers.get_nowait()
+        except queue.Empty:
+            return self.new_scraper(), 0
+
+    def checkin(self, scraper, crawls):
+        if self.recycle_after and crawls >= self.recycle_after:
+            # Long-lived browsers accumulate memory; start the next crawl on a fresh scraper
+            scraper.close()
+            return
+        self._scrapers.put((scraper, crawls))
+
+    def crawl(self, site):
+        """Crawl one site and record the outcome in the registry; returns True if it changed"""
+        url = site['career_url']
+        scraper, crawls = self.checkout()
+        start = time.perf_counter()
+        try:
+            scraper.last_delta = None
+            jobs = scraper.scrape_jobs(url, site['custom_selectors'], site['max_jobs'])
+            listing = scraper.last_listing or {}
+            failed_url = listing.get('failed_url')
+            if not listing.get('links') and (failed_url or not listing.get('complete')):
+                # scrape_jobs logs and returns [] when the listing is unreachable; that is not a quiet site.
+                # A complete, empty listing is: the site is up with no openings right now.
+                raise CrawlFailed(f"Listing page {failed_url} could not be loaded" if failed_url
+                                  else "No job links found")
+            delta = scraper.last_delta or {}
+            changed = bool(delta.get('added') or delta.get('changed') or delta.get('removed'))
+            self.registry.record_success(url, changed, len(jobs))
+            logger.info(f"Crawled {site['name'] or url} in {time.perf_counter() - start:.1f}s: "
+                        f"{'changed' if changed else 'unchanged'}")
+            with self._lock:
+                self.stats['crawls'] += 1
+                self.stats['changed'] += changed
+            return changed
+        except Exception as e:
+            logger.error(f"Crawl of {url} failed: {e}")
+            self.registry.record_failure(url, f"{type(e).__name__}: {e}")
+            with self._lock:
+                self.stats['crawls'] += 1
+                self.stats['failed'] += 1
+            return False
+        finally:
+            self.checkin(scraper, crawls + 1)
+
+    def tick(self):
+        """Start due sites in free slots; returns how many were started"""
+        with self._lock:
+            free = self.max_concurrency - len(self._running)
+            busy_hosts = {host_of(url) for url in self._running}
+        if free <= 0:
+            return 0
+
+        started = 0
+        # Over-fetch so sites skipped for a busy host don't starve the free slots
+        for site in self.registry.due(limit=free * 4 + len(busy_hosts)):
+            if started >= free:
+                break
+            url = site['career_url']
+            host = host_of(url)
+            with self._lock:
+                if url in self._running or host in busy_hosts:
+                    continue
+                busy_hosts.add(host)
+                self._running[url] = future = self._executor.submit(self.crawl, site)
+            future.add_done_callback(lambda _, url=url: self._finished(url))
+            started += 1
+        return started
+
+    def _finished(self, url):
+        with self._lock:
+            self._running.pop(url, None)
+
+    def run_forever(self):
+        """Crawl due sites until stop() is called (or SIGTERM/SIGINT when run from main)"""
+        logger.info(f"Scheduler started with {self.max_concurrency} slots")
+        while not self._stop.is_set():
+            self.tick()
+            next_due = self.registry.next_due()
+            wait = self.poll_interval
+            if next_due is not None:
+                wait = min(wait, max(0.0, next_due - time.time()))
+            self._stop.wait(max(wait, 0.5))
+
+    def run_once(self):
+        """Crawl everything due now and wait for it to finish (handy from cron or in tests)"""
+        while self.tick() or self._running:
+            time.sleep(0.2)
+
+    def stop(self):
+        self._stop.set()
+
+    def close(self):
+        """Wait for running crawls, then close every warm scraper"""
+        self._stop.set()
+        self._executor.shutdown(wait=True)
+        while True:
+            try:
+                self._scrapers.get_nowait()[0].close()
+            except queue.Empty:
+                break
+        logger.info(f"Scheduler stopped after {self.stats['crawls']} crawls "
+                    f"({self.stats['changed']} changed, {self.stats['failed']} failed)")
+
+
+def run_scheduler(registry, args):
+    seen_store = SeenStore(args.seen_store)
+    sinks = [open_sink(args.output)] if args.output else []
+    scheduler = CrawlScheduler(registry, seen_store, sinks, max_concurrency=args.concurrency,
+                               use_selenium=args.selenium, max_workers=args.workers)
+    try:
+        if args.once:
+            scheduler.run_once()
+        else:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: scheduler.stop())
+            scheduler.run_forever()
+    finally:
+        scheduler.close()
+        for sink in sinks:
+            sink.close()
+        seen_store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep career sites fresh on an adaptive schedule")
+    parser.add_argument('--registry', default='crawl_registry.sqlite')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="register or update a career URL")
+    add.add_argument('url')
+    add.add_argument('--name')
+    add.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help="starting refresh interval (s)")
+    add.add_argument('--min-interval', type=float, default=DEFAULT_MIN_INTERVAL)
+    add.add_argument('--max-interval', type=float, default=DEFAULT_MAX_INTERVAL)
+    add.add_argument('--priority', type=int, default=0)
+    add.add_argument('--max-jobs', type=int, default=50)
+
+    load = commands.add_parser('import', help="register every company in a batch_runner config")
+    load.add_argument('config')
+
+    remove = commands.add_parser('remove', help="stop tracking a career URL")
+    remove.add_argument('url')
+
+    commands.add_parser('list', help="show registered sites and their cadence")
+
+    run = commands.add_parser('run', help="run the scheduler")
+    run.add_argument('--concurrency', type=int, default=4, help="sites crawled at once")
+    run.add_argument('--workers', type=int, default=1, help="detail-page workers per site")
+    run.add_argument('--seen-store', default='seen_postings.sqlite')
+    run.add_argument('--output', default=None, help="sink for new and changed jobs (.jsonl, .csv, .sqlite, ...)")
+    run.add_argument('--selenium', action='store_true')
+    run.add_argument('--once', action='store_true', help="crawl what is due now, then exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    registry = CrawlRegistry(args.registry)
+    try:
+        if args.command == 'add':
+            registry.add(args.url, args.name, args.interval, args.priority, max_jobs=args.max_jobs,
+                         min_interval=args.min_interval, max_interval=args.max_interval)
+        elif args.command == 'import':
+            from batch_runner import load_config
+            for company in load_config(args.config)['companies']:
+                registry.add(company['url'], company.get('name'), company.get('interval', DEFAULT_INTERVAL),
+                             company.get('priority', 0), company.get('custom_selectors'),
+                             company.get('max_jobs', 50),
+                             company.get('min_interval', DEFAULT_MIN_INTERVAL),
+                             company.get('max_interval', DEFAULT_MAX_INTERVAL))
+        elif args.command == 'remove':
+            registry.remove(args.url)
+        elif args.command == 'list':
+            now = time.time()
+            print(f"{'site':<50} {'prio':>4} {'every h':>8} {'due in h':>9} {'runs':>5} {'changes':>7}  error")
+            for site in registry.sites():
+                print(f"{(site['name'] or site['career_url'])[:50]:<50} {site['priority']:>4} "
+                      f"{site['interval'] / 3600:>8.1f} {(site['next_due'] - now) / 3600:>9.1f} "
+                      f"{site['runs']:>5} {site['changes']:>7}  {site['last_error'] or ''}")
+        else:
+            run_scheduler(registry, args)
+    finally:
+        registry.close()
+
+
+if __name__ == "__main__":
+    main()
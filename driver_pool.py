@@ -0,0 +1,115 @@
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+
+class DriverUnavailable(RuntimeError):
+    """No driver could be borrowed: the pool is closed or Chrome failed to start"""
+
+
+class DriverPool:
+    """Bounded pool of WebDriver instances shared by worker threads"""
+
+    def __init__(self, factory, size=2, max_uses=50):
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.max_uses = max_uses
+        self._idle = queue.LifoQueue()
+        self._uses = {}
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _acquire(self):
+        """Take an idle driver, start a new one if below size, or wait for one"""
+        while True:
+            if self._closed:
+                raise DriverUnavailable("Driver pool is closed")
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    break
+
+            # Poll so waiters notice slots freed by recycled drivers
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+        try:
+            driver = self.factory()
+        except Exception as e:
+            self.logger.error(f"Failed to start WebDriver: {e}")
+            driver = None
+        if driver is None:
+            with self._lock:
+                self._created -= 1
+            raise DriverUnavailable("Could not start a WebDriver")
+        return driver
+
+    def _release(self, driver, broken=False):
+        """Return a driver to the pool, or recycle it if it failed or is worn out"""
+        uses = self._uses.get(id(driver), 0) + 1
+        if broken or self._closed or (self.max_uses and uses >= self.max_uses):
+            if broken:
+                self.logger.info("Recycling WebDriver after failure")
+            self._discard(driver)
+        else:
+            self._uses[id(driver)] = uses
+            self._idle.put(driver)
+
+    def _discard(self, driver):
+        """Quit a driver and free its slot"""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Crashed drivers may not answer quit()
+        with self._lock:
+            self._created -= 1
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver for the duration of the with-block"""
+        driver = self._acquire()
+        try:
+            yield driver
+        except Exception:
+            # Crashes and page-load timeouts leave the browser in an unknown state
+            self._release(driver, broken=True)
+            raise
+        except BaseException:
+            # A closed generator or Ctrl-C doesn't mean the browser is broken
+            self._release(driver)
+            raise
+        else:
+            self._release(driver)
+
+    def warm(self, count=1):
+        """Start up to count drivers ahead of time; returns False if none could start"""
+        started = []
+        for _ in range(min(count, self.size)):
+            try:
+                started.append(self._acquire())
+            except DriverUnavailable:
+                break
+        for driver in started:
+            self._release(driver)
+        return bool(started) or self._created > 0
+
+    def close(self):
+        """Quit every idle driver; busy ones are quit when they are returned"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
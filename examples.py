@@ -1,4 +1,7 @@
+import json
+
 from job_scraper import JobScraper, scrape_company_jobs
+from batch_runner import run_batch
 
 # Example 1: Basic usage for static websites
 def example_basic_scraping():
@@ -6,6 +9,9 @@ def example_basic_scraping():
     career_url = "https://example-company.com/careers"
     jobs = scrape_company_jobs(career_url, use_selenium=False)
     print(f"Found {len(jobs)} jobs")
+    # Jobs behave like dicts; to_dict() gives a real one for JSON
+    if jobs:
+        print(json.dumps(jobs[0].to_dict(), indent=2))
 
 # Example 2: Dynamic website with Selenium
 def example_dynamic_scraping():
@@ -43,7 +49,11 @@ def example_custom_selectors():
 
 # Example 4: Batch scraping multiple companies
 def example_batch_scraping():
-    """Example of scraping multiple company career pages"""
+    """Example of scraping multiple company career pages
+    
+    Companies are spread over a process pool; the same list can live in a
+    JSON file and be run with: python batch_runner.py companies.json
+    """
     
     companies = [
         {"url": "https://company1.com/careers", "use_selenium": False},
@@ -51,21 +61,12 @@ def example_batch_scraping():
         {"url": "https://company3.com/opportunities", "use_selenium": False}
     ]
     
-    all_jobs = []
-    
-    for company in companies:
-        print(f"Scraping {company['url']}...")
-        jobs = scrape_company_jobs(
-            company['url'], 
-            use_selenium=company['use_selenium']
-        )
-        all_jobs.extend(jobs)
-    
     # Save all jobs to single file
-    scraper = JobScraper()
-    scraper.jobs = all_jobs
-    scraper.save_to_excel("all_companies_jobs.xlsx")
+    all_jobs, summaries = run_batch(companies, output="all_companies_jobs.xlsx", max_jobs=50)
     print(f"Total jobs scraped: {len(all_jobs)}")
+    for summary in summaries:
+        print(f"  {summary['url']}: {summary['jobs']} jobs in {summary['elapsed']:.1f}s"
+              + (f" ({summary['error']})" if summary['error'] else ""))
 
 # Example 5: Advanced configuration
 def example_advanced_usage():
@@ -0,0 +1,96 @@
+import logging
+
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+logger = logging.getLogger(__name__)
+
+
+class FastElement:
+    """BeautifulSoup-compatible view of a selectolax node, covering what the scraper uses"""
+
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def name(self):
+        return self.node.tag
+
+    @property
+    def attrs(self):
+        return self.node.attributes
+
+    def iter_elements(self):
+        """Every element below this one in document order (text nodes excluded)"""
+        for node in self.node.traverse(include_text=False):
+            if node is not None and node.tag and not node.tag.startswith(('-', '!', '_')):
+                yield FastElement(node)
+
+    def select(self, selector):
+        return [FastElement(node) for node in self.node.css(selector)]
+
+    def select_one(self, selector):
+        node = self.node.css_first(selector)
+        return FastElement(node) if node is not None else None
+
+    def find(self, name):
+        return self.select_one(name)
+
+    def get_text(self, separator='', strip=False):
+        return self.node.text(deep=True, separator=separator, strip=strip)
+
+    def get(self, key, default=None):
+        value = self.node.attributes.get(key, default)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        return self.node.attributes[key]
+
+    def __str__(self):
+        return self.node.html or ''
+
+
+class FastDocument(FastElement):
+    """Whole-page selectolax (lexbor) document"""
+
+    __slots__ = ()
+
+    def __init__(self, content):
+        from selectolax.lexbor import LexborHTMLParser
+        super().__init__(LexborHTMLParser(content).root)
+
+
+def resolve_backend(backend):
+    """Return backend if its library is importable, else fall back to html.parser"""
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    try:
+        if backend == 'lxml':
+            import lxml  # noqa: F401
+        elif backend == 'selectolax':
+            from selectolax.lexbor import LexborHTMLParser  # noqa: F401
+    except ImportError:
+        logger.warning(f"Parser backend '{backend}' is not installed, using html.parser")
+        return 'html.parser'
+    return backend
+
+
+def parse_html(content, backend='html.parser'):
+    """Parse a page with the chosen backend; selectolax returns a FastDocument"""
+    if backend == 'selectolax':
+        return FastDocument(content)
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(content, backend)
+
+
+def parse_fragment(content, features='html.parser'):
+    """BeautifulSoup tree for an HTML snippet (job descriptions, board API fields)"""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(content or '', features)
+
+
+def bs4_features(backend):
+    """BeautifulSoup tree builder to use for fragments alongside backend"""
+    return 'lxml' if backend == 'lxml' else 'html.parser'
@@ -0,0 +1,229 @@
+import sys
+from collections.abc import MutableMapping
+
+
+# Column order used by every tabular output
+JOB_COLUMNS = ('company_name', 'job_title', 'work_location', 'job_location', 'experience',
+               'job_description', 'responsibilities', 'qualifications', 'apply_link')
+
+NOT_SPECIFIED = sys.intern("Not specified")
+
+# Fields with few distinct values across a run; interning stores each value once
+INTERNED_FIELDS = frozenset(('company_name', 'work_location', 'job_location', 'experience'))
+
+
+def compact(field, value):
+    """Value as stored on a record: low-cardinality strings interned"""
+    if field in INTERNED_FIELDS and type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class JobRecord(MutableMapping):
+    """One posting with a fixed set of fields, stored in slots instead of a per-job dict
+
+    Behaves like the dict it replaces (job['job_title'], .get(), .items(),
+    .copy(), dict(job)), so existing callers keep working. Keys outside
+    JOB_COLUMNS are kept in a small side dict, created only when one is set.
+    Use to_dict() where a real dict is needed, e.g. json.dumps(job.to_dict()).
+    """
+
+    __slots__ = JOB_COLUMNS + ('_extra',)
+
+    def __init__(self, *args, **fields):
+        for field in JOB_COLUMNS:
+            object.__setattr__(self, field, None if field == 'apply_link' else NOT_SPECIFIED)
+        object.__setattr__(self, '_extra', None)
+        if args or fields:
+            self.update(*args, **fields)
+
+    def __getitem__(self, field):
+        if field in JOB_COLUMNS:
+            return getattr(self, field)
+        if self._extra is None:
+            raise KeyError(field)
+        return self._extra[field]
+
+    def __setitem__(self, field, value):
+        if field in JOB_COLUMNS:
+            object.__setattr__(self, field, compact(field, value))
+            return
+        if self._extra is None:
+            object.__setattr__(self, '_extra', {})
+        self._extra[field] = value
+
+    def __delitem__(self, field):
+        if field in JOB_COLUMNS:
+            raise TypeError(f"JobRecord field '{field}' can't be removed")
+        if self._extra is None:
+            raise KeyError(field)
+        del self._extra[field]
+
+    def __iter__(self):
+        yield from JOB_COLUMNS
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        return len(JOB_COLUMNS) + len(self._extra or ())
+
+    def __contains__(self, field):
+        return field in JOB_COLUMNS or (self._extra is not None and field in self._extra)
+
+    def __setattr__(self, field, value):
+        if field not in JOB_COLUMNS:
+            raise AttributeError(f"JobRecord has no field '{field}'")
+        self[field] = value
+
+    def __reduce__(self):
+        return (JobRecord, (self.to_dict(),))
+
+    def copy(self):
+        """Shallow copy, as dict.copy() gave"""
+        return JobRecord(self)
+
+    def to_dict(self):
+        """Plain dict copy, e.g. for JSON"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"JobRecord({self.to_dict()!r})"
+
+
+class JobRow(MutableMapping):
+    """Live view of one row of a JobBatch: reads and writes go straight to its columns
+
+    Behaves like a JobRecord, so scraper.jobs[0]['job_title'] = ... edits the
+    stored job as it did when scraper.jobs was a list of dicts.
+    """
+
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch, index):
+        object.__setattr__(self, '_batch', batch)
+        object.__setattr__(self, '_index', index)
+
+    def _extra(self, create=False):
+        extras = self._batch.extras
+        if extras[self._index] is None and create:
+            extras[self._index] = {}
+        return extras[self._index]
+
+    def __getitem__(self, field):
+        if field in JOB_COLUMNS:
+            return self._batch.columns[field][self._index]
+        extra = self._extra()
+        if extra is None:
+            raise KeyError(field)
+        return extra[field]
+
+    def __setitem__(self, field, value):
+        if field in JOB_COLUMNS:
+            self._batch.columns[field][self._index] = compact(field, value)
+        else:
+            self._extra(create=True)[field] = value
+
+    def __delitem__(self, field):
+        if field in JOB_COLUMNS:
+            raise TypeError(f"JobRecord field '{field}' can't be removed")
+        extra = self._extra()
+        if extra is None:
+            raise KeyError(field)
+        del extra[field]
+
+    def __iter__(self):
+        yield from JOB_COLUMNS
+        extra = self._extra()
+        if extra:
+            yield from list(extra)
+
+    def __len__(self):
+        return len(JOB_COLUMNS) + len(self._extra() or ())
+
+    def __contains__(self, field):
+        if field in JOB_COLUMNS:
+            return True
+        extra = self._extra()
+        return extra is not None and field in extra
+
+    def __getattr__(self, field):
+        if field in JOB_COLUMNS:
+            return self[field]
+        raise AttributeError(field)
+
+    def __setattr__(self, field, value):
+        if field not in JOB_COLUMNS:
+            raise AttributeError(f"JobRecord has no field '{field}'")
+        self[field] = value
+
+    def __reduce__(self):
+        # Pickled rows (e.g. results sent back from batch workers) travel as detached records
+        return (JobRecord, (self.to_dict(),))
+
+    def copy(self):
+        """Detached JobRecord with this row's values"""
+        return JobRecord(self)
+
+    def to_dict(self):
+        """Plain dict copy, e.g. for JSON"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"JobRow({self.to_dict()!r})"
+
+
+class JobBatch:
+    """Jobs stored column by column, for long runs and cheap DataFrame/Arrow conversion
+
+    Supports the list operations callers use on scraper.jobs (append, extend,
+    len, iteration, indexing); rows come back as live JobRow views, so edits
+    made through them are kept.
+    """
+
+    def __init__(self, jobs=()):
+        self.columns = {field: [] for field in JOB_COLUMNS}
+        # Per job, a dict of keys outside JOB_COLUMNS, or None (the usual case)
+        self.extras = []
+        self.extend(jobs)
+
+    def append(self, job_data):
+        for field, values in self.columns.items():
+            values.append(compact(field, job_data.get(field)))
+        extra = {key: value for key, value in job_data.items() if key not in self.columns}
+        self.extras.append(extra or None)
+
+    def extend(self, jobs):
+        for job_data in jobs:
+            self.append(job_data)
+
+    def clear(self):
+        for values in self.columns.values():
+            values.clear()
+        self.extras.clear()
+
+    def __len__(self):
+        return len(self.columns['apply_link'])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        # Normalise negative indexes so the view keeps pointing at the same job as rows are added
+        return JobRow(self, range(len(self))[index])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, field):
+        """All values of one field, in job order"""
+        return self.columns[field]
+
+    def to_dataframe(self):
+        """pandas DataFrame built straight from the column lists"""
+        import pandas as pd
+        return pd.DataFrame(self.columns, columns=list(JOB_COLUMNS))
+
+    def to_arrow(self):
+        """pyarrow Table built straight from the column lists (needs pyarrow)"""
+        import pyarrow as pa
+        return pa.Table.from_pydict(self.columns)
@@ -1,52 +1,207 @@
 import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import pandas as pd
+from requests.adapters import HTTPAdapter
 import time
 import re
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from urllib.parse import urljoin, urlparse
 import logging
 
+from rate_limiter import HostRateLimiter
+from async_fetcher import AsyncFetcher
+from driver_pool import DriverPool, DriverUnavailable
+from page_readiness import PageReadiness
+from board_adapters import detect_board
+from response_cache import CacheMiss
+from seen_store import fingerprint
+from html_parsers import parse_html, resolve_backend, bs4_features
+from selector_engine import SELECTOR_REGISTRY, FIELD_KINDS, mentions_title
+from structured_data import extract_structured_job
+from listing_crawler import ListingCrawler
+from sitemap_discovery import SitemapDiscovery
+from job_record import JOB_COLUMNS, JobRecord, JobBatch
+from run_checkpoint import RunCheckpoint, ResumedListing
+from resource_blocking import BlockingProfile
+from browser_extraction import extract_in_page
+from resilience import (Resilience, RetryPolicy, CircuitBreaker, AdaptiveConcurrency, CircuitOpen,
+                        TransientError, RETRY_STATUSES, parse_retry_after, host_of)
+from run_metrics import RunMetrics, write_atomic
+from run_profiler import RunProfiler
+from chromedriver_cache import chromedriver_path
+
+# Compiled once and shared by every scraper
+WHITESPACE_RE = re.compile(r'\s+')
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience', re.IGNORECASE),
+    re.compile(r'(\d+)\s*to\s*(\d+)\s*years?', re.IGNORECASE),
+    re.compile(r'entry\s*level|junior|senior|mid\s*level', re.IGNORECASE)
+]
+
+DEFAULT_JOB_LINK_SELECTORS = [
+    # Direct job link patterns
+    'a[href*="/job/"]', 'a[href*="/jobs/"]', 'a[href*="/career/"]',
+    'a[href*="/careers/"]', 'a[href*="/position/"]', 'a[href*="/positions/"]',
+    'a[href*="/opening/"]', 'a[href*="/openings/"]', 'a[href*="/apply/"]',
+    
+    # Class-based selectors
+    '.job-link', '.career-link', '.position-link', '.job-card a',
+    '.job-listing a', '.position-card a', '.opening-link',
+    
+    # Data attribute selectors
+    'a[data-job-id]', 'a[data-position-id]', 'a[data-career-id]',
+    
+    # Common job board patterns
+    '.job-title a', '.position-title a', '.role-title a'
+]
+JOB_KEYWORDS = ('job', 'career', 'position', 'apply', 'opening', 'role', 'vacancy')
+EXCLUDE_KEYWORDS = ('login', 'register', 'contact', 'about', 'privacy', 'terms')
+
+DEFAULT_SELECTORS = {
+    'company_name': [
+        'h1', '.company-name', '.company-title', '.employer-name',
+        '[class*="company"]', '[data-testid*="company"]',
+        '.brand-name', '.organization-name', 'title'
+    ],
+    'job_title': [
+        'h1', 'h2', '.job-title', '.position-title', '.role-title',
+        '[class*="title"]', '[class*="role"]', '[class*="position"]',
+        '[data-testid*="title"]', '.posting-headline'
+    ],
+    'work_location': [
+        '[class*="remote"]', '[class*="hybrid"]', '[class*="onsite"]',
+        '[class*="work-type"]', '[class*="employment-type"]',
+        '.location-type', '.work-arrangement'
+    ],
+    'job_location': [
+        '[class*="location"]', '[class*="city"]', '[class*="address"]',
+        '.job-location', '.office-location', '.workplace-location',
+        '[data-testid*="location"]', '.geographic-location'
+    ],
+    'experience': [
+        '[class*="experience"]', '[class*="years"]', '[class*="level"]',
+        '.experience-level', '.seniority-level', '.career-level',
+        '[class*="seniority"]', '.job-level'
+    ],
+    'job_description': [
+        '[class*="description"]', '[class*="summary"]', '.job-content',
+        '.posting-content', '.role-description', '.job-details',
+        '.content', 'main', '.description-text'
+    ],
+    'responsibilities': [
+        '[class*="responsibilities"]', '[class*="duties"]', 
+        '[class*="role"]', '.what-you-will-do', '.key-responsibilities',
+        '.job-responsibilities', '.role-duties'
+    ],
+    'qualifications': [
+        '[class*="qualifications"]', '[class*="requirements"]', 
+        '[class*="skills"]', '.what-we-need', '.required-skills',
+        '.job-requirements', '.minimum-qualifications'
+    ]
+}
+
+SELECTOR_REGISTRY.register('default', DEFAULT_SELECTORS)
+
 class JobScraper:
-    def __init__(self, use_selenium=False, headless=True):
+    def __init__(self, use_selenium=False, headless=True, max_workers=1,
+                 requests_per_second=1.0, burst=1, fetch_backend='requests',
+                 limit_per_host=8, driver_pool_size=None, max_render_wait=10.0,
+                 use_board_apis=True, cache=None, seen_store=None, parser='html.parser',
+                 use_structured_data=True, max_listing_pages=10, use_sitemaps=False,
+                 sinks=None, keep_jobs=True, checkpoint=None, max_retries=2,
+                 adaptive_concurrency=True, block_resources=True, extract_in_browser=False,
+                 metrics=True, profile=None):
+        if fetch_backend not in ('requests', 'asyncio'):
+            raise ValueError(f"Unknown fetch_backend: {fetch_backend}")
         self.use_selenium = use_selenium
+        self.fetch_backend = fetch_backend
+        self.use_board_apis = use_board_apis
+        self.use_structured_data = use_structured_data
+        # Listing pages (or scroll rounds) followed beyond the career URL itself
+        self.max_listing_pages = max_listing_pages
+        # Look for job URLs in robots.txt/sitemaps before rendering the listing page
+        self.use_sitemaps = use_sitemaps
+        # Optional ResponseCache shared across runs; owned by the caller
+        self.cache = cache
+        # Optional SeenStore; when set, scrape_jobs only extracts new or changed postings
+        self.seen_store = seen_store
+        self.last_delta = None
+        # How the last scrape_jobs read its listing: links found, whether it was complete, and the
+        # listing page that failed to load (if any), so callers can tell a quiet site from a down one
+        self.last_listing = None
+        # ResultSinks written as each job is extracted; owned by the caller
+        self.sinks = list(sinks or [])
+        # With keep_jobs=False self.jobs stays empty, so long runs rely on the sinks alone
+        self.keep_jobs = keep_jobs
+        # Optional RunCheckpoint recording run progress for scrape_jobs(resume=True); owned by the caller
+        self.checkpoint = checkpoint
         self.headless = headless
         self.driver = None
+        self.max_workers = max(1, int(max_workers))
+        # One browser per worker unless told otherwise
+        self.driver_pool_size = max(1, int(driver_pool_size or self.max_workers))
+        self.driver_pool = None
+        self.readiness = PageReadiness(max_wait=max_render_wait)
+        # Images, fonts, CSS, media and trackers Chrome may skip (True: BlockingProfile defaults)
+        if block_resources is True:
+            block_resources = BlockingProfile()
+        self.resource_blocking = block_resources or None
+        # Selenium mode: run the selector plan inside the page instead of shipping page_source back
+        self.extract_in_browser = extract_in_browser
+        self._pool_lock = threading.Lock()
+        # Stage timings and counters per host (True: a fresh RunMetrics, False: disabled)
+        if metrics is True:
+            metrics = RunMetrics()
+        self.metrics = metrics or RunMetrics(enabled=False)
+        # Optional RunProfiler wrapped around each scrape_jobs run (True: sampling into ./profiles)
+        if profile is True:
+            profile = RunProfiler()
+        self.profiler = profile or None
+        self.rate_limiter = HostRateLimiter(requests_per_second, burst)
+        # Retries with backoff, a per-host circuit breaker and an AIMD in-flight limit per host
+        self.resilience = Resilience(
+            RetryPolicy(max_retries=max_retries),
+            CircuitBreaker(),
+            AdaptiveConcurrency(maximum=limit_per_host) if adaptive_concurrency else None,
+            metrics=self.metrics
+        )
+        # Fail fast on unreachable hosts; slow responses get the longer read timeout
+        self.request_timeout = (5, 15)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-        self.jobs = []
+        # Size the connection pool so concurrent workers don't block on it
+        adapter = HTTPAdapter(pool_connections=self.max_workers,
+                              pool_maxsize=max(10, self.max_workers))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.async_fetcher = AsyncFetcher(headers=self.session.headers,
+                                          limit_per_host=limit_per_host)
+        self._selenium_executor = None
+        # Column-wise store of everything scraped by this instance
+        self.jobs = JobBatch()
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+        
+        # html.parser, lxml, or selectolax for the selector-only fast path
+        self.parser = resolve_backend(parser)
+        self.bs4_features = bs4_features(self.parser)
+        
+        # Per-field extraction time
+        self.extraction_timings = {}
+        # How often JSON-LD/microdata alone filled a page
+        self.structured_stats = {'pages': 0, 'full': 0, 'partial': 0, 'none': 0}
+        self._timings_lock = threading.Lock()
     
     def setup_selenium(self):
         """Initialize Selenium WebDriver with better error handling"""
         try:
-            from webdriver_manager.chrome import ChromeDriverManager
-            from selenium.webdriver.chrome.service import Service
-            
-            options = Options()
-            if self.headless:
-                options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--disable-web-security')
-            options.add_argument('--allow-running-insecure-content')
-            options.add_argument('--disable-extensions')
-            options.add_argument('--window-size=1920,1080')
-            
-            # Use webdriver-manager to handle ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.set_page_load_timeout(30)
+            self.driver = self.create_driver()
             return self.driver
             
         except Exception as e:
@@ -55,75 +210,275 @@ class JobScraper:
             self.use_selenium = False
             return None
     
+    def create_driver(self, blocking=True, log_network=False):
+        """Start a new headless Chrome instance; raises if Chrome can't start
+        
+        blocking is True for the scraper's resource_blocking profile, False
+        for none, or a BlockingProfile; log_network records Chrome's
+        performance log for measuring transfer sizes.
+        """
+        # Selenium is only imported once a browser is actually needed
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        
+        options = Options()
+        if self.headless:
+            options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--disable-web-security')
+        options.add_argument('--allow-running-insecure-content')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--window-size=1920,1080')
+        if blocking is True:
+            blocking = self.resource_blocking
+        if blocking:
+            blocking.configure(options)
+        if log_network:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
+        # webdriver-manager resolves ChromeDriver once; later drivers and runs reuse the path
+        try:
+            driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+        except SessionNotCreatedException as e:
+            # Usually Chrome updated past the cached driver
+            self.logger.info(f"Re-resolving ChromeDriver after: {e.msg}")
+            driver = webdriver.Chrome(service=Service(chromedriver_path(refresh=True)), options=options)
+        driver.set_page_load_timeout(30)
+        driver.set_script_timeout(30)
+        return driver
+    
+    def get_driver_pool(self):
+        """Start the WebDriver pool on first use; falls back to requests mode if Chrome can't start"""
+        with self._pool_lock:
+            if self.driver_pool is None and self.use_selenium:
+                pool = DriverPool(self.create_driver, size=self.driver_pool_size)
+                if pool.warm(1):
+                    self.driver_pool = pool
+                else:
+                    self.logger.info("Falling back to requests mode")
+                    self.use_selenium = False
+            return self.driver_pool
+    
     def get_page_content(self, url, wait_for_element=None):
         """Get page content with better error handling"""
         try:
             if self.use_selenium:
-                if not self.driver:
-                    self.driver = self.setup_selenium()
-                    if not self.driver:
-                        # Fallback to requests
-                        return self._get_with_requests(url)
+                # Rendered DOMs have no validators, so they are served by TTL only
+                cached = self.cache.lookup(f"render:{url}") if self.cache else None
+                if cached is not None:
+                    self.metrics.count('cache_hits', host=host_of(url), kind='render')
+                    return self.parse_html(cached)
                 
-                self.logger.info(f"Loading page with Selenium: {url}")
-                self.driver.get(url)
+                pool = self.get_driver_pool()
+                if not pool:
+                    # Fallback to requests
+                    self.metrics.count('selenium_fallbacks', host=host_of(url))
+                    return self._get_with_requests(url)
                 
-                if wait_for_element:
-                    try:
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, wait_for_element))
-                        )
-                    except:
-                        pass  # Continue even if wait element not found
+                def render():
+                    # A failed render recycles its driver, so a retry gets a fresh browser
+                    with pool.driver() as driver:
+                        return self._render_with_selenium(driver, url, wait_for_element)
                 
-                time.sleep(3)  # Wait for dynamic content
-                return BeautifulSoup(self.driver.page_source, 'html.parser')
+                # A pool that can't hand out a browser says nothing about the site
+                return self.resilience.call(url, render, transient=(Exception,), local=(DriverUnavailable,))
             else:
                 return self._get_with_requests(url)
                 
+        except CircuitOpen as e:
+            self.logger.warning(str(e))
+            return None
         except Exception as e:
             self.logger.error(f"Error fetching {url}: {str(e)}")
             # Try fallback to requests if Selenium fails
             if self.use_selenium:
                 self.logger.info("Trying fallback to requests...")
+                self.metrics.count('selenium_fallbacks', host=host_of(url))
                 return self._get_with_requests(url)
             return None
     
+    def _render_with_selenium(self, driver, url, wait_for_element=None):
+        """Load url in the given driver and parse the rendered DOM"""
+        self._load_in_browser(driver, url, wait_for_element)
+        page_source = driver.page_source
+        self.metrics.count('rendered_bytes', len(page_source), host=host_of(url))
+        if self.cache:
+            self.cache.store(f"render:{url}", page_source)
+        return self.parse_html(page_source)
+    
+    def _load_in_browser(self, driver, url, wait_for_element=None):
+        """Navigate driver to url and wait until dynamic content has settled"""
+        # Respectful per-host delay
+        self.throttle(url)
+        self.logger.info(f"Loading page with Selenium: {url}")
+        self.block_resources(driver, url)
+        host = host_of(url)
+        with self.metrics.timer('page_load_seconds', host=host):
+            driver.get(url)
+        
+        # Return as soon as dynamic content has settled
+        with self.metrics.timer('render_wait_seconds', host=host):
+            self.readiness.wait(driver, url, wait_for_element)
+    
+    def block_resources(self, driver, url):
+        """Apply the resource-blocking profile before driver navigates to url"""
+        if self.resource_blocking:
+            self.resource_blocking.apply(driver, url)
+    
     def _get_with_requests(self, url):
         """Fallback method using requests"""
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return self.parse_html(self.fetch_bytes(url))
         except Exception as e:
             self.logger.error(f"Requests also failed for {url}: {e}")
             return None
     
-    def find_job_links(self, career_url, job_link_selectors=None):
-        """Enhanced job link discovery with better patterns"""
+    def parse_html(self, content):
+        """Parse a fetched page with the configured parser backend"""
+        with self.metrics.timer('parse_seconds', parser=self.parser):
+            return parse_html(content, self.parser)
+    
+    def throttle(self, url):
+        """Wait for the per-host rate limit, recording how long it held us up"""
+        self.metrics.observe('rate_limit_wait_seconds', self.rate_limiter.acquire(url), host=host_of(url))
+    
+    async def throttle_async(self, url):
+        delay = await self.rate_limiter.acquire_async(url)
+        self.metrics.observe('rate_limit_wait_seconds', delay, host=host_of(url))
+    
+    def fetch_bytes(self, url):
+        """GET url through the response cache, revalidating stale entries with conditional requests"""
+        entry = None
+        headers = {}
+        host = host_of(url)
+        if self.cache:
+            body = self.cache.lookup(url)
+            if body is not None:
+                self.metrics.count('cache_hits', host=host, kind='fresh')
+                return body
+            entry = self.cache.get(url)
+            headers = self.cache.conditional_headers(entry)
+            self.metrics.count('cache_misses', host=host)
+        
+        response = self.http_request('GET', url, headers=headers)
+        if response.status_code == 304 and entry:
+            self.metrics.count('cache_hits', host=host, kind='revalidated')
+            self.cache.touch(url)
+            return entry['body']
+        response.raise_for_status()
+        self.metrics.count('bytes_received', len(response.content), host=host)
+        
+        if self.cache:
+            self.cache.store(url, response.content, response.headers.get('ETag'),
+                             response.headers.get('Last-Modified'))
+        return response.content
+    
+    def http_request(self, method, url, **kwargs):
+        """One HTTP request through the rate limiter, retries, circuit breaker and AIMD limit"""
+        def attempt():
+            try:
+                with self.metrics.timer('fetch_seconds', host=host_of(url), backend='requests'):
+                    response = self.session.request(method, url, timeout=self.request_timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.metrics.count('fetch_errors', host=host_of(url), reason=type(e).__name__)
+                raise TransientError(f"{type(e).__name__}: {e}") from e
+            self.metrics.count('responses', host=host_of(url), status=response.status_code)
+            if response.status_code in RETRY_STATUSES:
+                raise TransientError(f"HTTP {response.status_code} for {url}", response.status_code,
+                                     parse_retry_after(response.headers.get('Retry-After')))
+            return response
+        
+        # Respectful per-host delay, taken per attempt
+        return self.resilience.call(url, attempt, throttle=self.throttle)
+    
+    async def get_page_content_async(self, url, wait_for_element=None):
+        """Awaitable counterpart of get_page_content"""
+        if self.use_selenium:
+            # WebDriver calls block, so run them on a thread per pooled driver
+            if self._selenium_executor is None:
+                self._selenium_executor = ThreadPoolExecutor(max_workers=self.driver_pool_size)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._selenium_executor, self.get_page_content,
+                                              url, wait_for_element)
+        
+        async def attempt():
+            start = time.perf_counter()
+            try:
+                return await self.async_fetcher.fetch_response(url, headers)
+            finally:
+                self.metrics.observe('fetch_seconds', time.perf_counter() - start, host=host, backend='asyncio')
+        
+        try:
+            entry = None
+            headers = {}
+            host = host_of(url)
+            if self.cache:
+                body = self.cache.lookup(url)
+                if body is not None:
+                    self.metrics.count('cache_hits', host=host, kind='fresh')
+                    return self.parse_html(body)
+                entry = self.cache.get(url)
+                headers = self.cache.conditional_headers(entry)
+                self.metrics.count('cache_misses', host=host)
+            
+            status, content, response_headers = await self.resilience.call_async(
+                url, attempt, throttle=self.throttle_async
+            )
+            self.metrics.count('responses', host=host, status=status)
+            if status == 304 and entry:
+                self.metrics.count('cache_hits', host=host, kind='revalidated')
+                self.cache.touch(url)
+                content = entry['body']
+            else:
+                self.metrics.count('bytes_received', len(content), host=host)
+                if self.cache:
+                    self.cache.store(url, content, response_headers.get('ETag'),
+                                     response_headers.get('Last-Modified'))
+            return self.parse_html(content)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Async fetch failed for {url}: {e}")
+            return None
+    
+    def find_job_links(self, career_url, job_link_selectors=None, max_links=None):
+        """Enhanced job link discovery with better patterns, following pagination"""
+        if self.use_sitemaps:
+            job_links = SitemapDiscovery(self).discover(career_url)
+            if job_links:
+                return job_links[:max_links] if max_links else job_links
+        
+        crawler = ListingCrawler(self, max_pages=self.max_listing_pages,
+                                 job_link_selectors=job_link_selectors)
+        job_links = []
+        for batch in crawler.iter_links(career_url, max_links=max_links):
+            job_links.extend(batch)
+        
+        self.logger.info(f"Found {len(job_links)} job links across {crawler.pages} listing page(s)")
+        return job_links[:max_links] if max_links else job_links
+    
+    async def find_job_links_async(self, career_url, job_link_selectors=None):
+        """Awaitable counterpart of find_job_links"""
+        soup = await self.get_page_content_async(career_url, wait_for_element='.job, .career, .position')
+        return self.collect_job_links(soup, career_url, job_link_selectors)
+    
+    def collect_job_links(self, soup, career_url, job_link_selectors=None, listings=None, limit=100):
+        """Pick job links out of a parsed career page
+        
+        If listings is a dict it is filled with a fingerprint of each link's
+        listing entry, used by incremental crawls to spot unchanged postings.
+        """
         if not job_link_selectors:
-            job_link_selectors = [
-                # Direct job link patterns
-                'a[href*="/job/"]', 'a[href*="/jobs/"]', 'a[href*="/career/"]',
-                'a[href*="/careers/"]', 'a[href*="/position/"]', 'a[href*="/positions/"]',
-                'a[href*="/opening/"]', 'a[href*="/openings/"]', 'a[href*="/apply/"]',
-                
-                # Class-based selectors
-                '.job-link', '.career-link', '.position-link', '.job-card a',
-                '.job-listing a', '.position-card a', '.opening-link',
-                
-                # Data attribute selectors
-                'a[data-job-id]', 'a[data-position-id]', 'a[data-career-id]',
-                
-                # Common job board patterns
-                '.job-title a', '.position-title a', '.role-title a'
-            ]
+            job_link_selectors = DEFAULT_JOB_LINK_SELECTORS
         
-        soup = self.get_page_content(career_url, wait_for_element='.job, .career, .position')
         if not soup:
             return []
         
-        job_links = set()
+        job_links = {}
         
         # Try each selector pattern
         for selector in job_link_selectors:
@@ -133,48 +488,140 @@ class JobScraper:
                     href = link.get('href')
                     if href:
                         full_url = urljoin(career_url, href)
-                        job_links.add(full_url)
+                        job_links[full_url] = None
+                        if listings is not None and full_url not in listings:
+                            listings[full_url] = fingerprint(link.get_text(' ', strip=True))
             except Exception as e:
                 continue
         
         # Enhanced filtering
-        filtered_links = []
-        job_keywords = ['job', 'career', 'position', 'apply', 'opening', 'role', 'vacancy']
-        exclude_keywords = ['login', 'register', 'contact', 'about', 'privacy', 'terms']
-        
-        for link in job_links:
-            link_lower = link.lower()
-            if (any(keyword in link_lower for keyword in job_keywords) and
-                not any(keyword in link_lower for keyword in exclude_keywords)):
-                filtered_links.append(link)
+        filtered_links = [link for link in job_links if self.is_job_url(link)]
         
-        # Remove duplicates and limit
-        filtered_links = list(set(filtered_links))[:100]  # Limit to 100 jobs
+        # Remove duplicates (keeping page order) and limit
+        filtered_links = list(dict.fromkeys(filtered_links))
+        if limit:
+            filtered_links = filtered_links[:limit]
         
         self.logger.info(f"Found {len(filtered_links)} job links")
         return filtered_links
     
+    def is_job_url(self, url):
+        """Keyword filter deciding whether a discovered URL looks like a job posting"""
+        url_lower = url.lower()
+        return (any(keyword in url_lower for keyword in JOB_KEYWORDS) and
+                not any(keyword in url_lower for keyword in EXCLUDE_KEYWORDS))
+    
     def extract_job_data(self, job_url, selectors=None):
         """Enhanced job data extraction with smart fallbacks"""
-        if not selectors:
-            selectors = self.get_default_selectors()
-        
+        if self.use_selenium and self.extract_in_browser:
+            job_data = self.extract_job_data_in_browser(job_url, selectors)
+            if job_data is not None:
+                return self.emit(job_data)
         soup = self.get_page_content(job_url)
+        return self.emit(self.parse_job_data(soup, job_url, selectors))
+    
+    def extract_job_data_in_browser(self, job_url, selectors=None):
+        """Render job_url and extract its fields in the page itself; None means use page_source instead"""
+        try:
+            if self.cache and self.cache.lookup(f"render:{job_url}") is not None:
+                return None
+        except CacheMiss:
+            # Offline replay can't render; the page_source path reports the miss
+            return None
+        pool = self.get_driver_pool()
+        if not pool:
+            return None
+        
+        def render():
+            with pool.driver() as driver:
+                self._load_in_browser(driver, job_url)
+                return self.parse_in_page(driver, job_url, selectors)
+        
+        try:
+            return self.resilience.call(job_url, render, transient=(Exception,), local=(DriverUnavailable,))
+        except CircuitOpen as e:
+            self.logger.warning(str(e))
+            return None
+        except Exception as e:
+            self.logger.error(f"In-browser extraction failed for {job_url}: {e}")
+            return None
+    
+    def parse_in_page(self, driver, job_url, selectors=None):
+        """Build the JobRecord from the page loaded in driver with one execute_script round-trip"""
+        plan = self.get_selector_plan(selectors or self.get_default_selectors())
+        timings = {}
+        start = time.perf_counter()
+        page = extract_in_page(driver, plan)
+        timings['in_browser'] = time.perf_counter() - start
+        
+        structured = {}
+        if self.use_structured_data:
+            start = time.perf_counter()
+            markup = page.structured_markup()
+            if markup:
+                structured = extract_structured_job(self.parse_html(markup), self.bs4_features)
+            timings['structured_data'] = time.perf_counter() - start
+            self.record_structured_hit(len(structured))
+        
+        values = {}
+        for field in FIELD_KINDS:
+            if field in structured:
+                continue
+            start = time.perf_counter()
+            accept = self._long_value if FIELD_KINDS[field] == 'long' else self._short_value
+            values[field] = plan.choose(field, page.candidates(field), accept, self,
+                                        page.title_text, page.page_text)
+            timings[field] = time.perf_counter() - start
+        values.update(structured)
+        job_data = JobRecord(values, apply_link=job_url)
+        self.record_extraction_timings(timings)
+        
+        job_data = self.apply_title_fallbacks(page.title, job_data)
+        return self.clean_job_data(job_data)
+    
+    async def extract_job_data_async(self, job_url, selectors=None):
+        """Awaitable counterpart of extract_job_data"""
+        soup = await self.get_page_content_async(job_url)
+        return self.emit(self.parse_job_data(soup, job_url, selectors))
+    
+    def emit(self, job_data):
+        """Hand an extracted job to every sink; a failing sink is logged, not fatal"""
+        if job_data:
+            self.metrics.count('jobs_extracted', host=host_of(job_data.get('apply_link') or ''))
+            for sink in self.sinks:
+                try:
+                    sink.write(job_data)
+                except Exception as e:
+                    self.logger.error(f"Writing {job_data.get('apply_link')} to {sink.path} failed: {e}")
+        return job_data
+    
+    def keep(self, jobs):
+        """Add jobs to self.jobs unless keep_jobs is off"""
+        if self.keep_jobs:
+            self.jobs.extend(jobs)
+    
+    def parse_job_data(self, soup, job_url, selectors=None):
+        """Build the JobRecord from an already parsed detail page"""
         if not soup:
             return None
+        if not selectors:
+            selectors = self.get_default_selectors()
         
-        # Extract basic data
-        job_data = {
-            'company_name': self.extract_text(soup, selectors['company_name']),
-            'job_title': self.extract_text(soup, selectors['job_title']),
-            'work_location': self.extract_work_location(soup, selectors['work_location']),
-            'job_location': self.extract_text(soup, selectors['job_location']),
-            'experience': self.extract_experience(soup, selectors['experience']),
-            'job_description': self.extract_long_text(soup, selectors['job_description']),
-            'responsibilities': self.extract_long_text(soup, selectors['responsibilities']),
-            'qualifications': self.extract_long_text(soup, selectors['qualifications']),
-            'apply_link': job_url
-        }
+        timings = {}
+        structured = {}
+        if self.use_structured_data:
+            # schema.org JobPosting data is exact; selectors only fill what it lacks
+            start = time.perf_counter()
+            structured = extract_structured_job(soup, self.bs4_features)
+            timings['structured_data'] = time.perf_counter() - start
+            self.record_structured_hit(len(structured))
+        
+        # Extract basic data in one pass over the DOM
+        missing = [field for field in FIELD_KINDS if field not in structured]
+        values = self.get_selector_plan(selectors).run(soup, self, timings, fields=missing)
+        values.update(structured)
+        job_data = JobRecord(values, apply_link=job_url)
+        self.record_extraction_timings(timings)
         
         # Smart fallbacks for missing data
         job_data = self.apply_smart_fallbacks(soup, job_data)
@@ -182,134 +629,152 @@ class JobScraper:
         
         return job_data
     
+    def get_selector_plan(self, selectors):
+        """Compiled plan for a selector dict or registered name, shared across scrapers"""
+        return SELECTOR_REGISTRY.get_plan(selectors)
+    
+    def record_extraction_timings(self, timings):
+        """Accumulate per-field extraction time across pages"""
+        with self._timings_lock:
+            for field, seconds in timings.items():
+                total, count = self.extraction_timings.get(field, (0.0, 0))
+                self.extraction_timings[field] = (total + seconds, count + 1)
+        for field, seconds in timings.items():
+            self.metrics.observe('extract_seconds', seconds, field=field)
+    
+    def record_structured_hit(self, field_count):
+        """Count pages fully, partly or not at all satisfied by structured data"""
+        if field_count >= len(FIELD_KINDS):
+            outcome = 'full'
+        elif field_count:
+            outcome = 'partial'
+        else:
+            outcome = 'none'
+        with self._timings_lock:
+            self.structured_stats['pages'] += 1
+            self.structured_stats[outcome] += 1
+    
+    def extraction_timing_summary(self):
+        """Mean milliseconds per page spent on each field (dom_walk is the shared DOM pass)"""
+        with self._timings_lock:
+            return {field: total / count * 1000
+                    for field, (total, count) in self.extraction_timings.items() if count}
+    
     def extract_work_location(self, soup, selectors):
         """Extract work location with pattern matching"""
         text = self.extract_text(soup, selectors)
         if text == "Not specified":
             # Look for common remote/hybrid patterns in any text
-            page_text = soup.get_text().lower()
-            if 'remote' in page_text:
-                return 'Remote'
-            elif 'hybrid' in page_text:
-                return 'Hybrid'
-            elif 'on-site' in page_text or 'onsite' in page_text:
-                return 'On-site'
+            return self._work_location_from_text(soup.get_text()) or text
         return text
     
+    def _work_location_from_text(self, page_text):
+        """Remote/hybrid/on-site keyword match over the page text"""
+        page_text = page_text.lower()
+        if 'remote' in page_text:
+            return 'Remote'
+        elif 'hybrid' in page_text:
+            return 'Hybrid'
+        elif 'on-site' in page_text or 'onsite' in page_text:
+            return 'On-site'
+        return None
+    
     def extract_experience(self, soup, selectors):
         """Extract experience with pattern matching"""
         text = self.extract_text(soup, selectors)
         if text == "Not specified":
             # Look for experience patterns in page text
-            page_text = soup.get_text()
-            exp_patterns = [
-                r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-                r'(\d+)\s*to\s*(\d+)\s*years?',
-                r'entry\s*level|junior|senior|mid\s*level'
-            ]
-            for pattern in exp_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    return match.group(0)
+            return self._experience_from_text(soup.get_text()) or text
         return text
     
+    def _experience_from_text(self, page_text):
+        """First experience-like phrase in the page text"""
+        for pattern in EXPERIENCE_PATTERNS:
+            match = pattern.search(page_text)
+            if match:
+                return match.group(0)
+        return None
+    
     def extract_long_text(self, soup, selectors):
         """Extract longer text content like descriptions"""
         for selector in selectors:
             elements = soup.select(selector)
             for element in elements:
-                text = element.get_text(separator='\n', strip=True)
-                text = re.sub(r'\s+', ' ', text).strip()
-                if len(text) > 50:  # Minimum length for meaningful content
-                    return text[:2000]  # Limit length
+                text = self._long_text(element)
+                if text:
+                    return text
         return "Not specified"
     
+    def _long_text(self, element):
+        """Element text if it is long enough to be a description, else None"""
+        return self._long_value(element.get_text(separator='\n', strip=True))
+    
+    def _long_value(self, text):
+        """_long_text for text already taken from an element (e.g. in the browser)"""
+        text = WHITESPACE_RE.sub(' ', text).strip()
+        if len(text) > 50:  # Minimum length for meaningful content
+            return text[:2000]  # Limit length
+        return None
+    
     def apply_smart_fallbacks(self, soup, job_data):
         """Apply smart fallbacks for missing data"""
+        title = soup.find('title')
+        return self.apply_title_fallbacks(title.get_text() if title else None, job_data)
+    
+    def apply_title_fallbacks(self, title_text, job_data):
+        """Fill a missing company name or job title from the page's <title> text"""
+        if title_text is None:
+            return job_data
         # If company name is missing, try to extract from URL or title
         if job_data['company_name'] == "Not specified":
-            title = soup.find('title')
-            if title:
-                title_text = title.get_text()
-                # Common patterns: "Job Title - Company Name" or "Company Name | Job Title"
-                if ' - ' in title_text:
-                    job_data['company_name'] = title_text.split(' - ')[-1].strip()
-                elif ' | ' in title_text:
-                    job_data['company_name'] = title_text.split(' | ')[0].strip()
+            # Common patterns: "Job Title - Company Name" or "Company Name | Job Title"
+            if ' - ' in title_text:
+                job_data['company_name'] = title_text.split(' - ')[-1].strip()
+            elif ' | ' in title_text:
+                job_data['company_name'] = title_text.split(' | ')[0].strip()
         
         # If job title is missing, try title tag
         if job_data['job_title'] == "Not specified":
-            title = soup.find('title')
-            if title:
-                title_text = title.get_text()
-                if ' - ' in title_text:
-                    job_data['job_title'] = title_text.split(' - ')[0].strip()
-                elif ' | ' in title_text:
-                    job_data['job_title'] = title_text.split(' | ')[-1].strip()
+            if ' - ' in title_text:
+                job_data['job_title'] = title_text.split(' - ')[0].strip()
+            elif ' | ' in title_text:
+                job_data['job_title'] = title_text.split(' | ')[-1].strip()
         
         return job_data
     
     def get_default_selectors(self):
-        """Enhanced CSS selectors for better job data extraction"""
-        return {
-            'company_name': [
-                'h1', '.company-name', '.company-title', '.employer-name',
-                '[class*="company"]', '[data-testid*="company"]',
-                '.brand-name', '.organization-name', 'title'
-            ],
-            'job_title': [
-                'h1', 'h2', '.job-title', '.position-title', '.role-title',
-                '[class*="title"]', '[class*="role"]', '[class*="position"]',
-                '[data-testid*="title"]', '.posting-headline'
-            ],
-            'work_location': [
-                '[class*="remote"]', '[class*="hybrid"]', '[class*="onsite"]',
-                '[class*="work-type"]', '[class*="employment-type"]',
-                '.location-type', '.work-arrangement'
-            ],
-            'job_location': [
-                '[class*="location"]', '[class*="city"]', '[class*="address"]',
-                '.job-location', '.office-location', '.workplace-location',
-                '[data-testid*="location"]', '.geographic-location'
-            ],
-            'experience': [
-                '[class*="experience"]', '[class*="years"]', '[class*="level"]',
-                '.experience-level', '.seniority-level', '.career-level',
-                '[class*="seniority"]', '.job-level'
-            ],
-            'job_description': [
-                '[class*="description"]', '[class*="summary"]', '.job-content',
-                '.posting-content', '.role-description', '.job-details',
-                '.content', 'main', '.description-text'
-            ],
-            'responsibilities': [
-                '[class*="responsibilities"]', '[class*="duties"]', 
-                '[class*="role"]', '.what-you-will-do', '.key-responsibilities',
-                '.job-responsibilities', '.role-duties'
-            ],
-            'qualifications': [
-                '[class*="qualifications"]', '[class*="requirements"]', 
-                '[class*="skills"]', '.what-we-need', '.required-skills',
-                '.job-requirements', '.minimum-qualifications'
-            ]
-        }
+        """Enhanced CSS selectors for better job data extraction (shared, don't mutate)"""
+        return DEFAULT_SELECTORS
     
     def extract_text(self, soup, selectors):
         """Enhanced text extraction with better filtering"""
         for selector in selectors:
             elements = soup.select(selector)
             for element in elements:
-                text = element.get_text(separator=' ', strip=True)
-                # Clean and validate text
-                text = re.sub(r'\s+', ' ', text).strip()
-                
-                # Skip if too short, too long, or contains unwanted content
-                if (text and len(text) > 2 and len(text) < 5000 and 
-                    not text.lower().startswith(('cookie', 'privacy', 'terms'))):
+                text = self._short_text(element)
+                if text:
                     return text
         
-        # Fallback: try to extract from page title or meta description
-        if 'title' in str(selectors):
+        return self._title_fallback(soup, mentions_title(selectors))
+    
+    def _short_text(self, element):
+        """Cleaned element text if it looks like a field value, else None"""
+        return self._short_value(element.get_text(separator=' ', strip=True))
+    
+    def _short_value(self, text):
+        """_short_text for text already taken from an element (e.g. in the browser)"""
+        # Clean and validate text
+        text = WHITESPACE_RE.sub(' ', text).strip()
+        
+        # Skip if too short, too long, or contains unwanted content
+        if (text and len(text) > 2 and len(text) < 5000 and 
+            not text.lower().startswith(('cookie', 'privacy', 'terms'))):
+            return text
+        return None
+    
+    def _title_fallback(self, soup, has_title):
+        """Fallback: try to extract from page title"""
+        if has_title:
             title = soup.find('title')
             if title:
                 return title.get_text(strip=True)
@@ -321,7 +786,7 @@ class JobScraper:
         for key, value in job_data.items():
             if isinstance(value, str):
                 # Remove extra whitespace and newlines
-                value = re.sub(r'\s+', ' ', value).strip()
+                value = WHITESPACE_RE.sub(' ', value).strip()
                 # Limit description length
                 if key in ['job_description', 'responsibilities', 'qualifications'] and len(value) > 1000:
                     value = value[:1000] + "..."
@@ -329,51 +794,395 @@ class JobScraper:
         
         return job_data
     
-    def scrape_jobs(self, career_url, custom_selectors=None, max_jobs=50):
-        """Main method to scrape all jobs from a career website"""
+    def scrape_jobs(self, career_url, custom_selectors=None, max_jobs=50, resume=False):
+        """Main method to scrape all jobs from a career website
+        
+        With a seen_store, postings whose listing entry is unchanged since the
+        last crawl are skipped before their detail page is fetched, only added
+        and changed jobs are returned, and the full delta is kept in last_delta.
+        
+        With a checkpoint, discovered links and finished detail pages are saved
+        as the run goes; resume=True continues an interrupted run without
+        re-fetching pages it already finished.
+        """
+        if resume and self.checkpoint is None:
+            raise ValueError("resume=True needs a JobScraper checkpoint")
+        self.last_listing = None
+        with self.profiled(career_url):
+            return self._scrape_jobs(career_url, custom_selectors, max_jobs, resume)
+    
+    def profiled(self, label):
+        """Context manager profiling the block with self.profiler, if there is one"""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.session(self, label)
+    
+    def _scrape_jobs(self, career_url, custom_selectors, max_jobs, resume):
+        if self.fetch_backend == 'asyncio':
+            return asyncio.run(self._run_async(
+                self.scrape_jobs_async(career_url, custom_selectors, max_jobs, resume)))
+        
         self.logger.info(f"Starting job scraping for: {career_url}")
         
-        # Find job links
-        job_links = self.find_job_links(career_url)
+        checkpoint = self.checkpoint
+        listings = {}
+        resumed = None
+        done = {}
+        if checkpoint:
+            checkpoint.start(career_url, resume)
+            saved_links, listings, links_done, listing_complete = checkpoint.saved_links(career_url)
+            done = checkpoint.completed(career_url)
+            if links_done:
+                resumed = ResumedListing(saved_links, listing_complete)
+            if resume:
+                self.logger.info(f"Resuming: {len(saved_links)} links saved, {len(done)} pages already done")
+        
+        # Known job boards are read from their listing APIs before rendering anything
+        adapter = None
+        if self.use_board_apis and resumed is None:
+            adapter = detect_board(self, career_url)
+        sitemaps = None
+        if adapter is None and self.use_sitemaps and resumed is None:
+            # A few sitemap fetches can replace rendering the listing entirely
+            sitemaps = SitemapDiscovery(self)
+            if not sitemaps.discover(career_url, listings):
+                sitemaps = None
+        
+        soup = None
+        if adapter is None and sitemaps is None and resumed is None:
+            soup = self.get_page_content(career_url, wait_for_element='.job, .career, .position')
+            if self.use_board_apis:
+                adapter = detect_board(self, career_url, soup)
+        
+        if adapter is not None:
+            board_jobs = self.scrape_board(adapter, max_jobs)
+            if board_jobs:
+                # A board is read in a couple of API calls, so there is nothing worth resuming
+                if checkpoint:
+                    checkpoint.finish(career_url)
+                return self.finish_board(career_url, board_jobs, max_jobs)
+            if soup is None:
+                soup = self.get_page_content(career_url, wait_for_element='.job, .career, .position')
+        
+        start = time.perf_counter()
+        workers = self.max_workers
+        if self.use_selenium:
+            # More threads than browsers would only queue on the pool
+            workers = min(workers, self.driver_pool_size)
+        
+        def scrape_one(position, job_url):
+            if job_url in done:
+                return done[job_url]
+            self.logger.info(f"Scraping job {position}: {job_url}")
+            job_data = self.extract_job_data(job_url, custom_selectors)
+            if checkpoint:
+                checkpoint.record(career_url, job_url, job_data)
+            return job_data
+        
+        # Listing pages stream links into extraction as they are discovered
+        crawler = resumed or sitemaps or ListingCrawler(self, max_pages=self.max_listing_pages)
+        link_batches = crawler.iter_links(career_url, soup, listings, max_links=max_jobs)
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        job_links = []
+        skipped = []
+        results = []
+        try:
+            for batch in link_batches:
+                if checkpoint and resumed is None:
+                    checkpoint.add_links(career_url, batch, listings)
+                # Limit number of jobs to scrape
+                batch = batch[:max_jobs - len(job_links) - len(skipped)]
+                batch, batch_skipped = self.skip_unchanged(batch, listings)
+                skipped.extend(batch_skipped)
+                
+                for job_url in batch:
+                    job_links.append(job_url)
+                    if executor:
+                        results.append(executor.submit(scrape_one, len(job_links), job_url))
+                    else:
+                        results.append(scrape_one(len(job_links), job_url))
+                
+                if len(job_links) + len(skipped) >= max_jobs:
+                    break
+            
+            if checkpoint and resumed is None:
+                checkpoint.links_found(career_url, crawler.complete)
+            
+            # Futures are collected in discovery order regardless of completion order
+            if executor:
+                results = [future.result() for future in results]
+        finally:
+            link_batches.close()
+            if executor:
+                # On Ctrl-C or a crash, let running pages finish (and checkpoint) but start no more
+                executor.shutdown(wait=True, cancel_futures=True)
+        
+        self.last_listing = {'links': len(job_links) + len(skipped), 'complete': crawler.complete,
+                             'failed_url': getattr(crawler, 'failed_url', None)}
+        if not job_links and not skipped:
+            self.logger.warning("No job links found. Try using Selenium for dynamic content.")
+            self.finish_empty_listing(career_url, listings)
+            if checkpoint:
+                checkpoint.finish(career_url)
+            return []
+        
+        scraped_jobs = [job_data for job_data in results if job_data]
+        elapsed = time.perf_counter() - start
+        
+        source = 'sitemap' if sitemaps else 'listing page'
+        self.logger.info(f"Successfully scraped {len(scraped_jobs)} jobs from {crawler.pages} {source}(s)")
+        self.log_throughput(len(job_links), len(scraped_jobs), elapsed, workers)
+        
+        if self.seen_store:
+            scraped_jobs = self.finish_incremental(career_url, scraped_jobs, list(crawler.seen), listings,
+                                                   skipped, listing_complete=crawler.complete,
+                                                   extend_jobs=True)
+        else:
+            self.keep(scraped_jobs)
+        if checkpoint:
+            checkpoint.finish(career_url)
+        return scraped_jobs
+    
+    def skip_unchanged(self, job_links, listings):
+        """Split links into those to extract and those the seen store says are unchanged"""
+        if not self.seen_store:
+            return job_links, []
+        skipped = [url for url in job_links if self.seen_store.is_unchanged(url, listings.get(url))]
+        job_links = [url for url in job_links if url not in skipped]
+        self.logger.info(f"Skipping {len(skipped)} unchanged postings, extracting {len(job_links)}")
+        return job_links, skipped
+    
+    def finish_incremental(self, career_url, jobs, listed_urls, listings=None, skipped=(),
+                           listing_complete=True, extend_jobs=False):
+        """Record jobs in the seen store, compute the delta and return the added and changed jobs"""
+        listings = listings or {}
+        delta = {'added': [], 'changed': [], 'removed': [], 'unchanged': len(skipped)}
+        
+        for job_data in jobs:
+            status = self.seen_store.record(career_url, job_data, listings.get(job_data['apply_link']))
+            if status == 'unchanged':
+                delta['unchanged'] += 1
+            else:
+                delta[status].append(job_data)
+        self.seen_store.mark_seen(skipped)
+        
+        # A truncated listing can't tell us what disappeared
+        if listing_complete:
+            delta['removed'] = self.seen_store.remove_missing(career_url, listed_urls)
         
+        self.last_delta = delta
+        self.logger.info(f"Delta: {len(delta['added'])} added, {len(delta['changed'])} changed, "
+                         f"{len(delta['removed'])} removed, {delta['unchanged']} unchanged")
+        
+        changed_jobs = delta['added'] + delta['changed']
+        if extend_jobs:
+            self.keep(changed_jobs)
+        return changed_jobs
+    
+    def finish_empty_listing(self, career_url, listings):
+        """A listing that loaded completely but lists nothing: report every stored posting as removed"""
+        if self.seen_store and self.last_listing['complete'] and not self.last_listing['failed_url']:
+            self.finish_incremental(career_url, [], [], listings, listing_complete=True)
+    
+    def scrape_board(self, adapter, max_jobs=50):
+        """Pull postings from a job board's structured endpoints; returns [] so callers can fall back"""
+        self.logger.info(f"Detected {adapter.name} board, using its listing API")
+        start = time.perf_counter()
+        try:
+            jobs = adapter.fetch_jobs(max_jobs)
+        except Exception as e:
+            self.logger.error(f"{adapter.name} API failed for {adapter.career_url}: {e}")
+            return []
+        
+        elapsed = time.perf_counter() - start
+        self.logger.info(f"Successfully scraped {len(jobs)} jobs from the {adapter.name} API in {elapsed:.1f}s")
+        return jobs
+    
+    def finish_board(self, career_url, board_jobs, max_jobs):
+        """Keep jobs pulled from a board API, applying the incremental delta when enabled"""
+        for job_data in board_jobs:
+            self.emit(job_data)
+        self.last_listing = {'links': len(board_jobs), 'complete': len(board_jobs) < max_jobs, 'failed_url': None}
+        if self.seen_store:
+            return self.finish_incremental(career_url, board_jobs,
+                                           [job['apply_link'] for job in board_jobs],
+                                           listing_complete=len(board_jobs) < max_jobs,
+                                           extend_jobs=True)
+        self.keep(board_jobs)
+        return board_jobs
+    
+    async def scrape_jobs_async(self, career_url, custom_selectors=None, max_jobs=50, resume=False):
+        """Awaitable counterpart of scrape_jobs; detail pages are fetched concurrently"""
+        if resume and self.checkpoint is None:
+            raise ValueError("resume=True needs a JobScraper checkpoint")
+        self.logger.info(f"Starting async job scraping for: {career_url}")
+        
+        checkpoint = self.checkpoint
+        listings = {}
+        job_links = []
+        done = {}
+        failed_url = None
+        self.last_listing = None
+        if checkpoint:
+            checkpoint.start(career_url, resume)
+            saved_links, listings, links_done, listing_complete = checkpoint.saved_links(career_url)
+            done = checkpoint.completed(career_url)
+            if links_done:
+                job_links = saved_links
+        
+        adapter = None
+        if self.use_board_apis and not job_links:
+            adapter = detect_board(self, career_url)
+        if adapter is not None:
+            # Board adapters use the blocking session; they only make a handful of calls
+            loop = asyncio.get_running_loop()
+            board_jobs = await loop.run_in_executor(None, self.scrape_board, adapter, max_jobs)
+            if board_jobs:
+                if checkpoint:
+                    checkpoint.finish(career_url)
+                return self.finish_board(career_url, board_jobs, max_jobs)
+        
+        if self.use_sitemaps and not job_links:
+            sitemaps = SitemapDiscovery(self)
+            loop = asyncio.get_running_loop()
+            job_links = await loop.run_in_executor(None, sitemaps.discover, career_url, listings)
+            listing_complete = sitemaps.complete
+        
+        if not job_links:
+            soup = await self.get_page_content_async(career_url, wait_for_element='.job, .career, .position')
+            if soup is None:
+                failed_url = career_url
+            job_links = self.collect_job_links(soup, career_url, listings=listings, limit=None)
+            # Only the first listing page is read here, so removals are unknowable if it links onward
+            listing_complete = soup is not None and ListingCrawler(self).find_next_url(soup, career_url) is None
+        
+        self.last_listing = {'links': len(job_links), 'complete': listing_complete, 'failed_url': failed_url}
         if not job_links:
             self.logger.warning("No job links found. Try using Selenium for dynamic content.")
+            self.finish_empty_listing(career_url, listings)
+            if checkpoint:
+                checkpoint.finish(career_url)
             return []
         
-        # Limit number of jobs to scrape
+        if checkpoint and not links_done:
+            checkpoint.add_links(career_url, job_links, listings)
+            checkpoint.links_found(career_url, listing_complete)
+        
+        listed_urls = job_links
         job_links = job_links[:max_jobs]
         
-        scraped_jobs = []
-        for i, job_url in enumerate(job_links, 1):
-            self.logger.info(f"Scraping job {i}/{len(job_links)}: {job_url}")
-            
-            job_data = self.extract_job_data(job_url, custom_selectors)
-            if job_data:
-                scraped_jobs.append(job_data)
-            
-            # Respectful delay
-            time.sleep(1)
+        job_links, skipped = self.skip_unchanged(job_links, listings)
+        
+        async def scrape_one(job_url):
+            if job_url in done:
+                return done[job_url]
+            job_data = await self.extract_job_data_async(job_url, custom_selectors)
+            if checkpoint:
+                checkpoint.record(career_url, job_url, job_data)
+            return job_data
+        
+        start = time.perf_counter()
+        # gather() keeps results in link order
+        results = await asyncio.gather(*(scrape_one(job_url) for job_url in job_links))
+        scraped_jobs = [job_data for job_data in results if job_data]
+        elapsed = time.perf_counter() - start
         
-        self.jobs.extend(scraped_jobs)
         self.logger.info(f"Successfully scraped {len(scraped_jobs)} jobs")
+        self.log_throughput(len(job_links), len(scraped_jobs), elapsed, self.async_fetcher.limit_per_host)
+        
+        if self.seen_store:
+            scraped_jobs = self.finish_incremental(career_url, scraped_jobs, listed_urls, listings, skipped,
+                                                   listing_complete=listing_complete, extend_jobs=True)
+        else:
+            self.keep(scraped_jobs)
+        if checkpoint:
+            checkpoint.finish(career_url)
         return scraped_jobs
     
-    def save_to_excel(self, filename="job_postings.xlsx"):
+    async def _run_async(self, coro):
+        """Run coro and release the connections bound to this event loop"""
+        try:
+            return await coro
+        finally:
+            await self.async_fetcher.close()
+    
+    async def aclose(self):
+        """Clean up async resources"""
+        await self.async_fetcher.close()
+    
+    def log_throughput(self, pages, jobs, elapsed, workers):
+        """Report how fast detail pages were processed"""
+        rate = pages / elapsed if elapsed > 0 else 0.0
+        self.logger.info(f"Processed {pages} pages ({jobs} jobs) in {elapsed:.1f}s "
+                         f"with {workers} worker(s): {rate:.2f} pages/sec")
+        
+        if self.cache:
+            stats = self.cache.stats()
+            self.logger.info(f"Cache: {stats['hits']} fresh hits, {stats['revalidated']} revalidated (304), "
+                             f"{stats['misses']} fetched")
+        
+        field_ms = self.extraction_timing_summary()
+        if field_ms:
+            breakdown = ', '.join(f"{field} {ms:.2f}" for field, ms in
+                                  sorted(field_ms.items(), key=lambda item: -item[1]))
+            self.logger.info(f"Extraction ms/page by field: {breakdown}")
+        
+        structured = self.structured_stats
+        if structured['pages']:
+            self.logger.info(f"Structured data fast path: {structured['full']}/{structured['pages']} pages "
+                             f"fully satisfied, {structured['partial']} partially, "
+                             f"{structured['none']} without JobPosting data")
+        
+        resilience = self.resilience.summary()
+        if resilience['retries'] or resilience['circuits_opened']:
+            self.logger.info(f"Resilience: {resilience['retries']} retries, "
+                             f"{resilience['circuits_opened']} circuit(s) opened, "
+                             f"open now: {', '.join(resilience['open_hosts']) or 'none'}")
+        if resilience.get('limits'):
+            limits = ', '.join(f"{host} {limit}" for host, limit in resilience['limits'].items())
+            self.logger.info(f"Adaptive in-flight limits: {limits}")
+        
+        if self.readiness.timings:
+            render = self.readiness.summary()
+            self.logger.info(f"Render waits: {render['total_wait']:.1f}s over {render['pages']} pages "
+                             f"(mean {render['mean_wait']:.2f}s, {render['hit_ceiling']} hit the ceiling); "
+                             f"fixed waits would have cost {render['legacy_wait']:.1f}s")
+    
+    def run_report(self):
+        """Everything measured so far: self.metrics plus cache, resilience, render and structured-data stats"""
+        report = self.metrics.report()
+        report['resilience'] = self.resilience.summary()
+        report['structured_data'] = dict(self.structured_stats)
+        if self.cache:
+            report['cache'] = self.cache.stats()
+        if self.readiness.timings:
+            report['render'] = self.readiness.summary()
+        return report
+    
+    def write_run_report(self, path):
+        """Save run_report() as JSON; a .prom path gets the Prometheus text format instead"""
+        if path.endswith('.prom'):
+            self.metrics.write_prometheus(path)
+        else:
+            write_atomic(path, json.dumps(self.run_report(), indent=2, default=str))
+        self.logger.info(f"Wrote run metrics to {path}")
+    
+    def save_to_excel(self, filename="job_postings.xlsx", jobs=None):
         """Save scraped jobs to Excel file"""
-        if not self.jobs:
+        if jobs is None:
+            jobs = self.jobs
+        if not jobs:
             self.logger.warning("No jobs to save")
             return
         
-        df = pd.DataFrame(self.jobs)
+        if isinstance(jobs, JobBatch):
+            df = jobs.to_dataframe()
+        else:
+            import pandas as pd
+            df = pd.DataFrame(jobs)
         
         # Reorder columns
-        column_order = [
-            'company_name', 'job_title', 'work_location', 'job_location',
-            'experience', 'job_description', 'responsibilities', 
-            'qualifications', 'apply_link'
-        ]
-        
-        df = df.reindex(columns=column_order)
+        df = df.reindex(columns=list(JOB_COLUMNS))
         
         # Remove duplicates based on job title and company
         df = df.drop_duplicates(subset=['job_title', 'company_name'], keep='first')
@@ -385,18 +1194,79 @@ class JobScraper:
         """Clean up resources"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
+        if self.driver_pool is not None:
+            self.driver_pool.close()
+            self.driver_pool = None
+        if self._selenium_executor is not None:
+            self._selenium_executor.shutdown(wait=False)
+            self._selenium_executor = None
 
 # Example usage and customization
-def scrape_company_jobs(career_url, use_selenium=False, custom_selectors=None):
-    """Convenience function to scrape jobs from a company career page"""
-    scraper = JobScraper(use_selenium=use_selenium)
+def scrape_company_jobs(career_url, use_selenium=False, custom_selectors=None,
+                        max_workers=1, requests_per_second=1.0, scraper=None, cache=None,
+                        sinks=None, resume=False, checkpoint=None, report_path=None, profile=None):
+    """Convenience function to scrape jobs from a company career page
+    
+    Pass a long-lived scraper to reuse its browsers and connections across
+    companies; it is left open for the caller to close. Jobs go to the
+    scraper's sinks as they are extracted; the end-of-run Excel file is only
+    written when there are none. resume=True continues an interrupted run
+    from checkpoint (the scraper's own, or scrape_checkpoint.sqlite).
+    report_path saves the run's metrics (JSON, or Prometheus text for .prom).
+    profile (True or a RunProfiler) profiles the scrape and the Excel export
+    together, writing flame-graph and allocation reports to ./profiles.
+    """
+    owns_scraper = scraper is None
+    owns_checkpoint = (resume and checkpoint is None
+                       and (owns_scraper or scraper.checkpoint is None))
+    if owns_checkpoint:
+        checkpoint = RunCheckpoint()
+    if owns_scraper:
+        scraper = JobScraper(use_selenium=use_selenium, max_workers=max_workers,
+                             requests_per_second=requests_per_second, cache=cache, sinks=sinks,
+                             checkpoint=checkpoint)
+    elif checkpoint is not None:
+        scraper.checkpoint = checkpoint
+    previous_profiler = scraper.profiler
+    if profile:
+        scraper.profiler = RunProfiler() if profile is True else profile
     
     try:
-        jobs = scraper.scrape_jobs(career_url, custom_selectors)
-        scraper.save_to_excel(f"jobs_{urlparse(career_url).netloc}.xlsx")
+        with scraper.profiled(career_url):
+            jobs = scraper.scrape_jobs(career_url, custom_selectors, resume=resume)
+            if not scraper.sinks:
+                scraper.save_to_excel(f"jobs_{urlparse(career_url).netloc}.xlsx", jobs=jobs)
+        if report_path:
+            scraper.write_run_report(report_path)
         return jobs
     finally:
+        scraper.profiler = previous_profiler
+        if owns_scraper:
+            scraper.close()
+        if owns_checkpoint:
+            checkpoint.close()
+
+async def scrape_companies_async(career_urls, custom_selectors=None, max_jobs=50, **scraper_options):
+    """Scrape several career pages concurrently on one event loop with one connection pool"""
+    scraper = JobScraper(fetch_backend='asyncio', **scraper_options)
+    
+    try:
+        results = await asyncio.gather(
+            *(scraper.scrape_jobs_async(url, custom_selectors, max_jobs) for url in career_urls),
+            return_exceptions=True
+        )
+    finally:
+        await scraper.aclose()
         scraper.close()
+    
+    jobs_by_company = {}
+    for url, result in zip(career_urls, results):
+        if isinstance(result, Exception):
+            scraper.logger.error(f"Scraping {url} failed: {result}")
+            result = []
+        jobs_by_company[url] = result
+    return jobs_by_company
 
 if __name__ == "__main__":
     # Example usage
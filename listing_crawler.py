@@ -0,0 +1,230 @@
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+
+# Anchor texts that lead to the next slice of a listing
+NEXT_TEXTS = ('next', 'next page', 'next »', '›', '»', '>', 'load more', 'show more', 'more jobs',
+              'view more', 'see more')
+
+# Clicks a visible "load more" control if there is one, then scrolls to the bottom
+LOAD_MORE_SCRIPT = """
+var pattern = /^(load|show|view|see) more|more (jobs|results|positions)/i;
+var controls = document.querySelectorAll('button, a, [role="button"]');
+var clicked = false;
+for (var i = 0; i < controls.length; i++) {
+    var el = controls[i];
+    if (el.offsetParent !== null && pattern.test((el.innerText || '').trim())) {
+        el.click();
+        clicked = true;
+        break;
+    }
+}
+window.scrollTo(0, document.body.scrollHeight);
+return clicked;
+"""
+
+NUMBER_RE = re.compile(r'(\d+)')
+
+
+def url_template(previous_url, next_url):
+    """If two listing URLs differ only in one number, return (tokens, index, step) to predict later pages"""
+    previous_tokens = NUMBER_RE.split(previous_url)
+    next_tokens = NUMBER_RE.split(next_url)
+    if len(previous_tokens) != len(next_tokens):
+        return None
+
+    differing = [i for i, (a, b) in enumerate(zip(previous_tokens, next_tokens)) if a != b]
+    # Odd positions hold the numbers split out by the capturing group
+    if len(differing) != 1 or differing[0] % 2 == 0:
+        return None
+    index = differing[0]
+    step = int(next_tokens[index]) - int(previous_tokens[index])
+    if step <= 0:
+        return None
+    return next_tokens, index, step
+
+
+def predicted_url(template, pages_ahead):
+    """URL of the listing page pages_ahead steps after the template's page"""
+    tokens, index, step = template
+    tokens = list(tokens)
+    tokens[index] = str(int(tokens[index]) + step * pages_ahead)
+    return ''.join(tokens)
+
+
+class ListingCrawler:
+    """Follows pagination, load-more and infinite scroll, yielding new job links as they are found"""
+
+    def __init__(self, scraper, max_pages=10, prefetch=4, job_link_selectors=None):
+        self.scraper = scraper
+        self.job_link_selectors = job_link_selectors
+        self.max_pages = max(1, int(max_pages))
+        self.prefetch = max(1, int(prefetch))
+        self.seen = set()
+        self.pages = 0
+        # True when the crawl ran out of listing pages rather than hitting a limit or an error
+        self.complete = False
+        # URL of the listing page that couldn't be loaded, if one stopped the crawl
+        self.failed_url = None
+        self.logger = logging.getLogger(__name__)
+
+    def new_links(self, soup, page_url, listings=None):
+        """Job links on a listing page that earlier pages didn't have"""
+        links = self.scraper.collect_job_links(soup, page_url, self.job_link_selectors,
+                                               listings=listings, limit=None)
+        fresh = [link for link in links if link not in self.seen]
+        self.seen.update(fresh)
+        return fresh
+
+    def find_next_url(self, soup, page_url):
+        """rel=next first, then anchors that read like next/load more"""
+        for selector in ('link[rel="next"][href]', 'a[rel="next"][href]'):
+            element = soup.select_one(selector)
+            if element is not None:
+                return urljoin(page_url, element.get('href'))
+
+        for anchor in soup.select('a[href]'):
+            href = anchor.get('href')
+            if not href or href.startswith(('#', 'javascript:')):
+                continue
+            text = anchor.get_text(' ', strip=True).lower()
+            label = (anchor.get('aria-label') or '').lower()
+            if text in NEXT_TEXTS or label.startswith('next'):
+                return urljoin(page_url, href)
+        return None
+
+    def iter_links(self, career_url, first_soup=None, listings=None, max_links=None):
+        """Yield lists of newly discovered job links, page by page, so extraction can start early"""
+        soup = first_soup
+        if soup is None:
+            soup = self.scraper.get_page_content(career_url, wait_for_element='.job, .career, .position')
+        if not soup:
+            self.failed_url = career_url
+            return
+
+        self.pages = 1
+        links = self.new_links(soup, career_url, listings)
+        if links:
+            yield links
+
+        if self.scraper.use_selenium:
+            yield from self._iter_scrolled(career_url, listings, max_links)
+        else:
+            yield from self._iter_paginated(career_url, soup, listings, max_links)
+
+    def _page_failed(self, url):
+        """Stop on a listing page that didn't load; the crawl stays incomplete so nothing counts as removed"""
+        self.failed_url = url
+        self.logger.warning(f"Listing page {url} could not be loaded, treating the listing as incomplete")
+
+    def _limit_reached(self, max_links):
+        return self.pages >= self.max_pages or (max_links is not None and len(self.seen) >= max_links)
+
+    def _iter_paginated(self, page_url, soup, listings, max_links):
+        """Follow next links; once page URLs are predictable, fetch several pages at a time"""
+        previous_url = page_url
+        while not self._limit_reached(max_links):
+            next_url = self.find_next_url(soup, previous_url)
+            if not next_url or next_url == previous_url:
+                self.complete = True
+                return
+
+            template = url_template(previous_url, next_url)
+            if template:
+                yield from self._iter_predicted(template, listings, max_links)
+                return
+
+            soup = self.scraper.get_page_content(next_url)
+            if not soup:
+                self._page_failed(next_url)
+                return
+            self.pages += 1
+            links = self.new_links(soup, next_url, listings)
+            if not links:
+                self.complete = True
+                return
+            yield links
+            previous_url = next_url
+
+    def _iter_predicted(self, template, listings, max_links):
+        """Fetch predicted listing pages concurrently, stopping at the first page with nothing new
+
+        A predicted page the server reports missing (404/410) ends the listing,
+        as many sites do past their last page, unless the page before it
+        linked to it as the next page. Any other failure leaves it incomplete.
+        """
+        ahead = 0
+        # The page before the first prediction linked to it
+        linked_next = predicted_url(template, 0)
+        with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+            while not self._limit_reached(max_links):
+                count = min(self.prefetch, self.max_pages - self.pages)
+                urls = [predicted_url(template, ahead + i) for i in range(count)]
+                ahead += count
+                results = list(executor.map(self._get_predicted, urls))
+
+                for url, (soup, missing) in zip(urls, results):
+                    if not soup:
+                        if missing and url != linked_next:
+                            self.logger.info(f"Listing ends before {url}")
+                            self.complete = True
+                        else:
+                            self._page_failed(url)
+                        return
+                    self.pages += 1
+                    links = self.new_links(soup, url, listings)
+                    if not links:
+                        self.complete = True
+                        return
+                    yield links
+                    linked_next = self.find_next_url(soup, url)
+
+    def _get_predicted(self, url):
+        """(soup, missing) for a predicted page; missing means the server said it doesn't exist"""
+        try:
+            return self.scraper.parse_html(self.scraper.fetch_bytes(url)), False
+        except Exception as e:
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            self.logger.debug(f"Predicted listing page {url} did not load: {e}")
+            return None, status in (404, 410)
+
+    def _iter_scrolled(self, career_url, listings, max_links):
+        """Selenium mode: click load-more controls and scroll until no new links appear"""
+        pool = self.scraper.get_driver_pool()
+        if not pool:
+            return
+
+        # Holding a driver while the caller extracts is only safe if other drivers exist
+        stream = pool.size > 1
+        pending = []
+        try:
+            with pool.driver() as driver:
+                # The pool is LIFO, so this is usually the driver that just rendered the first page
+                if driver.current_url != career_url:
+                    self.scraper.resilience.call(
+                        career_url, lambda: self.scraper._load_in_browser(driver, career_url,
+                                                                          '.job, .career, .position'),
+                        transient=(Exception,))
+
+                while not self._limit_reached(max_links):
+                    driver.execute_script(LOAD_MORE_SCRIPT)
+                    self.scraper.readiness.wait(driver, career_url)
+                    self.pages += 1
+
+                    soup = self.scraper.parse_html(driver.page_source)
+                    links = self.new_links(soup, career_url, listings)
+                    if not links:
+                        self.complete = True
+                        break
+                    if stream:
+                        yield links
+                    else:
+                        pending.extend(links)
+        except Exception as e:
+            self.logger.warning(f"Scrolling {career_url} failed: {e}")
+            self._page_failed(career_url)
+
+        if pending:
+            yield pending
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from collections import deque
+
+
+# Installs a MutationObserver on first call and reports the page state on every call
+PROBE_SCRIPT = """
+var selector = arguments[0];
+if (!window.__scraperReady) {
+    window.__scraperReady = {lastMutation: performance.now()};
+    try {
+        new MutationObserver(function () {
+            window.__scraperReady.lastMutation = performance.now();
+        }).observe(document.documentElement || document, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    } catch (e) {}
+}
+var found = true;
+if (selector) {
+    try { found = !!document.querySelector(selector); } catch (e) { found = false; }
+}
+return {
+    readyState: document.readyState,
+    resources: performance.getEntriesByType('resource').length,
+    quietMs: performance.now() - window.__scraperReady.lastMutation,
+    found: found
+};
+"""
+
+# What get_page_content used to spend: WebDriverWait up to 10s, then a fixed 3s sleep
+LEGACY_ELEMENT_TIMEOUT = 10.0
+LEGACY_FIXED_WAIT = 3.0
+
+
+class PageReadiness:
+    """Waits until a rendered page is stable instead of sleeping a fixed time"""
+
+    def __init__(self, max_wait=10.0, quiet_ms=400, poll_interval=0.1, element_timeout=None, keep_recent=200):
+        self.max_wait = max_wait
+        self.quiet_ms = quiet_ms
+        self.poll_interval = poll_interval
+        self.element_timeout = min(element_timeout or max_wait, max_wait)
+        # Per-URL detail for the most recent pages only; long-lived scrapers keep running totals
+        self.timings = deque(maxlen=keep_recent)
+        self._totals = {'pages': 0, 'waited': 0.0, 'legacy_wait': 0.0, 'hit_ceiling': 0}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def wait(self, driver, url, wait_for_element=None):
+        """Block until readyState is complete, network and DOM are quiet and the selector is present
+
+        Returns as soon as all signals agree, or at max_wait at the latest.
+        """
+        start = time.perf_counter()
+        deadline = start + self.max_wait
+        last_resources = None
+        last_change = start
+        found_at = None
+        reason = 'ceiling'
+
+        while True:
+            now = time.perf_counter()
+            try:
+                state = driver.execute_script(PROBE_SCRIPT, wait_for_element) or {}
+            except Exception as e:
+                self.logger.debug(f"Readiness probe failed for {url}: {e}")
+                state = {}
+
+            # Network idle heuristic: no new resource entries for a quiet window
+            resources = state.get('resources')
+            if resources != last_resources:
+                last_resources = resources
+                last_change = now
+
+            if found_at is None and state.get('found'):
+                found_at = now - start
+
+            network_idle = (now - last_change) * 1000 >= self.quiet_ms
+            dom_quiet = state.get('quietMs', 0) >= self.quiet_ms
+            element_ready = found_at is not None or now - start >= self.element_timeout
+
+            if state.get('readyState') == 'complete' and network_idle and dom_quiet and element_ready:
+                reason = 'stable'
+                break
+            if now >= deadline:
+                break
+            time.sleep(self.poll_interval)
+
+        waited = time.perf_counter() - start
+        if wait_for_element and found_at is None:
+            self.logger.warning(f"Element '{wait_for_element}' not found on {url} after {waited:.1f}s")
+
+        self._record(url, waited, reason, wait_for_element, found_at)
+        return waited
+
+    def _record(self, url, waited, reason, wait_for_element, found_at):
+        """Keep per-URL timings alongside what the fixed wait would have cost"""
+        if wait_for_element:
+            legacy_element_wait = found_at if found_at is not None else LEGACY_ELEMENT_TIMEOUT
+        else:
+            legacy_element_wait = 0.0
+
+        legacy_wait = legacy_element_wait + LEGACY_FIXED_WAIT
+        with self._lock:
+            self.timings.append({
+                'url': url,
+                'waited': waited,
+                'reason': reason,
+                'element_found': found_at is not None if wait_for_element else None,
+                'legacy_wait': legacy_wait
+            })
+            self._totals['pages'] += 1
+            self._totals['waited'] += waited
+            self._totals['legacy_wait'] += legacy_wait
+            self._totals['hit_ceiling'] += reason == 'ceiling'
+
+    def summary(self):
+        """Aggregate timings: pages, total wait, and wall-clock saved over the old fixed wait"""
+        with self._lock:
+            totals = dict(self._totals)
+
+        pages = totals['pages']
+        return {
+            'pages': pages,
+            'total_wait': totals['waited'],
+            'mean_wait': totals['waited'] / pages if pages else 0.0,
+            'hit_ceiling': totals['hit_ceiling'],
+            'legacy_wait': totals['legacy_wait'],
+            'saved': totals['legacy_wait'] - totals['waited']
+        }
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """Per-host token bucket limiter shared by all fetch workers"""
+
+    def __init__(self, requests_per_second=1.0, burst=1):
+        self.rate = float(requests_per_second) if requests_per_second else 0.0
+        self.burst = max(1, int(burst))
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, url):
+        """Reserve one token for the host of url and return the delay to honour"""
+        if self.rate <= 0:
+            return 0.0
+
+        host = urlparse(url).netloc.lower()
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, last = self._buckets.get(host, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+            # Tokens may go negative so concurrent callers queue up behind each other
+            tokens -= 1
+            self._buckets[host] = (tokens, now)
+
+        if tokens >= 0:
+            return 0.0
+        return -tokens / self.rate
+
+    def acquire(self, url):
+        """Block the calling thread until a request to url is allowed"""
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url):
+        """Awaitable counterpart of acquire for the asyncio fetch engine"""
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
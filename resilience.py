@@ -0,0 +1,316 @@
+import asyncio
+import email.utils
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+# Statuses worth retrying: throttling and temporary server trouble
+RETRY_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+
+logger = logging.getLogger(__name__)
+
+
+def host_of(url):
+    return urlparse(url).netloc.lower()
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class TransientError(Exception):
+    """A failure worth retrying: connection trouble, a timeout, or a RETRY_STATUSES response"""
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpen(Exception):
+    """Raised instead of contacting a host whose circuit breaker is open"""
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff"""
+
+    def __init__(self, max_retries=2, base_delay=0.5, max_delay=30.0):
+        self.max_retries = max(0, int(max_retries))
+        self.base_delay = base_delay
+        # Retry-After beyond this opens the circuit instead of blocking a worker
+        self.max_delay = max_delay
+
+    def delay(self, attempt, retry_after=None):
+        """Seconds to wait before retry number attempt (0-based)"""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            return max(retry_after, backoff)
+        return backoff
+
+
+class CircuitBreaker:
+    """Per-host breaker: after failure_threshold consecutive failures a host is left alone
+    for reset_timeout seconds, then a single probe request decides whether to close again"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.opened = 0
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def before(self, url):
+        """Raise CircuitOpen if url's host must not be contacted right now; True for the half-open probe"""
+        host = host_of(url)
+        now = time.monotonic()
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state['open_until'] is None:
+                return False
+            if now < state['open_until'] or state['probing']:
+                raise CircuitOpen(f"Circuit open for {host}, skipping {url}")
+            # Half-open: let exactly one request through
+            state['probing'] = True
+            return True
+
+    def end_probe(self, url):
+        """Let another probe through if this one ended without success() or failure()"""
+        with self._lock:
+            state = self._hosts.get(host_of(url))
+            if state is not None:
+                state['probing'] = False
+
+    def success(self, url):
+        with self._lock:
+            self._hosts.pop(host_of(url), None)
+
+    def failure(self, url, open_for=None):
+        """Count a transient failure; open_for forces the circuit open (e.g. a long Retry-After)"""
+        host = host_of(url)
+        with self._lock:
+            state = self._hosts.setdefault(host, {'failures': 0, 'open_until': None, 'probing': False})
+            state['failures'] += 1
+            if open_for is None and (state['probing'] or state['failures'] >= self.failure_threshold):
+                open_for = self.reset_timeout
+            if open_for is not None:
+                if state['open_until'] is None:
+                    self.opened += 1
+                    logger.warning(f"Circuit opened for {host} for {open_for:.0f}s")
+                state['open_until'] = time.monotonic() + open_for
+                state['probing'] = False
+
+    def open_hosts(self):
+        now = time.monotonic()
+        with self._lock:
+            return sorted(host for host, state in self._hosts.items()
+                          if state['open_until'] is not None and state['open_until'] > now)
+
+
+class AdaptiveConcurrency:
+    """Per-host AIMD limit on in-flight requests
+
+    The limit grows by about one per round of healthy responses and is
+    halved on errors or throttling; responses slower than latency_target
+    shrink it gently.
+    """
+
+    def __init__(self, initial=2, minimum=1, maximum=8, latency_target=3.0):
+        self.initial = float(initial)
+        self.minimum = float(minimum)
+        self.maximum = float(max(maximum, minimum))
+        self.latency_target = latency_target
+        self._limits = {}
+        self._in_flight = {}
+        self._condition = threading.Condition()
+
+    def limit(self, host):
+        return self._limits.get(host, min(self.initial, self.maximum))
+
+    def try_acquire(self, url):
+        host = host_of(url)
+        with self._condition:
+            if self._in_flight.get(host, 0) >= max(1, int(self.limit(host))):
+                return False
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            return True
+
+    def acquire(self, url):
+        """Block until url's host has a free slot"""
+        with self._condition:
+            while not self.try_acquire(url):
+                self._condition.wait(0.5)
+
+    async def acquire_async(self, url):
+        while not self.try_acquire(url):
+            await asyncio.sleep(0.05)
+
+    def release(self, url, latency=None, failed=False):
+        """Free a slot and adjust the host's limit from the outcome"""
+        host = host_of(url)
+        with self._condition:
+            self._in_flight[host] = max(0, self._in_flight.get(host, 1) - 1)
+            limit = self.limit(host)
+            if failed:
+                limit = limit / 2
+            elif latency is not None and latency > self.latency_target:
+                limit = limit * 0.8
+            elif latency is not None:
+                limit = limit + 1 / limit
+            self._limits[host] = min(self.maximum, max(self.minimum, limit))
+            self._condition.notify_all()
+
+    def limits(self):
+        with self._condition:
+            return {host: round(limit, 1) for host, limit in self._limits.items()}
+
+
+class Resilience:
+    """Retries, circuit breaking and adaptive concurrency around each request to a host"""
+
+    def __init__(self, policy=None, breaker=None, concurrency=None, metrics=None):
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        # None disables the AIMD limit (the worker count still bounds concurrency)
+        self.concurrency = concurrency
+        # Optional RunMetrics counting retries and backoff per host
+        self.metrics = metrics
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _slot(self, url, transient, throttle=None, local=()):
+        """Hold one of the host's in-flight slots; only the request itself counts as latency"""
+        if self.concurrency is not None:
+            self.concurrency.acquire(url)
+        try:
+            if throttle is not None:
+                throttle(url)
+            start = time.perf_counter()
+            yield
+        except local:
+            self._release(url)
+            raise
+        except transient:
+            self._release(url, failed=True)
+            raise
+        except BaseException:
+            self._release(url)
+            raise
+        else:
+            self._release(url, time.perf_counter() - start)
+
+    def _release(self, url, latency=None, failed=False):
+        if self.concurrency is not None:
+            self.concurrency.release(url, latency, failed)
+
+    def _give_up_or_wait(self, url, attempt, error):
+        """Record a transient failure; return the delay before retrying, or re-raise"""
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None and retry_after > self.policy.max_delay:
+            # The host asked for a long pause: honour it without blocking a worker
+            self.breaker.failure(url, open_for=retry_after)
+            raise error
+        self.breaker.failure(url)
+        if attempt >= self.policy.max_retries:
+            raise error
+        delay = self.policy.delay(attempt, retry_after)
+        with self._lock:
+            self.retries += 1
+        if self.metrics is not None:
+            self.metrics.count('retries', host=host_of(url))
+            self.metrics.observe('retry_backoff_seconds', delay, host=host_of(url))
+        logger.info(f"Retrying {url} in {delay:.1f}s after: {error}")
+        return delay
+
+    def call(self, url, func, transient=(TransientError,), throttle=None, local=()):
+        """Run func() for url, retrying transient failures; raises CircuitOpen if the host is tripped
+
+        throttle(url), e.g. the rate limiter, runs before every attempt once a slot is held.
+        local lists errors on our side (no browser available, say) that are re-raised
+        without a retry and without counting for or against the host.
+        """
+        attempt = 0
+        while True:
+            probe = self.breaker.before(url)
+            try:
+                with self._slot(url, transient, throttle, local):
+                    result = func()
+            except local:
+                raise
+            except transient as e:
+                if not isinstance(e, TransientError):
+                    e = TransientError(f"{type(e).__name__}: {e}")
+                delay = self._give_up_or_wait(url, attempt, e)
+            except Exception:
+                # Any other answer (a 404, say) still shows the host is up
+                self.breaker.success(url)
+                raise
+            else:
+                self.breaker.success(url)
+                return result
+            finally:
+                if probe:
+                    # A probe cut short (Ctrl-C, a local error) must not leave the circuit half-open for good
+                    self.breaker.end_probe(url)
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, url, func, transient=(TransientError,), throttle=None, local=()):
+        """Awaitable counterpart of call; func and throttle return awaitables"""
+        attempt = 0
+        while True:
+            probe = self.breaker.before(url)
+            try:
+                if self.concurrency is not None:
+                    await self.concurrency.acquire_async(url)
+                try:
+                    if throttle is not None:
+                        await throttle(url)
+                    start = time.perf_counter()
+                    result = await func()
+                except local:
+                    self._release(url)
+                    raise
+                except transient as e:
+                    self._release(url, failed=True)
+                    if not isinstance(e, TransientError):
+                        e = TransientError(f"{type(e).__name__}: {e}")
+                    delay = self._give_up_or_wait(url, attempt, e)
+                except Exception:
+                    self._release(url)
+                    self.breaker.success(url)
+                    raise
+                except BaseException:
+                    self._release(url)
+                    raise
+                else:
+                    self._release(url, time.perf_counter() - start)
+                    self.breaker.success(url)
+                    return result
+            finally:
+                if probe:
+                    self.breaker.end_probe(url)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def summary(self):
+        """Retry count, circuits opened and hosts currently open, plus the adaptive limits"""
+        summary = {'retries': self.retries, 'circuits_opened': self.breaker.opened,
+                   'open_hosts': self.breaker.open_hosts()}
+        if self.concurrency is not None:
+            summary['limits'] = self.concurrency.limits()
+        return summary
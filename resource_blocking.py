@@ -0,0 +1,153 @@
+import argparse
+import json
+import logging
+import time
+from urllib.parse import urlparse
+
+
+# File extensions per content type, blocked with or without a query string
+TYPE_EXTENSIONS = {
+    'image': ('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'),
+    'font': ('woff', 'woff2', 'ttf', 'otf', 'eot'),
+    'stylesheet': ('css',),
+    'media': ('mp4', 'webm', 'ogg', 'mp3', 'm3u8', 'mov')
+}
+
+# Analytics, ads and session-replay hosts that never carry job content
+TRACKER_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com',
+    'googleadservices.com', 'facebook.net', 'connect.facebook.com', 'hotjar.com', 'clarity.ms',
+    'segment.com', 'segment.io', 'mixpanel.com', 'amplitude.com', 'fullstory.com', 'newrelic.com',
+    'nr-data.net', 'optimizely.com', 'bat.bing.com', 'snap.licdn.com', 'ads.linkedin.com',
+    'adroll.com', 'quantserve.com', 'scorecardresearch.com', 'crazyegg.com', 'mouseflow.com'
+)
+
+DEFAULT_BLOCK_TYPES = ('image', 'font', 'stylesheet', 'media', 'tracker')
+
+logger = logging.getLogger(__name__)
+
+
+class BlockingProfile:
+    """Which requests a Selenium page load may skip, since only page_source is read
+
+    block_types is any of 'image', 'font', 'stylesheet', 'media' and
+    'tracker' (TRACKER_DOMAINS). deny_domains adds hosts to block outright;
+    allow_sites lists career sites that break without the blocked resources
+    and are loaded in full.
+    """
+
+    def __init__(self, block_types=DEFAULT_BLOCK_TYPES, deny_domains=(), allow_sites=()):
+        unknown = set(block_types) - set(TYPE_EXTENSIONS) - {'tracker'}
+        if unknown:
+            raise ValueError(f"Unknown resource types to block: {', '.join(sorted(unknown))}")
+        self.block_types = tuple(block_types)
+        self.deny_domains = tuple(deny_domains)
+        self.allow_sites = tuple(site.lower() for site in allow_sites)
+
+    def patterns(self):
+        """URL patterns for Network.setBlockedURLs
+
+        Extensions are anchored to the end of the path (optionally followed
+        by a query or fragment) so hosts like careers.moveworks.com or
+        jobs.iconplc.com don't match *.mov or *.ico.
+        """
+        patterns = [f"*.{extension}{suffix}" for block_type in self.block_types
+                    for extension in TYPE_EXTENSIONS.get(block_type, ())
+                    for suffix in ('', '?*', '#*')]
+        domains = list(self.deny_domains)
+        if 'tracker' in self.block_types:
+            domains.extend(TRACKER_DOMAINS)
+        for domain in domains:
+            patterns.extend((f"*://{domain}/*", f"*://*.{domain}/*"))
+        return patterns
+
+    def allows_everything(self, url):
+        host = (urlparse(url).hostname or '').lower()
+        return any(host == site or host.endswith('.' + site) for site in self.allow_sites)
+
+    def configure(self, options):
+        """Chrome preferences applied at launch; images are skipped by the renderer itself"""
+        if 'image' in self.block_types and not self.allow_sites:
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
+    def apply(self, driver, url):
+        """Set the blocked URL list for the next navigation to url (only re-sent when it changes)"""
+        patterns = [] if self.allows_everything(url) else self.patterns()
+        if getattr(driver, '_blocked_patterns', None) == patterns:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            driver._blocked_patterns = patterns
+        except Exception as e:
+            # Non-Chromium drivers have no CDP; load pages in full
+            logger.debug(f"Resource blocking unavailable: {e}")
+            driver._blocked_patterns = patterns
+
+
+def network_totals(driver):
+    """Bytes received and requests made/blocked, from Chrome's performance log since the last call"""
+    totals = {'bytes': 0, 'requests': 0, 'blocked': 0}
+    for entry in driver.get_log('performance'):
+        message = json.loads(entry['message'])['message']
+        method = message.get('method')
+        params = message.get('params', {})
+        if method == 'Network.requestWillBeSent':
+            totals['requests'] += 1
+        elif method == 'Network.loadingFinished':
+            totals['bytes'] += int(params.get('encodedDataLength') or 0)
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            totals['blocked'] += 1
+    return totals
+
+
+def compare_blocking(scraper, url, profile=None):
+    """Load url in fresh browsers with and without blocking; returns bytes, requests and load time for each"""
+    profile = profile or scraper.resource_blocking or BlockingProfile()
+    results = {}
+    for label, blocking in (('full', False), ('blocked', profile)):
+        driver = scraper.create_driver(blocking=blocking, log_network=True)
+        try:
+            if blocking:
+                blocking.apply(driver, url)
+            start = time.perf_counter()
+            driver.get(url)
+            scraper.readiness.wait(driver, url)
+            elapsed = time.perf_counter() - start
+            totals = network_totals(driver)
+            totals['load_seconds'] = elapsed
+            totals['html_bytes'] = len(driver.page_source)
+            results[label] = totals
+        finally:
+            driver.quit()
+    return results
+
+
+def main():
+    from job_scraper import JobScraper
+
+    parser = argparse.ArgumentParser(description="Compare Selenium page loads with and without resource blocking")
+    parser.add_argument('url')
+    parser.add_argument('--block', default=','.join(DEFAULT_BLOCK_TYPES),
+                        help="comma-separated types: " + ', '.join(list(TYPE_EXTENSIONS) + ['tracker']))
+    args = parser.parse_args()
+
+    profile = BlockingProfile(block_types=[t for t in args.block.split(',') if t])
+    scraper = JobScraper(use_selenium=True)
+    try:
+        results = compare_blocking(scraper, args.url, profile)
+    finally:
+        scraper.close()
+
+    print(f"{'':<10} {'KB':>10} {'requests':>9} {'blocked':>8} {'load s':>7} {'HTML KB':>8}")
+    for label, totals in results.items():
+        print(f"{label:<10} {totals['bytes'] / 1024:>10.1f} {totals['requests']:>9} {totals['blocked']:>8} "
+              f"{totals['load_seconds']:>7.2f} {totals['html_bytes'] / 1024:>8.1f}")
+    full, blocked = results['full'], results['blocked']
+    if full['bytes']:
+        print(f"Blocking saved {1 - blocked['bytes'] / full['bytes']:.0%} of bytes and "
+              f"{full['load_seconds'] - blocked['load_seconds']:.2f}s of load time")
+
+
+if __name__ == "__main__":
+    main()
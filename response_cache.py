@@ -0,0 +1,132 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+
+class CacheMiss(Exception):
+    """Raised in offline mode when a URL was never recorded"""
+
+
+class ResponseCache:
+    """On-disk SQLite cache of page bodies with TTLs, validators and LRU eviction"""
+
+    def __init__(self, path='scraper_cache.sqlite', ttl=6 * 3600, max_bytes=500 * 1024 * 1024,
+                 offline=False):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # Batch workers in other processes may share the file
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key):
+        """Return the cached entry for key (any age), or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        body, etag, last_modified, fetched_at = row
+        return {'body': body, 'etag': etag, 'last_modified': last_modified, 'fetched_at': fetched_at}
+
+    def is_fresh(self, entry):
+        """Entries younger than the TTL are served without touching the network"""
+        return entry is not None and (self.offline or time.time() - entry['fetched_at'] < self.ttl)
+
+    def lookup(self, key):
+        """Return a fresh body for key, raise CacheMiss offline, or None if it needs fetching"""
+        entry = self.get(key)
+        if self.is_fresh(entry):
+            self.hits += 1
+            return entry['body']
+        if self.offline:
+            self.misses += 1
+            raise CacheMiss(f"{key} is not cached (offline mode)")
+        return None
+
+    def conditional_headers(self, entry):
+        """If-None-Match / If-Modified-Since headers for revalidating a stale entry"""
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, key, body, etag=None, last_modified=None):
+        """Insert or replace an entry, then evict least recently used ones over max_bytes"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, now, now, len(body))
+            )
+            self._total += len(body) - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+        self.misses += 1
+
+    def touch(self, key):
+        """Mark an entry fresh again after a 304 Not Modified"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                               (now, now, key))
+            self._conn.commit()
+        self.revalidated += 1
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        while self.max_bytes and self._total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 50"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total -= size
+                if self._total <= self.max_bytes:
+                    break
+
+    def stats(self):
+        """Hit/miss counters for the current run"""
+        return {'hits': self.hits, 'revalidated': self.revalidated, 'misses': self.misses,
+                'bytes': self._total}
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,198 @@
+import csv
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from job_record import JOB_COLUMNS
+
+
+# Excel rejects longer cells
+EXCEL_CELL_LIMIT = 32767
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSink:
+    """Receives jobs one at a time as they are extracted; safe to share between worker threads"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def write(self, job_data):
+        """Persist one job"""
+        with self._lock:
+            self._write(job_data)
+            self.count += 1
+
+    def write_many(self, jobs):
+        for job_data in jobs:
+            self.write(job_data)
+
+    def _write(self, job_data):
+        raise NotImplementedError
+
+    def close(self):
+        """Flush anything buffered and release the file"""
+        with self._lock:
+            self._close()
+        logger.info(f"Wrote {self.count} jobs to {self.path}")
+
+    def _close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JsonlSink(ResultSink):
+    """One JSON object per line, appended and flushed per job"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _write(self, job_data):
+        self._file.write(json.dumps(dict(job_data), ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class CsvSink(ResultSink):
+    """CSV in JOB_COLUMNS order, appended and flushed per job; the header is written once per file"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'a', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=JOB_COLUMNS, extrasaction='ignore')
+        if is_new:
+            self._writer.writeheader()
+
+    def _write(self, job_data):
+        self._writer.writerow(job_data)
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class SqliteSink(ResultSink):
+    """SQLite table keyed on apply_link; re-scraped postings replace their earlier row"""
+
+    def __init__(self, path, table='jobs'):
+        super().__init__(path)
+        self.table = table
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        columns = ', '.join(f"{column} TEXT" for column in JOB_COLUMNS if column != 'apply_link')
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} "
+                           f"(apply_link TEXT PRIMARY KEY, {columns}, scraped_at REAL NOT NULL)")
+        self._conn.commit()
+
+        names = JOB_COLUMNS + ('scraped_at',)
+        updates = ', '.join(f"{name} = excluded.{name}" for name in names if name != 'apply_link')
+        self._upsert = (f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+                        f"ON CONFLICT(apply_link) DO UPDATE SET {updates}")
+
+    def _write(self, job_data):
+        values = [job_data.get(column) for column in JOB_COLUMNS] + [time.time()]
+        self._conn.execute(self._upsert, values)
+        self._conn.commit()
+
+    def _close(self):
+        self._conn.close()
+
+
+class ParquetSink(ResultSink):
+    """Parquet file written one row group per batch_size jobs (needs pyarrow)
+
+    Only the current batch is held in memory. The footer is written on
+    close, so a process that is killed outright leaves an unreadable file;
+    use JSONL or SQLite when that matters.
+    """
+
+    def __init__(self, path, batch_size=500):
+        super().__init__(path)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("ParquetSink needs pyarrow: pip install pyarrow") from None
+        self._pa = pa
+        self.batch_size = max(1, int(batch_size))
+        self._schema = pa.schema([(column, pa.string()) for column in JOB_COLUMNS])
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._batch = []
+
+    def _write(self, job_data):
+        self._batch.append(job_data)
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            columns = {column: [job.get(column) for job in self._batch] for column in JOB_COLUMNS}
+            self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+            self._batch = []
+
+    def _close(self):
+        self._flush()
+        self._writer.close()
+
+
+class ExcelSink(ResultSink):
+    """.xlsx through openpyxl's write-only mode, which streams rows instead of keeping cells
+
+    The workbook is only complete once closed; stream to JSONL/CSV/SQLite as
+    well if a crash must not lose the run.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        from openpyxl import Workbook
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        self._illegal = ILLEGAL_CHARACTERS_RE
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet('Jobs')
+        self._sheet.append(list(JOB_COLUMNS))
+
+    def _cell(self, value):
+        if not isinstance(value, str):
+            return value
+        return self._illegal.sub('', value)[:EXCEL_CELL_LIMIT]
+
+    def _write(self, job_data):
+        self._sheet.append([self._cell(job_data.get(column)) for column in JOB_COLUMNS])
+
+    def _close(self):
+        self._workbook.save(self.path)
+
+
+SINK_TYPES = {
+    '.jsonl': JsonlSink,
+    '.csv': CsvSink,
+    '.parquet': ParquetSink,
+    '.sqlite': SqliteSink,
+    '.db': SqliteSink,
+    '.xlsx': ExcelSink
+}
+
+
+def open_sink(path):
+    """Sink for path, chosen by file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        sink_type = SINK_TYPES[extension]
+    except KeyError:
+        raise ValueError(f"No result sink for '{extension}' files "
+                         f"(expected one of {', '.join(SINK_TYPES)})") from None
+    return sink_type(path)
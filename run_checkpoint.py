@@ -0,0 +1,131 @@
+import json
+import sqlite3
+import threading
+import time
+
+from job_record import JobRecord
+
+
+class RunCheckpoint:
+    """Durable state of in-progress scrape_jobs runs, so an interrupted run can resume
+
+    Per career URL it keeps the job links discovered so far (in order, with
+    their listing fingerprints) and every detail page already extracted. A
+    run that finishes clears its own state.
+    """
+
+    def __init__(self, path='scrape_checkpoint.sqlite'):
+        self.path = path
+        self._lock = threading.Lock()
+        # Batch workers in other processes may share the file
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                career_url TEXT PRIMARY KEY,
+                started REAL NOT NULL,
+                links_done INTEGER NOT NULL DEFAULT 0,
+                listing_complete INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS links (
+                career_url TEXT NOT NULL,
+                url TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                listing_fp TEXT,
+                PRIMARY KEY (career_url, url)
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                career_url TEXT NOT NULL,
+                url TEXT NOT NULL,
+                job TEXT,
+                finished REAL NOT NULL,
+                PRIMARY KEY (career_url, url)
+            );
+        """)
+        self._conn.commit()
+
+    def start(self, career_url, resume=False):
+        """Begin a run; without resume any earlier state for career_url is dropped"""
+        with self._lock:
+            if not resume:
+                self._clear(career_url)
+            self._conn.execute("INSERT OR IGNORE INTO runs (career_url, started) VALUES (?, ?)",
+                               (career_url, time.time()))
+            self._conn.commit()
+
+    def add_links(self, career_url, urls, listings=None):
+        """Append newly discovered links in discovery order"""
+        listings = listings or {}
+        with self._lock:
+            position = self._conn.execute("SELECT COUNT(*) FROM links WHERE career_url = ?",
+                                          (career_url,)).fetchone()[0]
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO links VALUES (?, ?, ?, ?)",
+                [(career_url, url, position + i, listings.get(url)) for i, url in enumerate(urls)]
+            )
+            self._conn.commit()
+
+    def links_found(self, career_url, listing_complete):
+        """Mark link discovery finished, so a resumed run can skip the listing pages"""
+        with self._lock:
+            self._conn.execute("UPDATE runs SET links_done = 1, listing_complete = ? WHERE career_url = ?",
+                               (int(bool(listing_complete)), career_url))
+            self._conn.commit()
+
+    def saved_links(self, career_url):
+        """(links in discovery order, {link: listing fingerprint}, links_done, listing_complete)"""
+        with self._lock:
+            run = self._conn.execute("SELECT links_done, listing_complete FROM runs WHERE career_url = ?",
+                                     (career_url,)).fetchone()
+            rows = self._conn.execute("SELECT url, listing_fp FROM links WHERE career_url = ? ORDER BY position",
+                                      (career_url,)).fetchall()
+        listings = {url: listing_fp for url, listing_fp in rows if listing_fp}
+        links_done, listing_complete = run if run else (0, 0)
+        return [url for url, _ in rows], listings, bool(links_done), bool(listing_complete)
+
+    def record(self, career_url, url, job_data):
+        """Store one finished detail page; pages that yielded nothing are left for a resumed run to retry"""
+        if not job_data:
+            return
+        job = json.dumps(dict(job_data))
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                               (career_url, url, job, time.time()))
+            self._conn.commit()
+
+    def completed(self, career_url):
+        """{url: JobRecord} for detail pages already extracted in this run"""
+        with self._lock:
+            # Older checkpoints stored failed pages with a NULL job; those are retried too
+            rows = self._conn.execute("SELECT url, job FROM results WHERE career_url = ? AND job IS NOT NULL",
+                                      (career_url,)).fetchall()
+        return {url: JobRecord(json.loads(job)) for url, job in rows}
+
+    def finish(self, career_url):
+        """Drop the state of a run that completed"""
+        with self._lock:
+            self._clear(career_url)
+            self._conn.commit()
+
+    def _clear(self, career_url):
+        for table in ('runs', 'links', 'results'):
+            self._conn.execute(f"DELETE FROM {table} WHERE career_url = ?", (career_url,))
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+
+class ResumedListing:
+    """Stands in for ListingCrawler when a resumed run already has its full link list"""
+
+    def __init__(self, links, complete):
+        self.links = links
+        self.seen = set(links)
+        self.pages = 0
+        self.complete = complete
+
+    def iter_links(self, career_url, first_soup=None, listings=None, max_links=None):
+        if self.links:
+            yield self.links[:max_links] if max_links else self.links
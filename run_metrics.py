@@ -0,0 +1,221 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Upper bounds in seconds, shared by every histogram so series can be merged
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PROMETHEUS_PREFIX = 'job_scraper_'
+
+
+class Histogram:
+    """Fixed-bucket histogram: constant memory, and cheap enough to update on every page"""
+
+    __slots__ = ('counts', 'count', 'sum', 'max')
+
+    def __init__(self):
+        # One extra bucket for values above the last bound
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th value (the max for the overflow bucket)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(LATENCY_BUCKETS[i], self.max) if i < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'p50': round(self.quantile(0.5), 6),
+            'p90': round(self.quantile(0.9), 6),
+            'p99': round(self.quantile(0.99), 6),
+            'max': round(self.max, 6)
+        }
+
+
+def merged(histograms):
+    total = Histogram()
+    for histogram in histograms:
+        total.merge(histogram)
+    return total
+
+
+def label_text(labels):
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return ','.join(f'{name}="{escape(value)}"' for name, value in labels)
+
+
+class RunMetrics:
+    """Timing histograms and counters for a scraper, labelled by host, field or backend
+
+    Series are keyed by (name, sorted labels). With enabled=False every
+    call returns immediately, so instrumented code never needs to check.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.started = time.time()
+        self._histograms = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, **labels):
+        """Add one duration (seconds) to the name histogram"""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name, amount=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time the with-block into the name histogram"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def _snapshot(self):
+        with self._lock:
+            histograms = {key: merged([histogram]) for key, histogram in self._histograms.items()}
+            return histograms, dict(self._counters)
+
+    def report(self):
+        """JSON-ready totals per metric, each series, and a per-host breakdown"""
+        histograms, counters = self._snapshot()
+        report = {
+            'started': self.started,
+            'elapsed_seconds': round(time.time() - self.started, 3),
+            'counters': {},
+            'histograms': {},
+            'series': [],
+            'hosts': {}
+        }
+        for (name, labels), value in sorted(counters.items()):
+            report['counters'][name] = report['counters'].get(name, 0) + value
+            report['series'].append({'name': name, 'labels': dict(labels), 'value': value})
+            host = dict(labels).get('host')
+            if host:
+                host_counters = report['hosts'].setdefault(host, {'counters': {}, 'histograms': {}})['counters']
+                host_counters[name] = host_counters.get(name, 0) + value
+
+        by_name = {}
+        by_host = {}
+        for (name, labels), histogram in sorted(histograms.items()):
+            by_name.setdefault(name, []).append(histogram)
+            report['series'].append({'name': name, 'labels': dict(labels), **histogram.summary()})
+            host = dict(labels).get('host')
+            if host:
+                by_host.setdefault((host, name), []).append(histogram)
+        for name, series in by_name.items():
+            report['histograms'][name] = merged(series).summary()
+        for (host, name), series in by_host.items():
+            host_histograms = report['hosts'].setdefault(host, {'counters': {}, 'histograms': {}})['histograms']
+            host_histograms[name] = merged(series).summary()
+        return report
+
+    def to_prometheus(self):
+        """Prometheus text exposition format (counters as _total, histograms as _seconds)"""
+        histograms, counters = self._snapshot()
+        lines = []
+        typed = set()
+        for (name, labels), value in sorted(counters.items()):
+            metric = f"{PROMETHEUS_PREFIX}{name}_total"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{{{label_text(labels)}}} {value}")
+        for (name, labels), histogram in sorted(histograms.items()):
+            metric = f"{PROMETHEUS_PREFIX}{name}"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), histogram.counts):
+                cumulative += count
+                bucket_labels = label_text(labels + (('le', bound),))
+                lines.append(f"{metric}_bucket{{{bucket_labels}}} {cumulative}")
+            lines.append(f"{metric}_sum{{{label_text(labels)}}} {histogram.sum}")
+            lines.append(f"{metric}_count{{{label_text(labels)}}} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Write the exposition text atomically (e.g. for node_exporter's textfile collector)"""
+        write_atomic(path, self.to_prometheus())
+
+    def serve(self, port=9464, host='127.0.0.1'):
+        """Serve /metrics (Prometheus) and /report.json from a daemon thread; returns the server"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith('/metrics'):
+                    body, content_type = metrics.to_prometheus(), 'text/plain; version=0.0.4'
+                elif self.path.startswith('/report.json'):
+                    body, content_type = json.dumps(metrics.report()), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                body = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def write_atomic(path, text):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
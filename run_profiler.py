@@ -0,0 +1,274 @@
+import cProfile
+import functools
+import inspect
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+
+# Run stages and the JobScraper methods that make them up. extract_text and
+# extract_long_text cover the per-element helpers the compiled selector plan calls.
+STAGES = {
+    'get_page_content': ('get_page_content', 'get_page_content_async', 'extract_job_data_in_browser'),
+    'parse_html': ('parse_html',),
+    'extract_text': ('extract_text', '_short_text', '_short_value'),
+    'extract_long_text': ('extract_long_text', '_long_text', '_long_value'),
+    'clean_job_data': ('clean_job_data',),
+    'save_to_excel': ('save_to_excel',)
+}
+
+STAGE_OF = {method: stage for stage, methods in STAGES.items() for method in methods}
+
+logger = logging.getLogger(__name__)
+
+
+class StackSampler:
+    """Wall-clock sampling profiler over every thread, aggregated as collapsed stacks
+
+    Unlike cProfile it sees the worker threads, and time spent waiting (on
+    sockets, rate limits, the browser) shows up as well as CPU.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self.stage_samples = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                names = []
+                stage = None
+                while frame is not None:
+                    code = frame.f_code
+                    if stage is None:
+                        # Innermost stage wins, so parse_html isn't counted as get_page_content
+                        stage = STAGE_OF.get(code.co_name)
+                    names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(names))] += 1
+                if stage:
+                    self.stage_samples[stage] += 1
+                self.samples += 1
+
+    def write_folded(self, path):
+        """Collapsed-stack lines ("frame;frame;frame count") for flamegraph.pl, inferno or speedscope"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def stage_seconds(self):
+        return {stage: round(count * self.interval, 3) for stage, count in self.stage_samples.items()}
+
+
+def code_ranges(scraper):
+    """(filename, first line, last line, stage) for each stage method, to place allocation sites"""
+    ranges = []
+    for method, stage in STAGE_OF.items():
+        func = getattr(type(scraper), method, None)
+        if func is None:
+            continue
+        try:
+            lines, first = inspect.getsourcelines(func)
+        except (OSError, TypeError):
+            continue
+        ranges.append((func.__code__.co_filename, first, first + len(lines) - 1, stage))
+    return ranges
+
+
+def slug(label):
+    return re.sub(r'[^A-Za-z0-9]+', '-', label).strip('-')[:60] or 'run'
+
+
+class RunProfiler:
+    """Profiles scrape runs: CPU/wall stacks plus tracemalloc, with time and memory split by stage
+
+    mode is 'sampling' (all threads, writes a .folded flame-graph file) or
+    'cprofile' (the calling thread only, writes .pstats for snakeviz or
+    flameprof). Each session also writes a JSON report of per-stage calls,
+    seconds and retained memory, and the top allocation sites. Stage memory
+    is measured around each call, so with several workers it is approximate.
+    """
+
+    def __init__(self, output_dir='profiles', mode='sampling', interval=0.005, trace_memory=True,
+                 top_allocations=25):
+        if mode not in ('sampling', 'cprofile'):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.output_dir = output_dir
+        self.mode = mode
+        self.interval = interval
+        self.trace_memory = trace_memory
+        self.top_allocations = top_allocations
+        self.last_report = None
+        self._active = False
+        self._lock = threading.Lock()
+        self._stages = {}
+        # Stages the current thread is inside, so nested helpers aren't counted twice
+        self._local = threading.local()
+
+    @contextmanager
+    def session(self, scraper, label):
+        """Profile the with-block; nested sessions on the same profiler just run inside the outer one"""
+        if self._active:
+            yield
+            return
+        self._active = True
+        self._stages = {}
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{slug(label)}-{time.strftime('%Y%m%d-%H%M%S')}")
+
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(25)
+        restore = self._wrap_stages(scraper)
+        sampler = profile = None
+        if self.mode == 'sampling':
+            sampler = StackSampler(self.interval)
+            sampler.start()
+        else:
+            profile = cProfile.Profile()
+            profile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if sampler is not None:
+                sampler.stop()
+                sampler.write_folded(f"{base}.folded")
+            else:
+                profile.disable()
+                profile.dump_stats(f"{base}.pstats")
+            restore()
+            report = self._report(scraper, label, elapsed, sampler)
+            if started_tracing:
+                tracemalloc.stop()
+            with open(f"{base}.json", 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            self.last_report = report
+            self._active = False
+            self._log(report, base)
+
+    def _wrap_stages(self, scraper):
+        """Time and measure every stage method on this scraper instance; returns the undo function"""
+        previous = {}
+        for method in STAGE_OF:
+            if not hasattr(scraper, method):
+                continue
+            previous[method] = scraper.__dict__.get(method)
+            setattr(scraper, method, self._instrument(method, getattr(scraper, method)))
+
+        def restore():
+            for method, original in previous.items():
+                if original is None:
+                    del scraper.__dict__[method]
+                else:
+                    setattr(scraper, method, original)
+        return restore
+
+    def _instrument(self, method, func):
+        stage = STAGE_OF[method]
+
+        def record(start, memory_before):
+            seconds = time.perf_counter() - start
+            grown = tracemalloc.get_traced_memory()[0] - memory_before if memory_before is not None else 0
+            with self._lock:
+                stats = self._stages.setdefault(stage, {'calls': 0, 'seconds': 0.0, 'retained_bytes': 0})
+                stats['calls'] += 1
+                stats['seconds'] += seconds
+                stats['retained_bytes'] += grown
+
+        def memory():
+            return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                start, before = time.perf_counter(), memory()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record(start, before)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                active = self._local.__dict__.setdefault('stages', set())
+                if stage in active:
+                    return func(*args, **kwargs)
+                active.add(stage)
+                start, before = time.perf_counter(), memory()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    record(start, before)
+                    active.discard(stage)
+        return wrapper
+
+    def _report(self, scraper, label, elapsed, sampler):
+        report = {
+            'label': label,
+            'mode': self.mode,
+            'elapsed_seconds': round(elapsed, 3),
+            'stages': {stage: {'calls': stats['calls'], 'seconds': round(stats['seconds'], 4),
+                               'retained_kb': round(stats['retained_bytes'] / 1024, 1)}
+                       for stage, stats in self._stages.items()}
+        }
+        if sampler is not None:
+            report['sampled_stage_seconds'] = sampler.stage_seconds()
+            report['samples'] = sampler.samples
+        if tracemalloc.is_tracing():
+            report['peak_traced_mb'] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+            report['top_allocations'] = self._top_allocations(scraper)
+        return report
+
+    def _top_allocations(self, scraper):
+        """Largest live allocation sites, each tagged with the stage whose code made it (if any)"""
+        ranges = code_ranges(scraper)
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__)
+        ))
+        sites = []
+        for stat in snapshot.statistics('traceback')[:self.top_allocations]:
+            stage = None
+            # Innermost frame first (tracebacks run oldest to newest)
+            for frame in reversed(stat.traceback):
+                stage = next((name for filename, first, last, name in ranges
+                              if frame.filename == filename and first <= frame.lineno <= last), None)
+                if stage:
+                    break
+            top = stat.traceback[-1]
+            sites.append({'site': f"{top.filename}:{top.lineno}", 'kb': round(stat.size / 1024, 1),
+                          'blocks': stat.count, 'stage': stage})
+        return sites
+
+    def _log(self, report, base):
+        breakdown = ', '.join(f"{stage} {stats['seconds']:.2f}s/{stats['calls']}"
+                              for stage, stats in sorted(report['stages'].items(),
+                                                         key=lambda item: -item[1]['seconds']))
+        logger.info(f"Profiled {report['label']} in {report['elapsed_seconds']:.1f}s "
+                    f"({breakdown or 'no stage calls'}); output in {base}.*")
@@ -1,4 +1,5 @@
 from job_scraper import JobScraper
+from job_record import JobRecord
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
@@ -70,17 +71,7 @@ def scrape_hcl_jobs():
 def extract_job_from_element(element, base_url):
     """Extract job data from a job element"""
     try:
-        job_data = {
-            'company_name': 'HCL Technologies',
-            'job_title': 'Not specified',
-            'work_location': 'Not specified',
-            'job_location': 'Not specified',
-            'experience': 'Not specified',
-            'job_description': 'Not specified',
-            'responsibilities': 'Not specified',
-            'qualifications': 'Not specified',
-            'apply_link': base_url
-        }
+        job_data = JobRecord(company_name='HCL Technologies', apply_link=base_url)
         
         # Extract job title
         title_selectors = ['h3', 'h4', '.title', '.job-title', 'a']
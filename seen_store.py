@@ -0,0 +1,113 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+
+# Query parameters that vary per visit without changing the posting
+TRACKING_PARAMS = {'gh_src', 'lever-source', 'source', 'src', 'ref', 'referrer', 'trk', 'sessionid'}
+
+# Fields that make up a posting's content fingerprint
+FINGERPRINT_FIELDS = ('company_name', 'job_title', 'work_location', 'job_location', 'experience',
+                      'job_description', 'responsibilities', 'qualifications')
+
+
+def canonical_url(url):
+    """Normalise an apply URL so the same posting always gets the same key"""
+    parts = urlparse(url.strip())
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not (key.lower() in TRACKING_PARAMS or key.lower().startswith('utm_'))]
+    path = parts.path.rstrip('/') or '/'
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), path, '', urlencode(sorted(query)), ''))
+
+
+def fingerprint(text):
+    """Short stable hash of some text"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def job_fingerprint(job_data):
+    """Content fingerprint of an extracted job, ignoring its URL"""
+    return fingerprint('\x1f'.join(str(job_data.get(field, '')) for field in FINGERPRINT_FIELDS))
+
+
+class SeenStore:
+    """Persistent record of postings seen on earlier crawls, for incremental runs"""
+
+    def __init__(self, path='seen_postings.sqlite', revalidate_after=7 * 86400):
+        self.path = path
+        # Re-fetch unchanged listings now and then to catch edits the listing doesn't show
+        self.revalidate_after = revalidate_after
+        self._lock = threading.Lock()
+        # Batch workers in other processes may share the file
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS postings (
+                url TEXT PRIMARY KEY,
+                career_url TEXT NOT NULL,
+                listing_fp TEXT,
+                content_fp TEXT,
+                job TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                last_fetched REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS postings_career ON postings (career_url)")
+        self._conn.commit()
+
+    def is_unchanged(self, url, listing_fp):
+        """True if url was extracted before from an identical listing entry and is not due a re-check"""
+        if not listing_fp:
+            return False
+        with self._lock:
+            row = self._conn.execute("SELECT listing_fp, last_fetched FROM postings WHERE url = ?",
+                                     (canonical_url(url),)).fetchone()
+        if row is None or row[0] != listing_fp:
+            return False
+        return time.time() - row[1] < self.revalidate_after
+
+    def record(self, career_url, job_data, listing_fp=None):
+        """Store an extracted job; returns 'added', 'changed' or 'unchanged'"""
+        url = canonical_url(job_data['apply_link'])
+        content_fp = job_fingerprint(job_data)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT content_fp, first_seen FROM postings WHERE url = ?",
+                                     (url,)).fetchone()
+            first_seen = row[1] if row else now
+            self._conn.execute(
+                "INSERT OR REPLACE INTO postings VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, career_url, listing_fp, content_fp, json.dumps(dict(job_data)), first_seen, now, now)
+            )
+            self._conn.commit()
+        if row is None:
+            return 'added'
+        return 'unchanged' if row[0] == content_fp else 'changed'
+
+    def mark_seen(self, urls):
+        """Bump last_seen for postings skipped as unchanged"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany("UPDATE postings SET last_seen = ? WHERE url = ?",
+                                   [(now, canonical_url(url)) for url in urls])
+            self._conn.commit()
+
+    def remove_missing(self, career_url, current_urls):
+        """Forget postings of career_url that are no longer listed; returns their stored jobs"""
+        current = {canonical_url(url) for url in current_urls}
+        with self._lock:
+            rows = self._conn.execute("SELECT url, job FROM postings WHERE career_url = ?",
+                                      (career_url,)).fetchall()
+            removed = [(url, job) for url, job in rows if url not in current]
+            self._conn.executemany("DELETE FROM postings WHERE url = ?", [(url,) for url, _ in removed])
+            self._conn.commit()
+        return [json.loads(job) if job else {'apply_link': url} for url, job in removed]
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,301 @@
+import re
+import threading
+import time
+
+from html_parsers import FastElement
+
+
+# How each field of get_default_selectors is extracted
+FIELD_KINDS = {
+    'company_name': 'text',
+    'job_title': 'text',
+    'work_location': 'work_location',
+    'job_location': 'text',
+    'experience': 'experience',
+    'job_description': 'long',
+    'responsibilities': 'long',
+    'qualifications': 'long'
+}
+
+# tag, .class, [attr], [attr=v], [attr*=v], [attr^=v], [attr$=v], [attr~=v] and compounds of them
+SIMPLE_PART = re.compile(r'''
+    (?P<tag>^[a-zA-Z][\w-]*)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[*^$~]?=)\s*(?P<quote>["']?)(?P<value>.*?)(?P=quote))?\s*\]
+''', re.VERBOSE)
+
+
+def compile_simple_selector(selector):
+    """Split a simple selector into (tag, classes, attribute tests), or None if it needs soupsieve"""
+    selector = selector.strip()
+    tag = None
+    classes = []
+    attrs = []
+    pos = 0
+    while pos < len(selector):
+        match = SIMPLE_PART.match(selector, pos)
+        if not match or match.end() == pos:
+            return None
+        if match.group('tag'):
+            tag = match.group('tag').lower()
+        elif match.group('cls'):
+            classes.append(match.group('cls'))
+        else:
+            attrs.append((match.group('attr').lower(), match.group('op'), match.group('value')))
+        pos = match.end()
+    if not (tag or classes or attrs):
+        return None
+    return tag, classes, attrs
+
+
+def mentions_title(selectors):
+    """Whether a field's selectors ask for the <title> fallback (any selector mentioning 'title')"""
+    return any('title' in selector for selector in selectors)
+
+
+def attribute_text(value):
+    """Multi-valued attributes (class, rel) come back as lists from BeautifulSoup"""
+    if isinstance(value, list):
+        return ' '.join(value)
+    return value or ''
+
+
+def matches(element_attrs, classes, attrs):
+    """Full check of a compiled simple selector against an element's attributes"""
+    if classes:
+        element_classes = element_attrs.get('class') or []
+        if isinstance(element_classes, str):
+            element_classes = element_classes.split()
+        if not all(cls in element_classes for cls in classes):
+            return False
+    for name, op, value in attrs:
+        if name not in element_attrs:
+            return False
+        if op is None:
+            continue
+        actual = attribute_text(element_attrs[name])
+        if op == '=' and actual != value:
+            return False
+        if op == '*=' and (not value or value not in actual):
+            return False
+        if op == '^=' and (not value or not actual.startswith(value)):
+            return False
+        if op == '$=' and (not value or not actual.endswith(value)):
+            return False
+        if op == '~=' and value not in actual.split():
+            return False
+    return True
+
+
+class SelectorPlan:
+    """A selector set compiled once, then matched against a document in a single walk"""
+
+    def __init__(self, selectors):
+        self.selectors = {field: list(field_selectors) for field, field_selectors in selectors.items()}
+        self.has_title = {field: mentions_title(field_selectors)
+                          for field, field_selectors in self.selectors.items()}
+        # Simple selectors are indexed by the cheapest thing to look up on an element
+        self.by_tag = {}
+        self.by_class = {}
+        self.by_attr = {}
+        self.complex = set()
+
+        for field, field_selectors in self.selectors.items():
+            for index, selector in enumerate(field_selectors):
+                compiled = compile_simple_selector(selector)
+                if compiled is None:
+                    self.complex.add((field, index))
+                    continue
+                tag, classes, attrs = compiled
+                entry = (field, index, tag, classes, attrs)
+                if tag:
+                    self.by_tag.setdefault(tag, []).append(entry)
+                elif classes:
+                    self.by_class.setdefault(classes[0], []).append(entry)
+                else:
+                    self.by_attr.setdefault(attrs[0][0], []).append(entry)
+
+    def collect(self, soup, fields=None, accept=None):
+        """Walk the DOM once, bucketing candidate elements per field and selector, in document order
+
+        With accept ({field: accept function}), a match for a field's first
+        selector is tested on the spot: the first one accepted is the
+        field's value, since no later element can outrank it. The walk
+        stops once every field is settled that way. Returns (candidates,
+        {field: settled value}).
+        """
+        remaining = set(self.selectors if fields is None else fields)
+        candidates = {field: {} for field in self.selectors}
+        settled = {}
+        if isinstance(soup, FastElement):
+            elements = soup.iter_elements()
+        else:
+            # A generator, so stopping early also skips the rest of the tree
+            elements = (node for node in soup.descendants if node.name is not None)
+
+        for element in elements:
+            element_attrs = element.attrs
+            entries = list(self.by_tag.get(element.name, ()))
+            element_classes = element_attrs.get('class')
+            if element_classes:
+                if isinstance(element_classes, str):
+                    element_classes = element_classes.split()
+                for cls in set(element_classes):
+                    entries.extend(self.by_class.get(cls, ()))
+            for name in element_attrs:
+                entries.extend(self.by_attr.get(name, ()))
+
+            for field, index, tag, classes, attrs in entries:
+                if field not in remaining or (tag and tag != element.name):
+                    continue
+                if not matches(element_attrs, classes, attrs):
+                    continue
+                if index == 0 and accept is not None:
+                    # Rejected elements are dropped too; choose() would only reject them again
+                    value = accept[field](element)
+                    if value:
+                        settled[field] = value
+                        remaining.discard(field)
+                    continue
+                candidates[field].setdefault(index, []).append(element)
+            if accept is not None and not remaining:
+                break
+        return candidates, settled
+
+    def run(self, soup, scraper, timings=None, fields=None):
+        """Extract every field (or only fields); only the candidates needed get their text computed"""
+        if fields is not None:
+            fields = [field for field in self.selectors if field in fields]
+            if not fields:
+                return {}
+        else:
+            fields = list(self.selectors)
+
+        accept = {}
+        spent = dict.fromkeys(fields, 0.0)
+        for field in fields:
+            func = scraper._long_text if FIELD_KINDS.get(field, 'text') == 'long' else scraper._short_text
+            accept[field] = func if timings is None else self._timed(func, field, spent)
+
+        start = time.perf_counter()
+        candidates, settled = self.collect(soup, fields, accept)
+        if timings is not None:
+            # Text checks done during the walk are charged to their fields
+            timings['dom_walk'] = time.perf_counter() - start - sum(spent.values())
+
+        page = {}
+
+        def page_text():
+            # Full-page text is computed at most once per document
+            if 'text' not in page:
+                page['text'] = soup.get_text()
+            return page['text']
+
+        def title_text():
+            title = soup.find('title')
+            return title.get_text(strip=True) if title else None
+
+        def element_lists(field):
+            # Lazily, so complex selectors only run if earlier ones found nothing
+            for index, selector in enumerate(self.selectors[field]):
+                if (field, index) in self.complex:
+                    yield soup.select(selector)
+                else:
+                    yield candidates[field].get(index, ())
+
+        values = {}
+        for field in fields:
+            start = time.perf_counter()
+            if field in settled:
+                values[field] = settled[field]
+            else:
+                values[field] = self.choose(field, element_lists(field), accept[field], scraper,
+                                            title_text, page_text)
+            if timings is not None:
+                timings[field] = time.perf_counter() - start + spent[field]
+        return values
+
+    @staticmethod
+    def _timed(func, field, spent):
+        def timed(element):
+            start = time.perf_counter()
+            try:
+                return func(element)
+            finally:
+                spent[field] += time.perf_counter() - start
+        return timed
+
+    def choose(self, field, candidate_lists, accept, scraper, title_text, page_text):
+        """First accepted candidate in selector order, else the field's title/page-text fallback
+
+        candidate_lists yields one list per selector of whatever accept()
+        takes (elements, or texts when extraction ran in the browser).
+        """
+        for candidates in candidate_lists:
+            for candidate in candidates:
+                value = accept(candidate)
+                if value:
+                    return value
+
+        kind = FIELD_KINDS.get(field, 'text')
+        if kind == 'long':
+            return "Not specified"
+        value = "Not specified"
+        if self.has_title[field]:
+            title = title_text()
+            if title is not None:
+                return title
+        if kind == 'work_location':
+            value = scraper._work_location_from_text(page_text()) or value
+        elif kind == 'experience':
+            value = scraper._experience_from_text(page_text()) or value
+        return value
+
+
+class SelectorRegistry:
+    """Process-wide cache of compiled selector plans, shared by every JobScraper
+
+    Named selector sets can be registered once and then passed by name as
+    custom_selectors; ad-hoc dicts are compiled on first use and reused.
+    """
+
+    def __init__(self):
+        self._named = {}
+        self._plans = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(selectors):
+        """Hashable identity of a selector dict"""
+        return tuple((field, tuple(field_selectors)) for field, field_selectors in selectors.items())
+
+    def register(self, name, selectors):
+        """Compile and store a selector set under name"""
+        plan = self.get_plan(selectors)
+        with self._lock:
+            self._named[name] = plan
+        return plan
+
+    def get_plan(self, selectors):
+        """Return the compiled plan for a selector dict or a registered name"""
+        if isinstance(selectors, str):
+            try:
+                return self._named[selectors]
+            except KeyError:
+                raise KeyError(f"No selector set registered as '{selectors}'") from None
+
+        key = self.key(selectors)
+        plan = self._plans.get(key)
+        if plan is None:
+            with self._lock:
+                plan = self._plans.get(key)
+                if plan is None:
+                    plan = self._plans[key] = SelectorPlan(selectors)
+        return plan
+
+    def names(self):
+        """Registered selector set names"""
+        return sorted(self._named)
+
+
+SELECTOR_REGISTRY = SelectorRegistry()
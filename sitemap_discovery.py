@@ -0,0 +1,167 @@
+import gzip
+import io
+import logging
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin, urlparse
+
+from seen_store import fingerprint
+
+
+# Tried in order when robots.txt doesn't declare any sitemaps
+FALLBACK_SITEMAPS = ('/sitemap.xml', '/sitemap_index.xml')
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+SITEMAP_NAMESPACE = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+
+def sitemap_name(tag):
+    """Tag name if it belongs to the sitemap schema (or has no namespace), else None
+
+    Extensions such as image:loc or video:loc sit inside the same <url>
+    entry and must not replace the posting's own <loc>.
+    """
+    if tag.startswith('{'):
+        namespace, _, name = tag[1:].partition('}')
+        return name if namespace == SITEMAP_NAMESPACE else None
+    return tag
+
+
+def site_of(url):
+    """A URL's host without a leading www.
+
+    The full host is compared because hosted boards and multi-part suffixes
+    (*.myworkdayjobs.com, *.co.uk) put unrelated companies under the same
+    last two labels.
+    """
+    host = (urlparse(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def sitemaps_from_robots(text, base_url):
+    """Sitemap: URLs declared in a robots.txt body"""
+    sitemaps = []
+    for line in text.splitlines():
+        name, _, value = line.partition(':')
+        if name.strip().lower() == 'sitemap' and value.strip():
+            sitemaps.append(urljoin(base_url, value.strip()))
+    return sitemaps
+
+
+def iter_sitemap(body):
+    """Stream ('url' | 'sitemap', loc, lastmod) entries out of a sitemap or sitemap index body"""
+    stream = io.BytesIO(body)
+    if body[:2] == GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=stream)
+
+    root = None
+    loc = lastmod = None
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        if root is None:
+            root = element
+        if event == 'start':
+            continue
+        name = sitemap_name(element.tag)
+        if name == 'loc':
+            loc = (element.text or '').strip()
+        elif name == 'lastmod':
+            lastmod = (element.text or '').strip() or None
+        elif name in ('url', 'sitemap'):
+            if loc:
+                yield name, loc, lastmod
+            loc = lastmod = None
+            # Drop parsed entries so large sitemaps don't build up a whole tree
+            root.clear()
+
+
+class SitemapDiscovery:
+    """Finds job URLs from robots.txt and sitemaps, without rendering the listing page"""
+
+    def __init__(self, scraper, max_sitemaps=50):
+        self.scraper = scraper
+        self.max_sitemaps = max_sitemaps
+        self.links = None
+        self.seen = set()
+        # Sitemap files read
+        self.pages = 0
+        # True when every sitemap was read, so missing postings really were removed
+        self.complete = False
+        self.logger = logging.getLogger(__name__)
+
+    def fetch(self, url):
+        """Body of url, or None if it can't be fetched"""
+        try:
+            return self.scraper.fetch_bytes(url)
+        except Exception as e:
+            self.logger.debug(f"Could not fetch {url}: {e}")
+            return None
+
+    def find_sitemaps(self, career_url):
+        """(sitemaps, guessed): those declared in robots.txt, else the conventional locations"""
+        robots_url = urljoin(career_url, '/robots.txt')
+        body = self.fetch(robots_url)
+        if body:
+            sitemaps = sitemaps_from_robots(body.decode('utf-8', errors='replace'), robots_url)
+            if sitemaps:
+                return sitemaps, False
+        return [urljoin(career_url, path) for path in FALLBACK_SITEMAPS], True
+
+    def discover(self, career_url, listings=None):
+        """Job URLs listed in the site's sitemaps, most recently modified first
+
+        If listings is a dict it gets a fingerprint of each posting's lastmod,
+        so incremental crawls skip postings the sitemap says haven't changed.
+        """
+        site = site_of(career_url)
+        pending, guessed = self.find_sitemaps(career_url)
+        guessed = set(pending) if guessed else set()
+        visited = set()
+        entries = {}
+        self.complete = True
+
+        while pending:
+            sitemap_url = pending.pop(0)
+            if sitemap_url in visited:
+                continue
+            if len(visited) >= self.max_sitemaps:
+                self.logger.warning(f"Stopped after {self.max_sitemaps} sitemaps for {career_url}")
+                self.complete = False
+                break
+            visited.add(sitemap_url)
+
+            body = self.fetch(sitemap_url)
+            if body is None:
+                # Guessed locations that don't exist are expected; declared ones are not
+                if sitemap_url not in guessed:
+                    self.complete = False
+                continue
+            self.pages += 1
+
+            try:
+                for kind, loc, lastmod in iter_sitemap(body):
+                    if kind == 'sitemap':
+                        pending.append(urljoin(sitemap_url, loc))
+                    elif (site_of(loc) == site and self.scraper.is_job_url(loc)
+                          and (loc not in entries or (lastmod or '') > (entries[loc] or ''))):
+                        entries[loc] = lastmod
+            except (ET.ParseError, OSError, EOFError) as e:
+                self.logger.warning(f"Malformed sitemap {sitemap_url}: {e}")
+                self.complete = False
+
+        # W3C datetimes sort lexically; entries without lastmod go last
+        links = sorted(entries, key=lambda loc: entries[loc] or '', reverse=True)
+        if listings is not None:
+            for loc in links:
+                if entries[loc]:
+                    listings.setdefault(loc, fingerprint(entries[loc]))
+
+        self.links = links
+        self.seen = set(links)
+        self.logger.info(f"Found {len(links)} job links in {self.pages} sitemap(s)")
+        return links
+
+    def iter_links(self, career_url, first_soup=None, listings=None, max_links=None):
+        """ListingCrawler-compatible view of discover(), reusing links found by an earlier call"""
+        links = self.links if self.links is not None else self.discover(career_url, listings)
+        if links:
+            yield links[:max_links] if max_links else links
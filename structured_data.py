@@ -0,0 +1,142 @@
+import json
+import logging
+
+from html_parsers import parse_fragment
+from board_adapters import split_sections
+
+
+logger = logging.getLogger(__name__)
+
+# schema.org jobLocationType / workplace hints mapped to work_location values
+LOCATION_TYPES = {'TELECOMMUTE': 'Remote'}
+
+# Microdata itemprops read straight into job fields
+MICRODATA_FIELDS = {
+    'title': 'job_title',
+    'experienceRequirements': 'experience',
+    'responsibilities': 'responsibilities',
+    'qualifications': 'qualifications'
+}
+
+
+def find_job_postings(data):
+    """Yield every JobPosting object in a JSON-LD document (handles @graph and lists)"""
+    if isinstance(data, list):
+        for item in data:
+            yield from find_job_postings(item)
+    elif isinstance(data, dict):
+        types = data.get('@type')
+        types = types if isinstance(types, list) else [types]
+        if 'JobPosting' in types:
+            yield data
+        for key in ('@graph', 'mainEntity', 'itemListElement'):
+            if key in data:
+                yield from find_job_postings(data[key])
+
+
+def text_of(value):
+    """Plain string from a schema.org value that may be a string, object or list"""
+    if isinstance(value, list):
+        return ', '.join(filter(None, (text_of(item) for item in value)))
+    if isinstance(value, dict):
+        return text_of(value.get('name') or value.get('description') or value.get('value'))
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+
+def format_address(location):
+    """'City, Region, Country' from a Place / PostalAddress (or a list of them)"""
+    if isinstance(location, list):
+        return '; '.join(filter(None, (format_address(item) for item in location)))
+    if not isinstance(location, dict):
+        return text_of(location)
+    address = location.get('address', location)
+    if not isinstance(address, dict):
+        return text_of(address)
+    parts = [text_of(address.get(key)) for key in ('addressLocality', 'addressRegion', 'addressCountry')]
+    return ', '.join(part for part in parts if part) or text_of(location.get('name'))
+
+
+def format_experience(value):
+    """experienceRequirements may be prose or an OccupationalExperienceRequirements object"""
+    if isinstance(value, dict) and value.get('monthsOfExperience') is not None:
+        try:
+            years = float(value['monthsOfExperience']) / 12
+        except (TypeError, ValueError):
+            return text_of(value)
+        return f"{years:g}+ years of experience"
+    return text_of(value)
+
+
+def html_to_text(fragment, features):
+    """Text and heading-split sections of an HTML description"""
+    soup = parse_fragment(fragment, features)
+    return soup.get_text(separator='\n', strip=True), split_sections(soup)
+
+
+def map_job_posting(posting, features='html.parser'):
+    """Map a JSON-LD JobPosting onto the job dict fields it can fill"""
+    description, sections = html_to_text(posting.get('description'), features)
+    location_type = text_of(posting.get('jobLocationType'))
+
+    fields = {
+        'company_name': text_of(posting.get('hiringOrganization')),
+        'job_title': text_of(posting.get('title')),
+        'work_location': LOCATION_TYPES.get((location_type or '').upper()),
+        'job_location': format_address(posting.get('jobLocation')),
+        'experience': format_experience(posting.get('experienceRequirements')),
+        'job_description': description or None,
+        'responsibilities': text_of(posting.get('responsibilities')) or sections.get('responsibilities'),
+        'qualifications': (text_of(posting.get('qualifications')) or sections.get('qualifications')
+                           or text_of(posting.get('skills')))
+    }
+    return {field: value for field, value in fields.items() if value}
+
+
+def map_microdata(scope):
+    """Read itemprop values from a JobPosting microdata scope"""
+    def prop(name, within=None):
+        element = (within or scope).select_one(f'[itemprop="{name}"]')
+        if element is None:
+            return None
+        return element.get('content') or element.get_text(' ', strip=True) or None
+
+    fields = {field: prop(name) for name, field in MICRODATA_FIELDS.items()}
+
+    organization = scope.select_one('[itemprop="hiringOrganization"]')
+    if organization is not None:
+        fields['company_name'] = prop('name', organization) or organization.get_text(' ', strip=True)
+
+    location = scope.select_one('[itemprop="jobLocation"]')
+    if location is not None:
+        parts = [prop(name, location) for name in ('addressLocality', 'addressRegion', 'addressCountry')]
+        fields['job_location'] = ', '.join(part for part in parts if part) or location.get_text(' ', strip=True)
+
+    description = scope.select_one('[itemprop="description"]')
+    if description is not None:
+        fields['job_description'] = description.get_text('\n', strip=True)
+
+    return {field: value for field, value in fields.items() if value}
+
+
+def extract_structured_job(soup, features='html.parser'):
+    """Job fields from JSON-LD JobPosting blocks, then microdata; {} if the page has neither"""
+    fields = {}
+    for script in soup.select('script[type="application/ld+json"]'):
+        raw = script.get_text()
+        if 'JobPosting' not in raw:
+            continue
+        try:
+            data = json.loads(raw, strict=False)
+        except ValueError as e:
+            logger.debug(f"Skipping malformed JSON-LD block: {e}")
+            continue
+        for posting in find_job_postings(data):
+            for field, value in map_job_posting(posting, features).items():
+                fields.setdefault(field, value)
+
+    for scope in soup.select('[itemscope][itemtype*="JobPosting"]'):
+        for field, value in map_microdata(scope).items():
+            fields.setdefault(field, value)
+    return fields
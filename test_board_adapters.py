@@ -0,0 +1,154 @@
+"""Offline checks of the job board adapters against recorded API payloads in fixtures/boards"""
+import json
+import os
+
+import requests
+
+from board_adapters import (GreenhouseAdapter, LeverAdapter, WorkdayAdapter, SuccessFactorsAdapter,
+                            detect_board)
+from job_scraper import JobScraper
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'boards')
+
+# (method, URL) the adapters request -> recorded payload
+RECORDED = {
+    ('GET', 'https://boards-api.greenhouse.io/v1/boards/acme'): 'greenhouse_board.json',
+    ('GET', 'https://boards-api.greenhouse.io/v1/boards/acme/jobs?content=true'): 'greenhouse_jobs.json',
+    ('GET', 'https://api.lever.co/v0/postings/acme?mode=json&skip=0&limit=100'): 'lever_postings.json',
+    ('POST', 'https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/jobs'): 'workday_jobs.json',
+    ('GET', 'https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/job/Chennai/Mechanical-Engineer_R10042'):
+        'workday_detail.json',
+    ('GET', 'https://careers.acme.com/services/rss/job/?locale=en_US&keywords=(engineering)'): 'successfactors_feed.xml',
+}
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+class RecordedResponse:
+    def __init__(self, url, status_code, content):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+
+class RecordedSession:
+    """Stands in for the scraper's requests session, answering from RECORDED and 404 otherwise"""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        name = RECORDED.get((method, url))
+        if name is None:
+            return RecordedResponse(url, 404, b'')
+        return RecordedResponse(url, 200, fixture(name))
+
+
+def offline_scraper():
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    scraper.session = RecordedSession()
+    return scraper
+
+
+def test_detect_board_from_url():
+    scraper = offline_scraper()
+    cases = {
+        'https://boards.greenhouse.io/acme': (GreenhouseAdapter, ('acme',)),
+        'https://jobs.lever.co/acme': (LeverAdapter, (None, 'acme')),
+        'https://acme.wd5.myworkdayjobs.com/en-US/External': (WorkdayAdapter, ('acme', 'wd5', 'External')),
+        'https://careers.acme.com/go/Engineering/123456/': (SuccessFactorsAdapter,
+                                                           ('careers.acme.com', 'go/Engineering/123456')),
+    }
+    for url, (adapter_class, key) in cases.items():
+        adapter = detect_board(scraper, url)
+        assert isinstance(adapter, adapter_class), url
+        assert adapter.key == key, url
+    assert detect_board(scraper, 'https://www.acme.com/careers') is None
+    scraper.close()
+
+
+def test_detect_board_from_markup():
+    scraper = offline_scraper()
+    soup = scraper.parse_html(fixture('greenhouse_embed.html'))
+    adapter = detect_board(scraper, 'https://www.acme.com/careers', soup)
+    assert isinstance(adapter, GreenhouseAdapter)
+    assert adapter.key == ('acme',)
+    scraper.close()
+
+
+def test_greenhouse_jobs():
+    scraper = offline_scraper()
+    jobs = detect_board(scraper, 'https://boards.greenhouse.io/acme').fetch_jobs()
+    assert [job['job_title'] for job in jobs] == ['Senior Backend Engineer', 'Field Technician']
+    job = jobs[0]
+    assert job['company_name'] == 'Acme Robotics'
+    assert job['apply_link'] == 'https://boards.greenhouse.io/acme/jobs/4012345'
+    assert job['job_location'] == 'Bengaluru, India'
+    assert 'Design APIs' in job['responsibilities']
+    assert 'Python and PostgreSQL' in job['qualifications']
+    # The escaped HTML content is unescaped and reduced to text
+    assert '<' not in job['job_description'] and 'fleet software' in job['job_description']
+    scraper.close()
+
+
+def test_lever_jobs():
+    scraper = offline_scraper()
+    jobs = detect_board(scraper, 'https://jobs.lever.co/acme').fetch_jobs()
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job['job_title'] == 'Data Analyst'
+    assert job['apply_link'] == 'https://jobs.lever.co/acme/5f1c2e7a-0000-4c1e-9a7e-1b2c3d4e5f60'
+    assert job['job_location'] == 'Hyderabad, India'
+    assert job['work_location'] == 'Hybrid'
+    assert 'Build dashboards' in job['responsibilities']
+    assert 'Statistics' in job['qualifications']
+    scraper.close()
+
+
+def test_workday_jobs():
+    scraper = offline_scraper()
+    jobs = detect_board(scraper, 'https://acme.wd5.myworkdayjobs.com/en-US/External').fetch_jobs()
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job['job_title'] == 'Mechanical Engineer'
+    assert job['company_name'] == 'Acme Robotics'
+    assert job['apply_link'] == ('https://acme.wd5.myworkdayjobs.com/External/job/Chennai/'
+                                 'Mechanical-Engineer_R10042')
+    assert job['job_location'] == 'Chennai, Tamil Nadu'
+    assert job['work_location'] == 'On-site'
+    assert 'CAD' in job['qualifications']
+    assert ('POST', 'https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/jobs') in scraper.session.requests
+    scraper.close()
+
+
+def test_successfactors_feed_jobs():
+    scraper = offline_scraper()
+    career_url = 'https://careers.acme.com/go/Engineering/123456/'
+    soup = scraper.parse_html(fixture('successfactors_listing.html'))
+    jobs = detect_board(scraper, career_url, soup).fetch_jobs()
+    assert [job['job_title'] for job in jobs] == ['Controls Engineer', 'Quality Inspector']
+    job = jobs[0]
+    assert job['company_name'] == 'Acme'
+    assert job['job_location'] == 'Mumbai, MH, IN, 400001'
+    assert job['apply_link'] == 'https://careers.acme.com/job/Mumbai-Controls-Engineer/901/'
+    assert 'PLC programming' in job['qualifications']
+    scraper.close()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
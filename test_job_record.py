@@ -0,0 +1,95 @@
+"""Checks that JobRecord and JobBatch rows still behave like the per-job dicts they replaced"""
+import json
+import pickle
+
+from job_record import JOB_COLUMNS, JobBatch, JobRecord, JobRow
+
+
+def sample(number=1, **fields):
+    return JobRecord(job_title=f'Engineer {number}', company_name='Acme', job_location='Pune, India',
+                     apply_link=f'https://careers.acme.com/jobs/{number}', **fields)
+
+
+def test_record_defaults_and_dict_behaviour():
+    job = JobRecord(job_title='Engineer')
+    assert job['company_name'] == 'Not specified'
+    assert job['apply_link'] is None
+    assert job.get('job_title') == 'Engineer' and job.job_title == 'Engineer'
+    assert list(job) == list(JOB_COLUMNS) and len(job) == len(JOB_COLUMNS)
+    assert dict(job) == job.to_dict()
+    assert job == dict(job)
+
+
+def test_low_cardinality_fields_are_interned():
+    first, second = sample(1), sample(2)
+    assert first['company_name'] is second['company_name']
+    assert first['job_location'] is second['job_location']
+
+
+def test_extra_keys_copy_and_json():
+    job = sample()
+    job['score'] = 0.9
+    assert job['score'] == 0.9 and 'score' in job and len(job) == len(JOB_COLUMNS) + 1
+    assert json.loads(json.dumps(job.to_dict()))['score'] == 0.9
+
+    copy = job.copy()
+    copy['job_title'] = 'Changed'
+    del copy['score']
+    assert job['job_title'] == 'Engineer 1' and job['score'] == 0.9
+    assert 'score' not in copy
+    try:
+        del copy['job_title']
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("JOB_COLUMNS fields can't be removed")
+
+
+def test_record_survives_pickling():
+    job = sample(tags=['python'])
+    restored = pickle.loads(pickle.dumps(job))
+    assert isinstance(restored, JobRecord) and restored == job
+
+
+def test_batch_rows_are_live_views():
+    batch = JobBatch([sample(1), sample(2)])
+    row = batch[-1]
+    assert isinstance(row, JobRow) and row['job_title'] == 'Engineer 2'
+    batch.append(sample(3))
+    # A row taken with a negative index keeps pointing at the same job
+    assert row['job_title'] == 'Engineer 2'
+    row['job_title'] = 'Senior Engineer 2'
+    row['source'] = 'referral'
+    assert batch[1]['job_title'] == 'Senior Engineer 2'
+    assert batch[1]['source'] == 'referral' and 'source' not in batch[0]
+    assert [job['job_title'] for job in batch[1:]] == ['Senior Engineer 2', 'Engineer 3']
+
+
+def test_batch_columns_and_detached_rows():
+    batch = JobBatch([sample(1), sample(2, note='x')])
+    assert len(batch) == 2
+    assert batch.column('apply_link') == ['https://careers.acme.com/jobs/1', 'https://careers.acme.com/jobs/2']
+    detached = pickle.loads(pickle.dumps(batch[1]))
+    assert isinstance(detached, JobRecord) and detached['note'] == 'x'
+    copy = batch[0].copy()
+    copy['job_title'] = 'Elsewhere'
+    assert batch[0]['job_title'] == 'Engineer 1'
+    batch.clear()
+    assert len(batch) == 0 and list(batch) == []
+
+
+def test_batch_to_dataframe_keeps_column_order():
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        return
+    frame = JobBatch([sample(1), sample(2, note='ignored')]).to_dataframe()
+    assert list(frame.columns) == list(JOB_COLUMNS)
+    assert frame['job_title'].tolist() == ['Engineer 1', 'Engineer 2']
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
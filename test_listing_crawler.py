@@ -0,0 +1,127 @@
+"""Offline checks of listing pagination: URL prediction, next links and when a crawl counts as complete"""
+import requests
+
+from job_scraper import JobScraper
+from listing_crawler import ListingCrawler, predicted_url, url_template
+
+LISTING_URL = 'https://www.acme.com/list?page=1'
+
+
+def listing_page(numbers, next_href=None):
+    anchors = ''.join(f'<a href="/jobs/{n}">Job {n}</a>' for n in numbers)
+    pager = f'<a href="{next_href}">Next</a>' if next_href else ''
+    return f'<html><body><div class="jobs">{anchors}</div>{pager}</body></html>'.encode()
+
+
+def paged_site(pages, linked=True):
+    """pages[i] lists the job numbers on ?page=i+1; each page links the next one when linked"""
+    site = {}
+    for i, numbers in enumerate(pages, 1):
+        has_next = linked and i < len(pages)
+        site[f'https://www.acme.com/list?page={i}'] = listing_page(numbers, f'/list?page={i + 1}' if has_next else None)
+    return site
+
+
+class SiteResponse:
+    def __init__(self, url, status_code, content):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+
+class SiteSession:
+    """Serves a dict of URL -> body and 404 for everything else"""
+
+    def __init__(self, site):
+        self.site = site
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append(url)
+        if url not in self.site:
+            return SiteResponse(url, 404, b'')
+        return SiteResponse(url, 200, self.site[url])
+
+
+def crawl(site, career_url=LISTING_URL, **options):
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    scraper.session = SiteSession(site)
+    crawler = ListingCrawler(scraper, **options)
+    links = [link for batch in crawler.iter_links(career_url) for link in batch]
+    scraper.close()
+    return crawler, links
+
+
+def test_url_template_finds_the_page_number():
+    template = url_template('https://acme.com/jobs?page=2&size=20', 'https://acme.com/jobs?page=3&size=20')
+    assert template is not None
+    assert predicted_url(template, 0) == 'https://acme.com/jobs?page=3&size=20'
+    assert predicted_url(template, 2) == 'https://acme.com/jobs?page=5&size=20'
+    # Offsets step by the page size
+    offsets = url_template('https://acme.com/jobs?start=0', 'https://acme.com/jobs?start=25')
+    assert predicted_url(offsets, 1) == 'https://acme.com/jobs?start=50'
+
+
+def test_url_template_rejects_unpredictable_urls():
+    assert url_template('https://acme.com/jobs?page=2', 'https://acme.com/jobs?page=1') is None
+    assert url_template('https://acme.com/jobs?p=1&s=10', 'https://acme.com/jobs?p=2&s=20') is None
+    assert url_template('https://acme.com/jobs', 'https://acme.com/jobs?cursor=a1b') is None
+
+
+def test_predicted_pages_until_one_is_missing():
+    crawler, links = crawl(paged_site([[1, 2], [3, 4], [5, 6]]))
+    assert links == [f'https://www.acme.com/jobs/{n}' for n in range(1, 7)]
+    # ?page=4 was fetched speculatively and 404'd: the listing simply ended there
+    assert crawler.complete and crawler.failed_url is None
+    assert crawler.pages == 3
+
+
+def test_missing_page_that_was_linked_leaves_the_crawl_incomplete():
+    site = paged_site([[1, 2], [3, 4], [5, 6], [7, 8]])
+    del site['https://www.acme.com/list?page=3']
+    crawler, links = crawl(site)
+    assert links == [f'https://www.acme.com/jobs/{n}' for n in range(1, 5)]
+    assert not crawler.complete
+    assert crawler.failed_url == 'https://www.acme.com/list?page=3'
+
+
+def test_page_without_new_links_ends_the_crawl():
+    crawler, links = crawl(paged_site([[1, 2], [3, 4], [3, 4], [5, 6]]))
+    assert links == [f'https://www.acme.com/jobs/{n}' for n in range(1, 5)]
+    assert crawler.complete
+
+
+def test_unpredictable_next_links_are_followed_one_by_one():
+    site = {
+        'https://www.acme.com/list': listing_page([1], '/list?cursor=abc'),
+        'https://www.acme.com/list?cursor=abc': listing_page([2], '/list?cursor=def'),
+        'https://www.acme.com/list?cursor=def': listing_page([3]),
+    }
+    crawler, links = crawl(site, 'https://www.acme.com/list')
+    assert links == [f'https://www.acme.com/jobs/{n}' for n in (1, 2, 3)]
+    assert crawler.complete and crawler.pages == 3
+
+
+def test_page_limit_leaves_the_crawl_incomplete():
+    crawler, links = crawl(paged_site([[1], [2], [3], [4]]), max_pages=2)
+    assert links == ['https://www.acme.com/jobs/1', 'https://www.acme.com/jobs/2']
+    assert not crawler.complete and crawler.failed_url is None
+
+
+def test_unreachable_listing_is_recorded():
+    crawler, links = crawl({})
+    assert links == []
+    assert not crawler.complete
+    assert crawler.failed_url == LISTING_URL
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
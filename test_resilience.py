@@ -0,0 +1,156 @@
+"""Checks of the retry policy, circuit breaker transitions and AIMD concurrency limits"""
+import time
+
+from resilience import (AdaptiveConcurrency, CircuitBreaker, CircuitOpen, Resilience, RetryPolicy,
+                        TransientError, parse_retry_after)
+
+URL = 'https://careers.acme.com/jobs/1'
+
+
+def expect_open(breaker, url=URL):
+    try:
+        breaker.before(url)
+    except CircuitOpen:
+        return
+    raise AssertionError(f"expected the circuit for {url} to be open")
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.failure(URL)
+        assert breaker.before(URL) is False
+    breaker.failure(URL)
+    expect_open(breaker)
+    # Other hosts are unaffected
+    assert breaker.before('https://jobs.other.com/1') is False
+    assert breaker.open_hosts() == ['careers.acme.com'] and breaker.opened == 1
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.failure(URL)
+    breaker.success(URL)
+    breaker.failure(URL)
+    assert breaker.before(URL) is False
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.failure(URL)
+    expect_open(breaker)
+    time.sleep(0.02)
+    assert breaker.before(URL) is True
+    # Only one probe at a time
+    expect_open(breaker)
+
+    # A failed probe opens the circuit again straight away
+    breaker.failure(URL)
+    expect_open(breaker)
+    time.sleep(0.02)
+    assert breaker.before(URL) is True
+    breaker.success(URL)
+    assert breaker.before(URL) is False and breaker.open_hosts() == []
+
+
+def test_probe_cut_short_does_not_stick_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.failure(URL)
+    time.sleep(0.02)
+    assert breaker.before(URL) is True
+    breaker.end_probe(URL)
+    assert breaker.before(URL) is True
+
+
+def test_call_retries_transient_errors_then_succeeds():
+    resilience = Resilience(RetryPolicy(max_retries=2, base_delay=0), CircuitBreaker(failure_threshold=5))
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise TransientError("503", status=503)
+        return 'ok'
+
+    assert resilience.call(URL, flaky) == 'ok'
+    assert len(attempts) == 3 and resilience.retries == 2
+    assert resilience.breaker.before(URL) is False
+
+
+def test_call_gives_up_and_long_retry_after_opens_the_circuit():
+    resilience = Resilience(RetryPolicy(max_retries=5, base_delay=0, max_delay=10), CircuitBreaker())
+    attempts = []
+
+    def throttled():
+        attempts.append(1)
+        raise TransientError("429", status=429, retry_after=120)
+
+    try:
+        resilience.call(URL, throttled)
+    except TransientError:
+        pass
+    else:
+        raise AssertionError("expected the 429 to be raised")
+    # No blocking retry for a two-minute Retry-After: the host is skipped instead
+    assert len(attempts) == 1
+    expect_open(resilience.breaker)
+
+
+def test_call_local_errors_leave_the_breaker_alone():
+    resilience = Resilience(RetryPolicy(max_retries=3, base_delay=0), CircuitBreaker(failure_threshold=1))
+
+    def no_browser():
+        raise RuntimeError("no driver")
+
+    try:
+        resilience.call(URL, no_browser, transient=(Exception,), local=(RuntimeError,))
+    except RuntimeError:
+        pass
+    assert resilience.retries == 0
+    assert resilience.breaker.before(URL) is False
+
+
+def test_adaptive_concurrency_aimd():
+    concurrency = AdaptiveConcurrency(initial=2, minimum=1, maximum=4, latency_target=1.0)
+    host = 'careers.acme.com'
+    assert concurrency.try_acquire(URL) and concurrency.try_acquire(URL)
+    assert not concurrency.try_acquire(URL)
+
+    # Healthy responses grow the limit additively...
+    concurrency.release(URL, latency=0.1)
+    assert concurrency.limit(host) == 2.5
+    concurrency.release(URL, latency=0.1)
+    for _ in range(20):
+        assert concurrency.try_acquire(URL)
+        concurrency.release(URL, latency=0.1)
+    assert concurrency.limit(host) == 4
+
+    # ...errors halve it, slow responses shrink it gently, and it never drops below the minimum
+    concurrency.try_acquire(URL)
+    concurrency.release(URL, failed=True)
+    assert concurrency.limit(host) == 2
+    concurrency.try_acquire(URL)
+    concurrency.release(URL, latency=5.0)
+    assert abs(concurrency.limit(host) - 1.6) < 1e-9
+    for _ in range(5):
+        concurrency.try_acquire(URL)
+        concurrency.release(URL, failed=True)
+    assert concurrency.limit(host) == 1
+    assert concurrency.limits() == {host: 1.0}
+
+
+def test_retry_policy_and_retry_after():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+    for attempt in range(6):
+        assert 0 <= policy.delay(attempt) <= 4
+    assert policy.delay(0, retry_after=3) >= 3
+    assert parse_retry_after('7') == 7.0
+    assert parse_retry_after('not a date') is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
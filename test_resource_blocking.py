@@ -0,0 +1,84 @@
+"""Checks of the Selenium resource-blocking patterns, matched the way Chrome's Network.setBlockedURLs does"""
+import re
+
+from resource_blocking import TRACKER_DOMAINS, BlockingProfile
+
+
+def blocked(patterns, url):
+    """Chrome treats '*' as the only wildcard in blocked URL patterns"""
+    return any(re.fullmatch('.*'.join(map(re.escape, pattern.split('*'))), url) for pattern in patterns)
+
+
+class RecordingDriver:
+    def __init__(self, cdp=True):
+        self.cdp = cdp
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        if not self.cdp:
+            raise AttributeError("execute_cdp_cmd")
+        self.commands.append((command, params))
+
+
+def test_static_assets_are_blocked():
+    patterns = BlockingProfile().patterns()
+    for url in ('https://cdn.acme.com/logo.png', 'https://cdn.acme.com/hero.jpg?w=1200',
+                'https://careers.acme.com/fonts/inter.woff2#iefix', 'https://careers.acme.com/app.css',
+                'https://media.acme.com/intro.mp4'):
+        assert blocked(patterns, url), url
+
+
+def test_pages_on_lookalike_hosts_are_loaded():
+    patterns = BlockingProfile().patterns()
+    for url in ('https://careers.moveworks.com/jobs', 'https://jobs.iconplc.com/search?q=engineer',
+                'https://careers.acme.com/jobs/123', 'https://careers.acme.com/app.js',
+                'https://careers.acme.com/jobs?sort=css'):
+        assert not blocked(patterns, url), url
+
+
+def test_tracker_domains_and_subdomains():
+    patterns = BlockingProfile().patterns()
+    assert 'google-analytics.com' in TRACKER_DOMAINS
+    assert blocked(patterns, 'https://google-analytics.com/collect?v=1')
+    assert blocked(patterns, 'https://www.google-analytics.com/analytics.js')
+    assert blocked(patterns, 'https://static.hotjar.com/c/hotjar-1.js?sv=6')
+    assert not blocked(patterns, 'https://notgoogle-analytics.com/page')
+
+
+def test_block_types_and_deny_domains_are_configurable():
+    patterns = BlockingProfile(block_types=('font',), deny_domains=('chat.widget.io',)).patterns()
+    assert blocked(patterns, 'https://careers.acme.com/a.woff')
+    assert not blocked(patterns, 'https://cdn.acme.com/logo.png')
+    assert not blocked(patterns, 'https://www.google-analytics.com/analytics.js')
+    assert blocked(patterns, 'https://eu.chat.widget.io/loader.js')
+    try:
+        BlockingProfile(block_types=('images',))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown block types should raise ValueError")
+
+
+def test_apply_skips_allowed_sites_and_repeats():
+    profile = BlockingProfile(allow_sites=('needs-css.com',))
+    driver = RecordingDriver()
+    profile.apply(driver, 'https://careers.acme.com/jobs')
+    profile.apply(driver, 'https://careers.acme.com/jobs/2')
+    assert [command for command, _ in driver.commands] == ['Network.enable', 'Network.setBlockedURLs']
+    assert driver.commands[1][1]['urls'] == profile.patterns()
+
+    profile.apply(driver, 'https://jobs.needs-css.com/open')
+    assert driver.commands[-1] == ('Network.setBlockedURLs', {'urls': []})
+
+
+def test_apply_without_cdp_loads_pages_in_full():
+    driver = RecordingDriver(cdp=False)
+    BlockingProfile().apply(driver, 'https://careers.acme.com/jobs')
+    assert driver.commands == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,119 @@
+"""Offline checks of the response cache: fresh hits, 304 revalidation, offline mode and eviction"""
+import os
+import tempfile
+
+import requests
+
+from job_scraper import JobScraper
+from response_cache import CacheMiss, ResponseCache
+
+URL = 'https://careers.acme.com/jobs/1'
+
+
+class RevalidatingResponse:
+    def __init__(self, url, status_code, content=b'', headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+
+class RevalidatingSession:
+    """Serves one page with an ETag, answering 304 when the client already has that version"""
+
+    def __init__(self, body=b'<html><h1>Engineer</h1></html>', etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+        if headers.get('If-None-Match') == self.etag:
+            return RevalidatingResponse(url, 304)
+        return RevalidatingResponse(url, 200, self.body, {'ETag': self.etag})
+
+
+def cached_scraper(directory, ttl):
+    cache = ResponseCache(os.path.join(directory, 'cache.sqlite'), ttl=ttl)
+    scraper = JobScraper(requests_per_second=0, metrics=False, cache=cache)
+    scraper.session = RevalidatingSession()
+    return scraper, cache
+
+
+def test_fresh_entry_skips_the_network():
+    with tempfile.TemporaryDirectory() as directory:
+        scraper, cache = cached_scraper(directory, ttl=3600)
+        first = scraper.fetch_bytes(URL)
+        second = scraper.fetch_bytes(URL)
+        assert first == second == scraper.session.body
+        assert len(scraper.session.requests) == 1
+        assert cache.stats()['hits'] == 1
+        scraper.close()
+        cache.close()
+
+
+def test_stale_entry_is_revalidated_with_304():
+    with tempfile.TemporaryDirectory() as directory:
+        scraper, cache = cached_scraper(directory, ttl=0)
+        body = scraper.fetch_bytes(URL)
+        assert scraper.fetch_bytes(URL) == body
+        # The second request carried the stored validator and got an empty 304 back
+        assert scraper.session.requests[0] == {}
+        assert scraper.session.requests[1] == {'If-None-Match': '"v1"'}
+        assert cache.stats()['revalidated'] == 1
+        scraper.close()
+        cache.close()
+
+
+def test_changed_page_replaces_the_entry():
+    with tempfile.TemporaryDirectory() as directory:
+        scraper, cache = cached_scraper(directory, ttl=0)
+        scraper.fetch_bytes(URL)
+        scraper.session.body, scraper.session.etag = b'<html><h1>Senior Engineer</h1></html>', '"v2"'
+        assert scraper.fetch_bytes(URL) == b'<html><h1>Senior Engineer</h1></html>'
+        assert cache.get(URL)['etag'] == '"v2"'
+        scraper.close()
+        cache.close()
+
+
+def test_offline_mode_serves_stale_entries_and_raises_on_misses():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cache.sqlite')
+        cache = ResponseCache(path, ttl=0)
+        cache.store(URL, b'recorded')
+        cache.close()
+
+        offline = ResponseCache(path, ttl=0, offline=True)
+        assert offline.lookup(URL) == b'recorded'
+        try:
+            offline.lookup('https://careers.acme.com/jobs/2')
+        except CacheMiss:
+            pass
+        else:
+            raise AssertionError("expected CacheMiss for an unrecorded URL")
+        offline.close()
+
+
+def test_least_recently_used_entries_are_evicted():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(os.path.join(directory, 'cache.sqlite'), max_bytes=25)
+        cache.store('a', b'x' * 10)
+        cache.store('b', b'x' * 10)
+        cache.get('a')
+        cache.store('c', b'x' * 10)
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('c') is not None
+        assert cache.stats()['bytes'] == 20
+        cache.close()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
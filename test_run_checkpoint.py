@@ -0,0 +1,138 @@
+"""Offline checks of checkpointed runs: saved links and pages, and resuming after an interruption"""
+import os
+import tempfile
+
+import requests
+
+from job_scraper import JobScraper
+from run_checkpoint import RunCheckpoint
+
+PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+CAREER_URL = 'https://www.acme.com/list'
+JOB_URLS = [f'https://www.acme.com/jobs/{n}' for n in (1, 2, 3)]
+
+
+def detail_page():
+    with open(os.path.join(PAGES, 'detail_static.html'), 'rb') as f:
+        return f.read()
+
+
+class SiteResponse:
+    def __init__(self, url, status_code, content):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+
+class InterruptedSession:
+    """A listing of three jobs whose detail pages load, except interrupt_at (Ctrl-C) and missing (404)"""
+
+    def __init__(self, interrupt_at=None, missing=()):
+        self.interrupt_at = interrupt_at
+        self.missing = set(missing)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append(url)
+        if url == self.interrupt_at:
+            raise KeyboardInterrupt
+        if url == CAREER_URL:
+            anchors = ''.join(f'<a href="{job_url}">Job</a>' for job_url in JOB_URLS)
+            return SiteResponse(url, 200, f'<html><body>{anchors}</body></html>'.encode())
+        if url in JOB_URLS and url not in self.missing:
+            return SiteResponse(url, 200, detail_page())
+        return SiteResponse(url, 404, b'')
+
+
+def checkpointed_scraper(checkpoint, session):
+    scraper = JobScraper(requests_per_second=0, metrics=False, checkpoint=checkpoint)
+    scraper.session = session
+    return scraper
+
+
+def test_saved_state_round_trip():
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint = RunCheckpoint(os.path.join(directory, 'checkpoint.sqlite'))
+        checkpoint.start(CAREER_URL)
+        checkpoint.add_links(CAREER_URL, JOB_URLS[:2], {JOB_URLS[0]: 'fp1'})
+        checkpoint.add_links(CAREER_URL, JOB_URLS[1:])
+        checkpoint.links_found(CAREER_URL, listing_complete=True)
+        checkpoint.record(CAREER_URL, JOB_URLS[0], {'job_title': 'Engineer', 'apply_link': JOB_URLS[0]})
+        checkpoint.record(CAREER_URL, JOB_URLS[1], None)
+
+        assert checkpoint.saved_links(CAREER_URL) == (JOB_URLS, {JOB_URLS[0]: 'fp1'}, True, True)
+        done = checkpoint.completed(CAREER_URL)
+        # Pages that yielded nothing aren't saved, so a resumed run retries them
+        assert list(done) == [JOB_URLS[0]] and done[JOB_URLS[0]]['job_title'] == 'Engineer'
+
+        # Starting again without resume forgets the earlier run
+        checkpoint.start(CAREER_URL)
+        assert checkpoint.saved_links(CAREER_URL) == ([], {}, False, False)
+        checkpoint.close()
+
+
+def test_resume_skips_finished_pages():
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint = RunCheckpoint(os.path.join(directory, 'checkpoint.sqlite'))
+        scraper = checkpointed_scraper(checkpoint, InterruptedSession(interrupt_at=JOB_URLS[2]))
+        try:
+            scraper.scrape_jobs(CAREER_URL)
+        except KeyboardInterrupt:
+            pass
+        else:
+            raise AssertionError("the first run should have been interrupted")
+        assert set(checkpoint.completed(CAREER_URL)) == set(JOB_URLS[:2])
+
+        session = InterruptedSession()
+        scraper.session = session
+        jobs = scraper.scrape_jobs(CAREER_URL, resume=True)
+        assert [job['apply_link'] for job in jobs] == JOB_URLS
+        assert not any(url in session.requests for url in JOB_URLS[:2])
+        assert JOB_URLS[2] in session.requests
+        # A finished run clears its state
+        assert checkpoint.saved_links(CAREER_URL) == ([], {}, False, False)
+        scraper.close()
+        checkpoint.close()
+
+
+def test_resume_retries_pages_that_failed():
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint = RunCheckpoint(os.path.join(directory, 'checkpoint.sqlite'))
+        scraper = checkpointed_scraper(checkpoint, InterruptedSession(interrupt_at=JOB_URLS[2],
+                                                                      missing=[JOB_URLS[1]]))
+        try:
+            scraper.scrape_jobs(CAREER_URL)
+        except KeyboardInterrupt:
+            pass
+        assert list(checkpoint.completed(CAREER_URL)) == [JOB_URLS[0]]
+
+        session = InterruptedSession()
+        scraper.session = session
+        jobs = scraper.scrape_jobs(CAREER_URL, resume=True)
+        assert [job['apply_link'] for job in jobs] == JOB_URLS
+        assert JOB_URLS[1] in session.requests and JOB_URLS[0] not in session.requests
+        scraper.close()
+        checkpoint.close()
+
+
+def test_resume_needs_a_checkpoint():
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    try:
+        scraper.scrape_jobs(CAREER_URL, resume=True)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("resume=True without a checkpoint should raise ValueError")
+    scraper.close()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
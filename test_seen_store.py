@@ -0,0 +1,96 @@
+"""Offline checks of incremental crawls: the seen store and the added/changed/removed delta"""
+import os
+import tempfile
+
+from job_record import JobRecord
+from job_scraper import JobScraper
+from seen_store import SeenStore, canonical_url
+
+CAREER_URL = 'https://careers.acme.com/jobs'
+
+
+def job(number, title='Engineer'):
+    return JobRecord(job_title=title, company_name='Acme',
+                     apply_link=f'https://careers.acme.com/jobs/{number}')
+
+
+def incremental_scraper(directory):
+    store = SeenStore(os.path.join(directory, 'seen.sqlite'))
+    return JobScraper(requests_per_second=0, metrics=False, seen_store=store), store
+
+
+def test_canonical_url_drops_tracking_parameters():
+    assert (canonical_url('HTTPS://Careers.Acme.com/jobs/1/?utm_source=x&gh_src=y&id=7#apply')
+            == 'https://careers.acme.com/jobs/1?id=7')
+
+
+def test_record_reports_added_changed_and_unchanged():
+    with tempfile.TemporaryDirectory() as directory:
+        store = SeenStore(os.path.join(directory, 'seen.sqlite'))
+        assert store.record(CAREER_URL, job(1)) == 'added'
+        assert store.record(CAREER_URL, job(1)) == 'unchanged'
+        assert store.record(CAREER_URL, job(1, 'Senior Engineer')) == 'changed'
+        store.close()
+
+
+def test_unchanged_listing_entries_are_skipped_until_due():
+    with tempfile.TemporaryDirectory() as directory:
+        store = SeenStore(os.path.join(directory, 'seen.sqlite'))
+        store.record(CAREER_URL, job(1), listing_fp='abc')
+        assert store.is_unchanged('https://careers.acme.com/jobs/1/?utm_medium=email', 'abc')
+        assert not store.is_unchanged('https://careers.acme.com/jobs/1', 'def')
+        assert not store.is_unchanged('https://careers.acme.com/jobs/1', None)
+        store.revalidate_after = 0
+        assert not store.is_unchanged('https://careers.acme.com/jobs/1', 'abc')
+        store.close()
+
+
+def test_delta_across_two_crawls():
+    with tempfile.TemporaryDirectory() as directory:
+        scraper, store = incremental_scraper(directory)
+        first = [job(1), job(2), job(3)]
+        scraper.finish_incremental(CAREER_URL, first, [j['apply_link'] for j in first])
+        assert len(scraper.last_delta['added']) == 3
+
+        # Job 1 is unchanged, job 2 was edited, job 3 is gone and job 4 is new
+        second = [job(1), job(2, 'Staff Engineer'), job(4)]
+        changed = scraper.finish_incremental(CAREER_URL, second, [j['apply_link'] for j in second])
+        delta = scraper.last_delta
+        assert [j['apply_link'] for j in delta['added']] == ['https://careers.acme.com/jobs/4']
+        assert [j['job_title'] for j in delta['changed']] == ['Staff Engineer']
+        assert [j['apply_link'] for j in delta['removed']] == ['https://careers.acme.com/jobs/3']
+        assert delta['unchanged'] == 1
+        assert len(changed) == 2
+        scraper.close()
+        store.close()
+
+
+def test_incomplete_listing_reports_no_removals():
+    with tempfile.TemporaryDirectory() as directory:
+        scraper, store = incremental_scraper(directory)
+        scraper.finish_incremental(CAREER_URL, [job(1), job(2)], [job(1)['apply_link'], job(2)['apply_link']])
+        scraper.finish_incremental(CAREER_URL, [job(1)], [job(1)['apply_link']], listing_complete=False)
+        assert scraper.last_delta['removed'] == []
+        # The next complete crawl catches up
+        scraper.finish_incremental(CAREER_URL, [job(1)], [job(1)['apply_link']])
+        assert [j['apply_link'] for j in scraper.last_delta['removed']] == ['https://careers.acme.com/jobs/2']
+        scraper.close()
+        store.close()
+
+
+def test_complete_empty_listing_removes_everything():
+    with tempfile.TemporaryDirectory() as directory:
+        scraper, store = incremental_scraper(directory)
+        scraper.finish_incremental(CAREER_URL, [job(1)], [job(1)['apply_link']])
+        scraper.last_listing = {'links': [], 'complete': True, 'failed_url': None}
+        scraper.finish_empty_listing(CAREER_URL, {})
+        assert [j['apply_link'] for j in scraper.last_delta['removed']] == ['https://careers.acme.com/jobs/1']
+        scraper.close()
+        store.close()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,106 @@
+"""Offline checks that the compiled selector plan extracts what the per-selector helpers did"""
+import os
+
+from html_parsers import parse_html, resolve_backend
+from job_scraper import JobScraper
+from selector_engine import FIELD_KINDS, SelectorPlan, compile_simple_selector
+
+PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+DETAIL_PAGES = ('detail_static.html', 'detail_jsonld.html', 'detail_sparse.html')
+
+
+def page(name):
+    with open(os.path.join(PAGES, name), 'rb') as f:
+        return f.read()
+
+
+def legacy_extract(scraper, soup, selectors):
+    """What extract_job_data produced before the plan: one soup.select pass per selector"""
+    values = {}
+    for field, field_selectors in selectors.items():
+        kind = FIELD_KINDS.get(field, 'text')
+        if kind == 'long':
+            values[field] = scraper.extract_long_text(soup, field_selectors)
+        elif kind == 'work_location':
+            values[field] = scraper.extract_work_location(soup, field_selectors)
+        elif kind == 'experience':
+            values[field] = scraper.extract_experience(soup, field_selectors)
+        else:
+            values[field] = scraper.extract_text(soup, field_selectors)
+    return values
+
+
+def test_compile_simple_selector():
+    assert compile_simple_selector('h1.job-title') == ('h1', ['job-title'], [])
+    assert compile_simple_selector('[data-testid*="location"]') == (None, [], [('data-testid', '*=', 'location')])
+    assert compile_simple_selector('div.a.b[role]') == ('div', ['a', 'b'], [('role', None, None)])
+    # Descendant and pseudo selectors are left to soupsieve
+    assert compile_simple_selector('.job-header h1') is None
+    assert compile_simple_selector('li:first-child') is None
+
+
+def test_plan_matches_legacy_extraction_on_fixture_pages():
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    selectors = scraper.get_default_selectors()
+    plan = SelectorPlan(selectors)
+    for name in DETAIL_PAGES:
+        soup = parse_html(page(name))
+        assert plan.run(soup, scraper) == legacy_extract(scraper, soup, selectors), name
+    scraper.close()
+
+
+def test_plan_matches_legacy_extraction_on_every_backend():
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    selectors = scraper.get_default_selectors()
+    plan = SelectorPlan(selectors)
+    for name in DETAIL_PAGES:
+        expected = legacy_extract(scraper, parse_html(page(name)), selectors)
+        for backend in ('lxml', 'selectolax'):
+            if resolve_backend(backend) != backend:
+                continue
+            assert plan.run(parse_html(page(name), backend), scraper) == expected, (name, backend)
+    scraper.close()
+
+
+def test_selector_order_wins_over_document_order():
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    html = (b'<html><head><title>Fallback Title</title></head><body>'
+            b'<span class="loc">Pune, India</span><div class="title">Data Engineer</div>'
+            b'<section class="desc"><p>short</p></section></body></html>')
+    plan = SelectorPlan({'job_title': ['.title', 'title'], 'job_location': ['.missing', '.loc'],
+                         'job_description': ['.desc'], 'company_name': ['.nothing']})
+    values = plan.run(parse_html(html), scraper)
+    assert values['job_title'] == 'Data Engineer'
+    assert values['job_location'] == 'Pune, India'
+    # Too short for a description, and no title fallback for selectors that don't mention it
+    assert values['job_description'] == 'Not specified'
+    assert values['company_name'] == 'Not specified'
+    scraper.close()
+
+
+def test_complex_selectors_and_title_fallback():
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    html = (b'<html><head><title>Backend Engineer - Acme</title></head><body>'
+            b'<div class="header"><h2>Platform Engineer</h2></div></body></html>')
+    plan = SelectorPlan({'job_title': ['.header h2'], 'company_name': ['h1.company', 'title']})
+    values = plan.run(parse_html(html), scraper)
+    assert values == {'job_title': 'Platform Engineer', 'company_name': 'Backend Engineer - Acme'}
+    scraper.close()
+
+
+def test_run_only_requested_fields_and_time_them():
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    plan = SelectorPlan(scraper.get_default_selectors())
+    timings = {}
+    values = plan.run(parse_html(page('detail_static.html')), scraper, timings, fields=['job_title'])
+    assert list(values) == ['job_title']
+    assert set(timings) == {'dom_walk', 'job_title'}
+    assert plan.run(parse_html(page('detail_static.html')), scraper, fields=['not_a_field']) == {}
+    scraper.close()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,148 @@
+"""Offline checks of robots.txt and sitemap parsing for job URL discovery"""
+import gzip
+
+import requests
+
+from job_scraper import JobScraper
+from sitemap_discovery import SitemapDiscovery, iter_sitemap, site_of, sitemaps_from_robots
+
+CAREER_URL = 'https://www.acme.com/careers'
+
+ROBOTS = b"""User-agent: *
+Disallow: /admin
+Sitemap: https://www.acme.com/sitemap_index.xml
+"""
+
+SITEMAP_INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://www.acme.com/sitemaps/jobs.xml.gz</loc><lastmod>2024-05-01</lastmod></sitemap>
+  <sitemap><loc>/sitemaps/pages.xml</loc></sitemap>
+</sitemapindex>
+"""
+
+JOBS_SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url>
+    <loc>https://www.acme.com/careers/jobs/101-backend-engineer</loc>
+    <lastmod>2024-04-02</lastmod>
+    <image:image><image:loc>https://cdn.acme.com/team.jpg</image:loc></image:image>
+  </url>
+  <url><loc>https://www.acme.com/careers/jobs/102-data-analyst</loc><lastmod>2024-04-20</lastmod></url>
+  <url><loc>https://www.acme.com/careers/jobs/103-designer</loc></url>
+  <url><loc>https://acme.wd5.myworkdayjobs.com/External/job/104</loc></url>
+</urlset>
+"""
+
+PAGES_SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://www.acme.com/about</loc></url>
+  <url><loc>https://www.acme.com/careers/jobs/102-data-analyst</loc><lastmod>2024-04-01</lastmod></url>
+</urlset>
+"""
+
+SITE = {
+    'https://www.acme.com/robots.txt': ROBOTS,
+    'https://www.acme.com/sitemap_index.xml': SITEMAP_INDEX,
+    'https://www.acme.com/sitemaps/jobs.xml.gz': gzip.compress(JOBS_SITEMAP),
+    'https://www.acme.com/sitemaps/pages.xml': PAGES_SITEMAP,
+}
+
+
+class SiteResponse:
+    def __init__(self, url, status_code, content):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+
+class SiteSession:
+    """Serves a dict of URL -> body and 404 for everything else"""
+
+    def __init__(self, site):
+        self.site = site
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append(url)
+        if url not in self.site:
+            return SiteResponse(url, 404, b'')
+        return SiteResponse(url, 200, self.site[url])
+
+
+def offline_scraper(site):
+    scraper = JobScraper(requests_per_second=0, metrics=False)
+    scraper.session = SiteSession(site)
+    return scraper
+
+
+def test_robots_sitemap_lines():
+    robots = "User-agent: *\nSITEMAP: /sitemap.xml\nSitemap: https://cdn.acme.com/jobs.xml\nAllow: /\n"
+    assert sitemaps_from_robots(robots, 'https://www.acme.com/robots.txt') == [
+        'https://www.acme.com/sitemap.xml', 'https://cdn.acme.com/jobs.xml']
+
+
+def test_iter_sitemap_ignores_extension_locs():
+    entries = list(iter_sitemap(JOBS_SITEMAP))
+    assert entries[0] == ('url', 'https://www.acme.com/careers/jobs/101-backend-engineer', '2024-04-02')
+    assert 'https://cdn.acme.com/team.jpg' not in [loc for _, loc, _ in entries]
+    assert entries[2] == ('url', 'https://www.acme.com/careers/jobs/103-designer', None)
+
+
+def test_iter_sitemap_reads_indexes_and_gzip():
+    assert list(iter_sitemap(SITEMAP_INDEX)) == [
+        ('sitemap', 'https://www.acme.com/sitemaps/jobs.xml.gz', '2024-05-01'),
+        ('sitemap', '/sitemaps/pages.xml', None)]
+    assert list(iter_sitemap(gzip.compress(JOBS_SITEMAP))) == list(iter_sitemap(JOBS_SITEMAP))
+
+
+def test_site_of_keeps_the_full_host():
+    assert site_of('https://www.acme.com/careers') == site_of('https://acme.com/jobs') == 'acme.com'
+    assert site_of('https://acme.wd5.myworkdayjobs.com/x') != site_of('https://other.wd5.myworkdayjobs.com/x')
+
+
+def test_discover_follows_robots_and_index():
+    scraper = offline_scraper(SITE)
+    discovery = SitemapDiscovery(scraper)
+    listings = {}
+    links = discovery.discover(CAREER_URL, listings)
+    # Newest lastmod first (102's later entry wins), undated last; other hosts are left out
+    assert links == ['https://www.acme.com/careers/jobs/102-data-analyst',
+                     'https://www.acme.com/careers/jobs/101-backend-engineer',
+                     'https://www.acme.com/careers/jobs/103-designer']
+    assert discovery.complete and discovery.pages == 3
+    assert set(listings) == set(links[:2])
+    assert list(discovery.iter_links(CAREER_URL, max_links=1)) == [links[:1]]
+    scraper.close()
+
+
+def test_missing_declared_sitemap_leaves_discovery_incomplete():
+    site = dict(SITE)
+    del site['https://www.acme.com/sitemaps/pages.xml']
+    scraper = offline_scraper(site)
+    discovery = SitemapDiscovery(scraper)
+    assert len(discovery.discover(CAREER_URL)) == 3
+    assert not discovery.complete
+    scraper.close()
+
+
+def test_guessed_sitemaps_may_be_missing():
+    site = {'https://www.acme.com/sitemap.xml': JOBS_SITEMAP}
+    scraper = offline_scraper(site)
+    discovery = SitemapDiscovery(scraper)
+    assert len(discovery.discover(CAREER_URL)) == 3
+    # /sitemap_index.xml doesn't exist, which is fine for a location that was only guessed
+    assert discovery.complete
+    scraper.close()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")